@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
+import startup_profile
 import os
 import sys
 import json
-import time
+import importlib
+import subprocess
 import colorama
 from colorama import Fore, Back, Style
 
+from games import catalog
+from games import terminal
+
+startup_profile.mark("console imports")
+
 # Initialize colorama for cross-platform color support
 colorama.init()
 
@@ -13,15 +20,17 @@ class GameConsole:
     def __init__(self):
         self.games = []
         self.load_games()
+        startup_profile.mark("load catalog")
         self.running = True
         self.interface_mode = None  # Will be set to "terminal" or "gui"
+        self.status = None  # Message shown the next time the menu is drawn
         self.clear_screen()
         
     def load_games(self):
         """Load the list of games from the catalog file."""
         try:
-            with open('games/catalog.json', 'r') as f:
-                self.games = json.load(f)
+            # The cached index already knows each game's modules, so nothing is imported here
+            self.games = catalog.load_games()
         except FileNotFoundError:
             print(f"{Fore.RED}Game catalog not found. Creating a new one.{Style.RESET_ALL}")
             # Create the games directory if it doesn't exist
@@ -36,7 +45,7 @@ class GameConsole:
     
     def clear_screen(self):
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        terminal.clear_screen()
     
     def print_header(self):
         """Print the console header."""
@@ -55,19 +64,21 @@ class GameConsole:
     def select_interface(self):
         """Ask the user to select between terminal or GUI interface."""
         # Check if the interface mode was specified as a command-line argument
-        if len(sys.argv) > 1 and sys.argv[1].lower() in ["terminal", "gui"]:
-            self.interface_mode = sys.argv[1].lower()
-            return
+        for arg in sys.argv[1:]:
+            if arg.lower() in ["terminal", "gui"]:
+                self.interface_mode = arg.lower()
+                return
 
         while True:
-            self.clear_screen()
-            self.print_header()
-            
-            print(f"{Fore.CYAN}Select your preferred interface:{Style.RESET_ALL}")
-            print()
-            print(f"{Fore.GREEN}1. Terminal{Style.RESET_ALL} - Text-based console interface")
-            print(f"{Fore.GREEN}2. GUI{Style.RESET_ALL} - Graphical user interface")
-            print()
+            with terminal.frame():
+                self.print_header()
+                
+                print(f"{Fore.CYAN}Select your preferred interface:{Style.RESET_ALL}")
+                print()
+                print(f"{Fore.GREEN}1. Terminal{Style.RESET_ALL} - Text-based console interface")
+                print(f"{Fore.GREEN}2. GUI{Style.RESET_ALL} - Graphical user interface")
+                print()
+                self.print_status()
             
             choice = input(f"{Fore.CYAN}Enter your choice (1-2): {Style.RESET_ALL}")
             
@@ -80,8 +91,7 @@ class GameConsole:
                 self.launch_gui_console()
                 sys.exit(0)
             else:
-                print(f"{Fore.RED}Invalid choice. Please enter 1 or 2.{Style.RESET_ALL}")
-                time.sleep(1)
+                self.status = f"{Fore.RED}Invalid choice. Please enter 1 or 2.{Style.RESET_ALL}"
     
     def launch_gui_console(self):
         """Launch the GUI console."""
@@ -95,47 +105,53 @@ class GameConsole:
         except ImportError:
             print(f"{Fore.RED}Could not import tkinter or gui_console. Running as process...{Style.RESET_ALL}")
             # If the direct import fails, run it as a separate process
-            os.system('python gui_console.py')
+            subprocess.run([sys.executable, 'gui_console.py'])
+    
+    def print_status(self):
+        """Print the pending status message, if any, and clear it."""
+        if self.status:
+            print(self.status)
+            self.status = None
     
     def display_menu(self):
         """Display the main menu."""
-        self.clear_screen()
-        self.print_header()
-        
-        # Show current interface mode
-        mode_color = Fore.GREEN if self.interface_mode == "terminal" else Fore.CYAN
-        print(f"Current Mode: {mode_color}{self.interface_mode.upper()}{Style.RESET_ALL}")
-        print()
-        
-        if not self.games:
-            print(f"{Fore.YELLOW}No games available. Please install some games!{Style.RESET_ALL}")
-        else:
-            print(f"{Fore.CYAN}Available Games:{Style.RESET_ALL}")
+        # The whole menu is drawn in one write so it doesn't flicker
+        with terminal.frame():
+            self.print_header()
+            
+            # Show current interface mode
+            mode_color = Fore.GREEN if self.interface_mode == "terminal" else Fore.CYAN
+            print(f"Current Mode: {mode_color}{self.interface_mode.upper()}{Style.RESET_ALL}")
             print()
             
-            for idx, game in enumerate(self.games, 1):
-                print(f"{Fore.GREEN}{idx}.{Style.RESET_ALL} {Fore.WHITE}{game['name']}{Style.RESET_ALL}")
-                print(f"   {Fore.YELLOW}{game['description']}{Style.RESET_ALL}")
+            if not self.games:
+                print(f"{Fore.YELLOW}No games available. Please install some games!{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.CYAN}Available Games:{Style.RESET_ALL}")
                 print()
-        
-        self.print_footer()
+                
+                for idx, game in enumerate(self.games, 1):
+                    print(f"{Fore.GREEN}{idx}.{Style.RESET_ALL} {Fore.WHITE}{game['name']}{Style.RESET_ALL}")
+                    print(f"   {Fore.YELLOW}{game['description']}{Style.RESET_ALL}")
+                    print()
+            
+            self.print_footer()
+            self.print_status()
     
     def run_game(self, game_index):
         """Run a selected game."""
         if 0 <= game_index < len(self.games):
             game = self.games[game_index]
-            game_module = game['module']
             
             self.clear_screen()
             print(f"{Fore.CYAN}Loading {game['name']}...{Style.RESET_ALL}")
-            time.sleep(1)
             
             try:
-                # Check if the game module path contains a dot, indicating a subdirectory
+                # Game modules are only imported once the game is launched
+                startup_profile.reset()
+                
                 if self.interface_mode == "terminal":
-                    game_path = f"games.{game_module}"
-                    __import__(game_path)
-                    game_module_obj = sys.modules[game_path]
+                    game_module_obj = self.import_game_module(game['terminal_module'], game)
                     
                     # Clear screen before starting the game
                     self.clear_screen()
@@ -143,28 +159,21 @@ class GameConsole:
                     # Run the game's main function
                     game_module_obj.main()
                 else:  # GUI mode
-                    # For modules with subdirectories, the GUI version is in the same directory
-                    if '.' in game_module:
-                        base_module = game_module.rsplit('.', 1)[0]
-                        module_name = game_module.rsplit('.', 1)[1]
-                        gui_game_path = f"games.{base_module}.{module_name}_gui"
-                    else:
-                        gui_game_path = f"games.{game_module}_gui"
+                    gui_game_module = None
+                    if game['gui_available']:
+                        try:
+                            gui_game_module = self.import_game_module(game['gui_module'], game)
+                        except ImportError:
+                            pass
                     
-                    try:
-                        __import__(gui_game_path)
-                        gui_game_module = sys.modules[gui_game_path]
-                        
+                    if gui_game_module is not None:
                         # Run the GUI game's main function
                         gui_game_module.main()
-                    except (ImportError, ModuleNotFoundError):
+                    else:
                         # GUI version not found, fall back to terminal
-                        print(f"{Fore.YELLOW}GUI version not available for {game['name']}. Running terminal version...{Style.RESET_ALL}")
-                        time.sleep(2)
+                        self.status = f"{Fore.YELLOW}GUI version not available for {game['name']}. Ran the terminal version.{Style.RESET_ALL}"
                         
-                        game_path = f"games.{game_module}"
-                        __import__(game_path)
-                        game_module_obj = sys.modules[game_path]
+                        game_module_obj = self.import_game_module(game['terminal_module'], game)
                         
                         # Clear screen before starting the game
                         self.clear_screen()
@@ -172,37 +181,45 @@ class GameConsole:
                         # Run the game's main function
                         game_module_obj.main()
             except Exception as e:
-                self.clear_screen()
-                print(f"{Fore.RED}Error loading game: {e}{Style.RESET_ALL}")
-                time.sleep(2)
+                self.status = f"{Fore.RED}Error loading game: {e}{Style.RESET_ALL}"
         else:
-            print(f"{Fore.RED}Invalid game selection.{Style.RESET_ALL}")
-            time.sleep(1)
+            self.status = f"{Fore.RED}Invalid game selection.{Style.RESET_ALL}"
+    
+    def import_game_module(self, module_path, game):
+        """Import a game module, reporting the time it took when profiling."""
+        module = importlib.import_module(module_path)
+        startup_profile.mark(f"import {module_path}")
+        startup_profile.report(f"Launch {game['name']}")
+        return module
     
     def change_interface(self):
         """Change the interface mode between terminal and GUI."""
         if self.interface_mode == "terminal":
             print(f"{Fore.GREEN}Switching to GUI mode...{Style.RESET_ALL}")
-            time.sleep(1)
             self.interface_mode = "gui"
             # Launch the GUI console and exit this one
             self.launch_gui_console()
             sys.exit(0)
         else:
             self.interface_mode = "terminal"
-            print(f"{Fore.GREEN}Interface changed to TERMINAL{Style.RESET_ALL}")
-            time.sleep(1)
+            self.status = f"{Fore.GREEN}Interface changed to TERMINAL{Style.RESET_ALL}"
     
     def run(self):
         """Run the game console."""
         # Only select interface mode if it hasn't been set already
         if self.interface_mode is None:
             self.select_interface()
+            startup_profile.skip()
         
         # If in terminal mode, continue with terminal interface
         if self.interface_mode == "terminal":
+            startup_reported = False
             while self.running:
                 self.display_menu()
+                if not startup_reported:
+                    startup_profile.mark("draw menu")
+                    startup_profile.report(budget_ms=startup_profile.BUDGET_MS)
+                    startup_reported = True
                 
                 choice = input(f"\n{Fore.CYAN}Enter your choice (1-{len(self.games)}), or [I] to change interface: {Style.RESET_ALL}").lower()
                 
@@ -216,20 +233,23 @@ class GameConsole:
                     game_idx = int(choice) - 1
                     self.run_game(game_idx)
                 else:
-                    print(f"{Fore.RED}Invalid choice. Please try again.{Style.RESET_ALL}")
-                    time.sleep(1)
+                    self.status = f"{Fore.RED}Invalid choice. Please try again.{Style.RESET_ALL}"
     
     def shutdown(self):
         """Shutdown the console."""
         self.clear_screen()
         print(f"{Fore.CYAN}Thank you for playing!{Style.RESET_ALL}")
-        time.sleep(1)
 
-if __name__ == "__main__":
+def main(interface_mode=None):
+    """Run the game console, skipping the interface prompt if a mode is given."""
     console = GameConsole()
+    console.interface_mode = interface_mode
     try:
         console.run()
     except KeyboardInterrupt:
         pass
     finally:
-        console.shutdown() 
\ No newline at end of file
+        console.shutdown()
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
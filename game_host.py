@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Warm game-host process for the game console.
+
+Starting a terminal game from the GUI console (or switching to the terminal
+console) used to start a brand new Python interpreter every time, paying for
+interpreter start-up, colorama and the console itself on each launch. The
+GameHost starts one helper process up front that shares the console's
+terminal, imports the common modules once and then waits for launch requests
+over a local pipe. Game modules stay imported after their first launch, so
+later launches only pay for the game itself.
+"""
+
+import os
+import sys
+import time
+import signal
+import importlib
+import threading
+import subprocess
+from multiprocessing.connection import Listener, Client
+
+# Environment variable used to hand the pipe's auth key to the host process
+AUTHKEY_ENV = "GAME_HOST_AUTHKEY"
+
+# Modules every launch needs, imported as soon as the host starts
+WARM_MODULES = ["colorama", "games.catalog", "console"]
+
+# Seconds to wait for the host to connect back, and to exit when asked to
+CONNECT_TIMEOUT = 10.0
+EXIT_TIMEOUT = 2.0
+
+
+class GameHost:
+    """Client side of the warm game-host process."""
+
+    def __init__(self):
+        self.listener = None
+        self.process = None
+        self.conn = None
+        self.connected = threading.Event()
+
+    def start(self):
+        """Start the host process in the background, sharing this terminal.
+
+        Returns False if the host could not be started.
+        """
+        if self.process is not None and self.process.poll() is None:
+            return True
+
+        try:
+            authkey = os.urandom(16)
+            self.listener = Listener(authkey=authkey)
+
+            env = dict(os.environ)
+            env[AUTHKEY_ENV] = authkey.hex()
+            root_dir = os.path.dirname(os.path.abspath(__file__))
+            self.process = subprocess.Popen(
+                [sys.executable, os.path.join(root_dir, "game_host.py"), str(self.listener.address)],
+                cwd=root_dir,
+                env=env
+            )
+        except OSError:
+            self.close()
+            return False
+
+        # Accept in the background, so the console never blocks on a host
+        # that died before connecting
+        self.connected = threading.Event()
+        threading.Thread(target=self.accept, args=(self.listener, self.connected), daemon=True).start()
+        return True
+
+    def accept(self, listener, connected):
+        """Accept the host's connection; runs in a background thread."""
+        try:
+            conn = listener.accept()
+        except (OSError, EOFError):
+            return  # The listener was closed or the handshake failed
+        if connected is self.connected:
+            self.conn = conn
+            connected.set()
+        else:
+            conn.close()  # The host was closed meanwhile
+
+    def connect(self):
+        """Wait for the host process to connect back, if it hasn't already.
+
+        Raises OSError if the host exits or doesn't connect in time.
+        """
+        deadline = time.monotonic() + CONNECT_TIMEOUT
+        while not self.connected.wait(0.1):
+            if self.process is None or self.process.poll() is not None:
+                raise OSError("Game host exited before connecting")
+            if time.monotonic() > deadline:
+                raise OSError("Game host did not connect")
+        return self.conn
+
+    def run(self, module, function="main", *args):
+        """Run module.function(*args) in the host and wait for it to finish.
+
+        Returns (success, message). Raises OSError or EOFError if the host is
+        gone, so callers can fall back to a fresh process.
+        """
+        if self.process is None or self.process.poll() is not None:
+            raise OSError("Game host is not running")
+
+        conn = self.connect()
+
+        # Ctrl+C while the game runs is meant for the game, and must not cut
+        # a message on the pipe in half
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        if in_main_thread:
+            previous = signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            conn.send({"action": "run", "module": module, "function": function, "args": args})
+            return conn.recv()
+        except (OSError, EOFError):
+            self.close()  # The pipe is broken, so later launches use a fresh process
+            raise
+        finally:
+            if in_main_thread:
+                signal.signal(signal.SIGINT, previous)
+
+    def close(self):
+        """Ask the host to exit, release the pipe and wait for the process."""
+        self.connected = threading.Event()  # Any pending accept is now stale
+        if self.conn is not None:
+            try:
+                self.conn.send({"action": "quit"})
+            except OSError:
+                pass
+            self.conn.close()
+            self.conn = None
+
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+
+        if self.process is not None:
+            try:
+                self.process.wait(EXIT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                # Never connected, or stuck: stop it before it writes to the terminal
+                self.process.terminate()
+                try:
+                    self.process.wait(EXIT_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+                    self.process.wait()
+            self.process = None
+
+
+def serve(address, authkey):
+    """Host loop: warm up, then run launch requests until told to quit."""
+    # Import the common modules before the first request comes in
+    for module in WARM_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+    # Ctrl+C in the shared terminal is meant for the game, so it is ignored
+    # between games, where it could cut a message on the pipe in half
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        conn = Client(address, authkey=authkey)
+    except (OSError, EOFError):
+        return  # The console closed before accepting the host
+
+    while True:
+        try:
+            request = conn.recv()
+        except (OSError, EOFError):
+            break  # The console went away
+
+        if request.get("action") == "quit":
+            break
+
+        start = time.perf_counter()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            module = importlib.import_module(request["module"])
+            getattr(module, request["function"])(*request["args"])
+            result = (True, f"Finished in {time.perf_counter() - start:.1f}s")
+        except (SystemExit, KeyboardInterrupt):
+            result = (True, "Game exited")
+        except Exception as e:
+            result = (False, f"Error running game: {e}")
+        finally:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        try:
+            conn.send(result)
+        except OSError:
+            break
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1], bytes.fromhex(os.environ[AUTHKEY_ENV]))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Cached index of the game catalog.
+
+Working out each game's terminal and GUI module paths, and whether a GUI
+version exists, is done once and saved next to the catalog. No game module
+is imported to find out. The index is rebuilt whenever the catalog or one of
+the game directories has a different modification time than the one
+recorded, so a new game or GUI version is picked up on the next start.
+"""
+
+import os
+import json
+
+GAMES_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_PATH = os.path.join(GAMES_DIR, "catalog.json")
+INDEX_PATH = os.path.join(GAMES_DIR, ".catalog_index.json")
+
+# Bump when the layout of the index changes so old files are rebuilt
+INDEX_VERSION = 1
+
+
+def module_paths(module):
+    """Return the terminal and GUI module paths for a catalog module entry."""
+    if '.' in module:
+        # For modules with subdirectories, the GUI version is in the same directory
+        base_module, module_name = module.rsplit('.', 1)
+        gui_module = f"games.{base_module}.{module_name}_gui"
+    else:
+        gui_module = f"games.{module}_gui"
+    return f"games.{module}", gui_module
+
+
+def module_exists(module_path):
+    """Check if a dotted module path has a source file, without importing it."""
+    base = os.path.join(os.path.dirname(GAMES_DIR), *module_path.split('.'))
+    return os.path.isfile(base + ".py") or os.path.isfile(os.path.join(base, "__init__.py"))
+
+
+def watched_paths(games):
+    """Return the paths, relative to the games directory, whose mtimes invalidate the index."""
+    paths = {"catalog.json", "."}
+    for game in games:
+        # The directory holding the game's modules changes when files are added or removed
+        parts = game['module'].split('.')[:-1]
+        paths.add(os.path.join(*parts) if parts else ".")
+    return sorted(paths)
+
+
+def read_mtimes(paths):
+    """Return the modification time of each path, or None for missing paths."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(os.path.join(GAMES_DIR, path)).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def build_index():
+    """Read the catalog and resolve the modules of every game."""
+    with open(CATALOG_PATH, 'r') as f:
+        games = json.load(f)
+
+    for game in games:
+        terminal_module, gui_module = module_paths(game['module'])
+        game['terminal_module'] = terminal_module
+        game['gui_module'] = gui_module
+        game['gui_available'] = module_exists(gui_module)
+
+    return {
+        "version": INDEX_VERSION,
+        "mtimes": read_mtimes(watched_paths(games)),
+        "games": games,
+    }
+
+
+def load_games():
+    """Return the catalog entries with their module paths and GUI availability.
+
+    Raises FileNotFoundError if the catalog does not exist.
+    """
+    try:
+        with open(INDEX_PATH, 'r') as f:
+            index = json.load(f)
+        if index["version"] == INDEX_VERSION and index["mtimes"] == read_mtimes(index["mtimes"]):
+            return index["games"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing or unreadable index, rebuild it
+
+    index = build_index()
+
+    # Write the new index atomically; a read-only install just skips the cache
+    try:
+        temp_path = f"{INDEX_PATH}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(temp_path, INDEX_PATH)
+    except OSError:
+        pass
+
+    return index["games"]
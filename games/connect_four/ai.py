@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Alpha-beta Connect Four bot for the computer opponent.
+
+The bot runs a negamax search with alpha-beta pruning on the engine's
+bitboards, trying the middle columns first since they take part in the most
+lines of four. The search deepens one move at a time until the time limit
+runs out, and keeps the answer of the deepest finished search. A
+transposition table remembers each position's value and best move, so
+positions reached by different move orders are searched once, and the best
+move of the previous iteration is tried first. Positions at the search
+horizon are scored by how many lines of four pass through each player's
+discs; wins score higher the sooner they come.
+"""
+
+import time
+
+from games.connect_four.engine import ROWS, COLS, HEIGHT, playable_cells, winning_spots
+
+# Score of a win, less the number of discs on the board when it happens
+WIN_SCORE = 1000000
+
+# Per-move thinking time, and the choices the games offer
+DEFAULT_TIME_LIMIT = 1.0
+TIME_LIMITS = {
+    "Quick": 0.25,
+    "Normal": 1.0,
+    "Strong": 3.0,
+}
+
+# Columns from the middle outwards
+CENTER_FIRST = sorted(range(COLS), key=lambda col: abs(col - COLS // 2))
+
+# Transposition table bounds
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+def line_weights():
+    """Cells grouped by how many lines of four pass through them, as (weight, bitboard) pairs."""
+    weights = [[0] * ROWS for _ in range(COLS)]
+    for col in range(COLS):
+        for row in range(ROWS):
+            for dc, dr in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                end_col, end_row = col + 3 * dc, row + 3 * dr
+                if 0 <= end_col < COLS and 0 <= end_row < ROWS:
+                    for i in range(4):
+                        weights[col + i * dc][row + i * dr] += 1
+
+    masks = {}
+    for col in range(COLS):
+        for row in range(ROWS):
+            weight = weights[col][row]
+            masks[weight] = masks.get(weight, 0) | 1 << (col * HEIGHT + row)
+    return sorted(masks.items())
+
+
+WEIGHT_MASKS = line_weights()
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time limit runs out."""
+
+
+class ConnectFourBot:
+    """Picks moves for a Connect Four position with a time-limited alpha-beta search."""
+
+    def __init__(self, time_limit=DEFAULT_TIME_LIMIT, max_depth=ROWS * COLS):
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.table = {}
+
+        # Statistics of the last search
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.elapsed = 0.0
+
+    @property
+    def nodes_per_second(self):
+        """Nodes searched per second in the last search."""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    def evaluate(self, own, other):
+        """Score a position for the player owning `own` by the lines through each side's discs."""
+        score = 0
+        for weight, mask in WEIGHT_MASKS:
+            score += weight * (bin(own & mask).count("1") - bin(other & mask).count("1"))
+        return score
+
+    def best_move(self, engine):
+        """Return the best column for the player to move, or None if the game is over."""
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+
+        moves = [col for col in CENTER_FIRST if engine.can_play(col)]
+        if not moves:
+            self.elapsed = time.perf_counter() - start
+            return None
+
+        # Search a copy of the position
+        self.boards = list(engine.boards)
+        self.heights = list(engine.heights)
+        self.current = engine.current
+        self.moves = engine.moves
+
+        if len(moves) == 1:
+            self.elapsed = time.perf_counter() - start
+            return moves[0]
+
+        # Take a win straight away
+        own = self.boards[self.current]
+        wins = winning_spots(own) & playable_cells(self.boards[0] | self.boards[1])
+        for col in moves:
+            if wins >> self.heights[col] & 1:
+                self.score = WIN_SCORE - self.moves - 1
+                self.elapsed = time.perf_counter() - start
+                return col
+
+        # Deepen until time runs out, keeping the answer of the deepest finished search
+        self.table = {}
+        key = own + (self.boards[0] | self.boards[1])
+        best = moves[0]
+        for depth in range(1, min(self.max_depth, ROWS * COLS - self.moves) + 1):
+            try:
+                score = self.negamax(depth, -WIN_SCORE, WIN_SCORE)
+            except SearchTimeout:
+                break
+            best = self.table[key][3]
+            self.depth = depth
+            self.score = score
+            if abs(score) > WIN_SCORE - ROWS * COLS:
+                break  # The game's outcome is known
+
+        self.table = {}
+        self.elapsed = time.perf_counter() - start
+        return best
+
+    def negamax(self, depth, alpha, beta):
+        """Value of the position for the player to move, searched `depth` moves ahead."""
+        self.nodes += 1
+        if not self.nodes & 1023 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        boards = self.boards
+        heights = self.heights
+        player = self.current
+        own = boards[player]
+        filled = boards[0] | boards[1]
+
+        # A move that wins at once is the best there is
+        if winning_spots(own) & playable_cells(filled):
+            return WIN_SCORE - self.moves - 1
+        if self.moves >= ROWS * COLS - 1:
+            return 0  # The last disc fills the board without winning
+        if depth == 0:
+            return self.evaluate(own, boards[player ^ 1])
+
+        # The discs of the player to move plus all discs identify the position
+        key = own + filled
+        original_alpha = alpha
+        entry = self.table.get(key)
+        first = None
+        if entry is not None:
+            entry_depth, bound, value, first = entry
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return value
+                if bound == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        order = CENTER_FIRST if first is None else [first] + [col for col in CENTER_FIRST if col != first]
+        best_value = -WIN_SCORE
+        best_col = None
+        for col in order:
+            height = heights[col]
+            if height >= col * HEIGHT + ROWS:
+                continue
+
+            boards[player] = own | 1 << height
+            heights[col] = height + 1
+            self.current = player ^ 1
+            self.moves += 1
+            value = -self.negamax(depth - 1, -beta, -alpha)
+            boards[player] = own
+            heights[col] = height
+            self.current = player
+            self.moves -= 1
+
+            if value > best_value:
+                best_value = value
+                best_col = col
+            if value > alpha:
+                alpha = value
+                if alpha >= beta:
+                    break
+
+        if best_value <= original_alpha:
+            bound = UPPER
+        elif best_value >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table[key] = (depth, bound, best_value, best_col)
+        return best_value
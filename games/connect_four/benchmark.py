@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Connect Four alpha-beta bot.
+
+The fixed-depth search times the same searches on every run, so its node
+rate can be compared between versions; self-play shows what the bot reaches
+under a time limit.
+
+Run from the repository root:
+    python -m games.connect_four.benchmark [--depth D] [--positions N] [--seed S]
+    python -m games.connect_four.benchmark --games N [--time-limit MS] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from games.connect_four.ai import ConnectFourBot
+from games.connect_four.engine import ConnectFourEngine
+
+
+def random_positions(count, moves, seed):
+    """Return positions reached by a few random moves, with neither player having won."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        engine = ConnectFourEngine()
+        for _ in range(moves):
+            engine.play(rng.choice(engine.valid_moves()))
+        if not engine.game_over:
+            positions.append(engine)
+    return positions
+
+
+def benchmark_depth(depth, positions, seed):
+    """Search each position to a fixed depth.
+
+    Returns the elapsed time and the nodes searched.
+    """
+    bot = ConnectFourBot(time_limit=float("inf"), max_depth=depth)
+    nodes = 0
+
+    start = time.perf_counter()
+    for engine in random_positions(positions, 4, seed):
+        bot.best_move(engine)
+        nodes += bot.nodes
+    elapsed = time.perf_counter() - start
+
+    return elapsed, nodes
+
+
+def benchmark_games(games, time_limit, seed):
+    """Let the bot play itself from random openings.
+
+    Returns the elapsed time, moves made, nodes searched, average depth and
+    the number of games won by the first player, the second and drawn.
+    """
+    bot = ConnectFourBot(time_limit=time_limit)
+    moves = 0
+    nodes = 0
+    depths = 0
+    results = [0, 0, 0]
+
+    start = time.perf_counter()
+    for engine in random_positions(games, 2, seed):
+        while not engine.game_over:
+            engine.play(bot.best_move(engine))
+            moves += 1
+            nodes += bot.nodes
+            depths += bot.depth
+        results[engine.winner - 1 if engine.winner else 2] += 1
+    elapsed = time.perf_counter() - start
+
+    return elapsed, moves, nodes, depths / moves, results
+
+
+def main():
+    """Run the benchmark and print the node rate."""
+    parser = argparse.ArgumentParser(description="Benchmark the Connect Four alpha-beta bot")
+    parser.add_argument("--depth", "-d", type=int, default=10, help="Search depth for the fixed-depth benchmark")
+    parser.add_argument("--positions", "-n", type=int, default=20, help="Positions to search to a fixed depth")
+    parser.add_argument("--games", type=int, default=0, help="Benchmark this many self-play games instead")
+    parser.add_argument("--time-limit", type=float, default=250, help="Bot thinking time per move in milliseconds")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed; the default searches the same positions every run")
+    args = parser.parse_args()
+
+    if args.games:
+        elapsed, moves, nodes, depth, results = benchmark_games(args.games, args.time_limit / 1000, args.seed)
+        print(f"{args.games} games, {moves} moves in {elapsed:.2f}s: {nodes / elapsed:,.0f} nodes searched/s")
+        print(f"{elapsed / moves * 1000:.1f} ms per move, average depth {depth:.1f}")
+        print(f"first player won {results[0]}, second player won {results[1]}, drawn {results[2]}")
+        return
+
+    elapsed, nodes = benchmark_depth(args.depth, args.positions, args.seed)
+    print(f"{args.positions} positions searched to depth {args.depth} in {elapsed:.2f}s")
+    print(f"{nodes:,} nodes: {nodes / elapsed:,.0f} nodes searched/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,18 @@
 #!/usr/bin/env python3
-import os
 import sys
 import time
-import random
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
+from games.connect_four.ai import ConnectFourBot, TIME_LIMITS
+from games.connect_four.engine import ConnectFourEngine, ROWS, COLS
 
 # Initialize colorama for Windows
 colorama.init(autoreset=True)
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -20,17 +21,25 @@ def print_header():
     print(f"{Back.BLUE}{Fore.WHITE}╚═══════════════════════════════════════════════════════════════╝{Style.RESET_ALL}")
     print()
 
-class ConnectFour:
-    def __init__(self):
-        self.ROWS = 6
-        self.COLS = 7
-        self.board = [[' ' for _ in range(self.COLS)] for _ in range(self.ROWS)]
-        self.player1 = f"{Fore.RED}●{Style.RESET_ALL}"
-        self.player2 = f"{Fore.YELLOW}●{Style.RESET_ALL}"
-        self.current_player = self.player1
-        self.current_player_num = 1
-        self.game_over = False
-        self.winner = None
+class ConnectFour(ConnectFourEngine):
+    def __init__(self, time_limit=None):
+        """Start a game; with a time limit, the computer plays Player 2."""
+        super().__init__()
+        self.ROWS = ROWS
+        self.COLS = COLS
+        self.pieces = {
+            0: ' ',
+            1: f"{Fore.RED}●{Style.RESET_ALL}",
+            2: f"{Fore.YELLOW}●{Style.RESET_ALL}",
+        }
+        self.bot = ConnectFourBot(time_limit) if time_limit else None
+        self.last_computer_move = None
+    
+    def player_name(self, player):
+        """Name of player 1 or 2."""
+        if self.bot and player == 2:
+            return "The computer"
+        return f"Player {player}"
     
     def print_board(self):
         """Print the game board."""
@@ -47,7 +56,7 @@ class ConnectFour:
         for row in range(self.ROWS):
             print('║ ', end='')
             for col in range(self.COLS):
-                print(f" {self.board[row][col]} ║", end='')
+                print(f" {self.pieces[self.cell(row, col)]} ║", end='')
             print()
             if row < self.ROWS - 1:
                 print('  ' + '═══' * self.COLS + '═')
@@ -61,108 +70,25 @@ class ConnectFour:
             print(f" {col+1}  ", end='')
         print("\n")
     
-    def is_valid_move(self, col):
-        """Check if a move is valid."""
-        # Check if the column is within range
-        if col < 0 or col >= self.COLS:
-            return False
-        
-        # Check if the top position in the column is empty
-        return self.board[0][col] == ' '
-    
-    def drop_piece(self, col):
-        """Drop a piece into the specified column."""
-        # Find the lowest empty row in the column
-        for row in range(self.ROWS-1, -1, -1):
-            if self.board[row][col] == ' ':
-                self.board[row][col] = self.current_player
-                return row
-        return -1  # Column is full (should not happen with is_valid_move check)
-    
-    def check_win(self, row, col):
-        """Check if the current player has won after placing a piece."""
-        piece = self.current_player
-        
-        # Check horizontal
-        for c in range(max(0, col-3), min(col+1, self.COLS-3)):
-            if (self.board[row][c] == piece and 
-                self.board[row][c+1] == piece and 
-                self.board[row][c+2] == piece and 
-                self.board[row][c+3] == piece):
-                return True
-        
-        # Check vertical
-        for r in range(max(0, row-3), min(row+1, self.ROWS-3)):
-            if (self.board[r][col] == piece and 
-                self.board[r+1][col] == piece and 
-                self.board[r+2][col] == piece and 
-                self.board[r+3][col] == piece):
-                return True
-        
-        # Check diagonal (down-right)
-        for r, c in zip(range(max(0, row-3), min(row+1, self.ROWS-3)), 
-                       range(max(0, col-3), min(col+1, self.COLS-3))):
-            if (self.board[r][c] == piece and 
-                self.board[r+1][c+1] == piece and 
-                self.board[r+2][c+2] == piece and 
-                self.board[r+3][c+3] == piece):
-                return True
-        
-        # Check diagonal (up-right)
-        for r, c in zip(range(min(self.ROWS-1, row+3), max(row, 2), -1), 
-                       range(max(0, col-3), min(col+1, self.COLS-3))):
-            if (self.board[r][c] == piece and 
-                self.board[r-1][c+1] == piece and 
-                self.board[r-2][c+2] == piece and 
-                self.board[r-3][c+3] == piece):
-                return True
-        
-        return False
-    
-    def is_board_full(self):
-        """Check if the board is full."""
-        for col in range(self.COLS):
-            if self.board[0][col] == ' ':
-                return False
-        return True
-    
-    def switch_player(self):
-        """Switch to the other player."""
-        if self.current_player == self.player1:
-            self.current_player = self.player2
-            self.current_player_num = 2
-        else:
-            self.current_player = self.player1
-            self.current_player_num = 1
-    
     def play_turn(self):
         """Play a single turn."""
-        player_name = f"Player {self.current_player_num}"
+        player_name = self.player_name(self.current_player)
+        
+        if self.bot and self.current_player == 2:
+            print(f"{Fore.CYAN}The computer is thinking...{Style.RESET_ALL}")
+            col = self.bot.best_move(self)
+            self.play(col)
+            self.last_computer_move = col
+            return
         
         while True:
             try:
                 col = int(input(f"{player_name}, choose a column (1-{self.COLS}): ")) - 1
                 
-                if not self.is_valid_move(col):
+                # Drop the piece; the engine checks for a win or a draw and passes the turn
+                if self.play(col) is None:
                     print(f"{Fore.RED}Invalid move. Column is either full or out of range.{Style.RESET_ALL}")
                     continue
-                
-                # Drop the piece and get the row where it landed
-                row = self.drop_piece(col)
-                
-                # Check for a win
-                if self.check_win(row, col):
-                    self.game_over = True
-                    self.winner = player_name
-                    return
-                
-                # Check for a draw
-                if self.is_board_full():
-                    self.game_over = True
-                    return
-                
-                # Switch to the other player
-                self.switch_player()
                 return
                 
             except ValueError:
@@ -172,8 +98,10 @@ class ConnectFour:
         """Display the game result."""
         self.print_board()
         
-        if self.winner:
-            print(f"{Fore.GREEN}Congratulations! {self.winner} wins!{Style.RESET_ALL}")
+        if self.bot and self.winner == 2:
+            print(f"{Fore.RED}The computer wins!{Style.RESET_ALL}")
+        elif self.winner:
+            print(f"{Fore.GREEN}Congratulations! {self.player_name(self.winner)} wins!{Style.RESET_ALL}")
         else:
             print(f"{Fore.YELLOW}It's a draw! The board is full.{Style.RESET_ALL}")
     
@@ -183,6 +111,8 @@ class ConnectFour:
             clear_screen()
             print_header()
             self.print_board()
+            if self.last_computer_move is not None:
+                print(f"{Fore.CYAN}The computer played column {self.last_computer_move + 1}.{Style.RESET_ALL}")
             self.play_turn()
         
         # Show final result
@@ -205,8 +135,30 @@ def show_instructions():
     print(f"{Fore.RED}Player 1: Red discs{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Player 2: Yellow discs{Style.RESET_ALL}")
     print()
+    print(f"{Fore.WHITE}You can also play against the computer, which takes Player 2.{Style.RESET_ALL}")
+    print()
     input(f"{Fore.GREEN}Press Enter to start the game...{Style.RESET_ALL}")
 
+def choose_opponent():
+    """Ask who Player 2 is; returns the computer's thinking time, or None for a second player."""
+    levels = list(TIME_LIMITS.items())
+    print(f"{Fore.CYAN}Choose your opponent:{Style.RESET_ALL}")
+    print(f"1. Another player")
+    for i, (name, seconds) in enumerate(levels, 2):
+        print(f"{i}. Computer - {name} ({seconds:g}s per move)")
+    print()
+    
+    while True:
+        try:
+            choice = int(input(f"{Fore.YELLOW}Enter your choice (1-{len(levels) + 1}): {Style.RESET_ALL}"))
+            if choice == 1:
+                return None
+            if 2 <= choice <= len(levels) + 1:
+                return levels[choice - 2][1]
+            print(f"{Fore.RED}Please enter a number between 1 and {len(levels) + 1}.{Style.RESET_ALL}")
+        except ValueError:
+            print(f"{Fore.RED}Please enter a valid number.{Style.RESET_ALL}")
+
 def main():
     """Main game function."""
     clear_screen()
@@ -214,7 +166,10 @@ def main():
     show_instructions()
     
     while True:
-        game = ConnectFour()
+        clear_screen()
+        print_header()
+        time_limit = choose_opponent()
+        game = ConnectFour(time_limit)
         game.play_game()
         
         # Ask to play again
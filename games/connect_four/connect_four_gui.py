@@ -3,6 +3,17 @@ import tkinter as tk
 from tkinter import messagebox, Label, Button, Frame
 import sys
 import os
+import threading
+
+from games.connect_four.ai import ConnectFourBot, TIME_LIMITS, CENTER_FIRST
+from games.connect_four.engine import ConnectFourEngine, ROWS, COLS
+
+# How often to check whether the computer has chosen its move
+SEARCH_POLL_MS = 20
+
+# Opponent choices: a second player, or the computer with its thinking time per move
+OPPONENTS = {"Two players": None}
+OPPONENTS.update((f"Computer - {name}", seconds) for name, seconds in TIME_LIMITS.items())
 
 class ConnectFourGUI:
     def __init__(self, root):
@@ -13,12 +24,15 @@ class ConnectFourGUI:
         self.root.resizable(True, True)  # Allow resizing
         
         # Game parameters
-        self.ROWS = 6
-        self.COLS = 7
+        self.ROWS = ROWS
+        self.COLS = COLS
         self.CELL_SIZE = 60
-        self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
-        self.current_player = 1  # 1 for red, 2 for yellow
-        self.game_over = False
+        self.engine = ConnectFourEngine()  # Player 1 is red, player 2 yellow
+        
+        # Computer opponent, playing yellow when selected
+        self.bot = None
+        self.thinking = False
+        self.game_id = 0  # Changes with every new game, so stale searches are ignored
         
         # Colors
         self.COLORS = {
@@ -132,6 +146,24 @@ class ConnectFourGUI:
         )
         self.new_game_button.pack(side=tk.LEFT, padx=10)
         
+        # Opponent selection
+        self.opponent_var = tk.StringVar(value="Two players")
+        self.opponent_menu = tk.OptionMenu(
+            self.control_frame,
+            self.opponent_var,
+            *OPPONENTS,
+            command=lambda choice: self.change_opponent()
+        )
+        self.opponent_menu.config(
+            font=("Helvetica", 12),
+            bg="#444444",
+            fg="white",
+            activebackground="#555555",
+            activeforeground="white",
+            highlightthickness=0
+        )
+        self.opponent_menu.pack(side=tk.LEFT, padx=10)
+        
         # Quit button
         self.quit_button = Button(
             self.control_frame,
@@ -148,7 +180,7 @@ class ConnectFourGUI:
     
     def key_press(self, event):
         """Handle keyboard input for column selection."""
-        if self.game_over:
+        if self.engine.game_over:
             return
             
         # Check if the key is a number between 1-7
@@ -163,7 +195,7 @@ class ConnectFourGUI:
         """Show the welcome screen."""
         welcome_window = tk.Toplevel(self.root)
         welcome_window.title("Welcome to Connect Four")
-        welcome_window.geometry("450x350")  # Slightly larger
+        welcome_window.geometry("450x380")  # Slightly larger
         welcome_window.configure(bg="#333333")
         welcome_window.transient(self.root)
         welcome_window.grab_set()
@@ -192,6 +224,7 @@ class ConnectFourGUI:
             "",
             "Click the column number buttons to drop your disc.",
             "You can also press keys 1-7 to drop pieces.",
+            "Pick a computer opponent from the menu to play yellow.",
             "",
             "Player 1: Red discs",
             "Player 2: Yellow discs"
@@ -224,117 +257,99 @@ class ConnectFourGUI:
         )
         start_button.pack(pady=20)
     
+    def player_name(self, player):
+        """Name of player 1 or 2."""
+        if self.bot and player == 2:
+            return "Computer"
+        return f"Player {player}"
+    
     def make_move(self, col):
         """Make a move in the selected column."""
-        if self.game_over:
+        # Ignore clicks while it's the computer's turn
+        if self.engine.game_over or self.thinking:
             return
         
-        # Find the first empty row in the selected column (from bottom up)
-        row = -1
-        for r in range(self.ROWS-1, -1, -1):
-            if self.board[r][col] == 0:
-                row = r
-                break
+        if self.drop_disc(col):
+            self.start_computer_move()
+    
+    def drop_disc(self, col):
+        """Drop the current player's disc into a column; returns False if the column is full."""
+        player = self.engine.current_player
+        row = self.engine.play(col)
         
         # If the column is full, ignore the move
-        if row == -1:
-            return
-        
-        # Update the board
-        self.board[row][col] = self.current_player
+        if row is None:
+            return False
         
         # Update the visual representation
         self.canvas.itemconfig(
             self.cells[row][col],
-            fill=self.COLORS[self.current_player]
+            fill=self.COLORS[player]
         )
         
         # Check for a win
-        if self.check_win(row, col):
-            self.game_over = True
-            winner = "Player 1" if self.current_player == 1 else "Player 2"
+        if self.engine.winner:
             self.status_label.config(
-                text=f"{winner} Wins!",
-                fg=self.COLORS[self.current_player]
+                text=f"{self.player_name(player)} Wins!",
+                fg=self.COLORS[player]
             )
             self.highlight_winning_cells()
-            return
+            return True
         
         # Check for a draw
-        if self.is_board_full():
-            self.game_over = True
+        if self.engine.game_over:
             self.status_label.config(text="It's a Draw!", fg="#FFFFFF")
-            return
+            return True
         
-        # Switch to the other player
-        self.current_player = 3 - self.current_player  # Toggle between 1 and 2
-        player_color = "#FF3333" if self.current_player == 1 else "#FFCC33"
+        # The engine has passed the turn to the other player
+        self.show_turn()
+        return True
+    
+    def show_turn(self):
+        """Show whose turn it is."""
+        player = self.engine.current_player
         self.status_label.config(
-            text=f"Player {self.current_player}'s Turn",
-            fg=player_color
+            text=f"{self.player_name(player)}'s Turn",
+            fg=self.COLORS[player]
         )
     
-    def check_win(self, row, col):
-        """Check if the current player has won after placing a piece."""
-        player = self.current_player
-        
-        # Variables to track consecutive pieces in different directions
-        directions = [
-            [(0, 1)],  # Horizontal
-            [(1, 0)],  # Vertical
-            [(1, 1)],  # Diagonal (down-right)
-            [(1, -1)]  # Diagonal (down-left)
-        ]
+    def start_computer_move(self):
+        """If the computer plays next, choose its move in a worker thread."""
+        if self.bot is None or self.engine.game_over or self.engine.current_player != 2:
+            return
         
-        # For each direction, count consecutive pieces
-        for dir_list in directions:
-            count = 1  # Start with the current piece
-            
-            # Store winning cells for highlighting
-            winning_cells = [(row, col)]
-            
-            for dr, dc in dir_list:
-                # Check forward direction
-                r, c = row, col
-                for _ in range(3):  # Need 3 more for a total of 4
-                    r += dr
-                    c += dc
-                    if (0 <= r < self.ROWS and 0 <= c < self.COLS and 
-                            self.board[r][c] == player):
-                        count += 1
-                        winning_cells.append((r, c))
-                    else:
-                        break
-                
-                # Check backward direction (if needed)
-                r, c = row, col
-                for _ in range(3):  # Need 3 more for a total of 4
-                    r -= dr
-                    c -= dc
-                    if (0 <= r < self.ROWS and 0 <= c < self.COLS and 
-                            self.board[r][c] == player):
-                        count += 1
-                        winning_cells.append((r, c))
-                    else:
-                        break
-            
-            # If we have 4 or more in a row, it's a win
-            if count >= 4:
-                self.winning_cells = winning_cells
-                return True
+        self.thinking = True
+        self.status_label.config(text="Computer is thinking...", fg=self.COLORS[2])
+        
+        # Each search gets its own bot, as one left running from an earlier
+        # game would otherwise share its search state
+        bot = ConnectFourBot(self.bot.time_limit)
+        engine = self.engine.copy()
+        result = []
         
-        return False
+        thread = threading.Thread(target=lambda: result.append(bot.best_move(engine)), daemon=True)
+        thread.start()
+        self.root.after(SEARCH_POLL_MS, self.poll_search, thread, result, self.game_id)
     
-    def is_board_full(self):
-        """Check if the board is full."""
-        for col in range(self.COLS):
-            if self.board[0][col] == 0:
-                return False
-        return True
+    def poll_search(self, thread, result, game_id):
+        """Play the computer's move once its search has finished."""
+        if thread.is_alive():
+            self.root.after(SEARCH_POLL_MS, self.poll_search, thread, result, game_id)
+            return
+        
+        if game_id != self.game_id:
+            return  # A new game was started while the computer was thinking
+        self.thinking = False
+        if result and result[0] is not None:
+            col = result[0]
+        else:
+            # The search failed; play the middle-most free column rather than stall
+            col = next(col for col in CENTER_FIRST if self.engine.can_play(col))
+        self.drop_disc(col)
     
     def highlight_winning_cells(self):
         """Highlight the winning cells."""
-        for row, col in self.winning_cells:
+        for row, col in self.engine.winning_cells():
             # Create a pulsating effect by adding a different colored outline
             self.canvas.itemconfig(
                 self.cells[row][col],
@@ -345,9 +360,9 @@ class ConnectFourGUI:
     def new_game(self):
         """Start a new game."""
         # Reset game state
-        self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
-        self.current_player = 1
-        self.game_over = False
+        self.engine.reset()
+        self.thinking = False
+        self.game_id += 1
         
         # Reset visual board
         for row in range(self.ROWS):
@@ -360,7 +375,13 @@ class ConnectFourGUI:
                 )
         
         # Reset status
-        self.status_label.config(text="Player 1's Turn", fg="#FF3333")
+        self.show_turn()
+    
+    def change_opponent(self):
+        """Switch between a second player and the computer, and start a new game."""
+        time_limit = OPPONENTS[self.opponent_var.get()]
+        self.bot = ConnectFourBot(time_limit) if time_limit else None
+        self.new_game()
     
     def quit_game(self):
         """Quit the game."""
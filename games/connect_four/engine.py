@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Headless Connect Four engine shared by the terminal and GUI games.
+
+The position is two bitboards, one per player. Each column takes HEIGHT =
+ROWS + 1 bits, bottom row first, with the extra bit always empty so that
+lines can't run from the top of one column into the bottom of the next.
+Dropping a disc sets the column's lowest empty bit, and four in a row is
+found with two shifts and masks per direction, so a win check costs the
+same whatever the board holds. The cells that would complete a line are
+found the same way, so the AI spots a win one move ahead without trying
+each column. The AI searches on these bitboards directly.
+"""
+
+ROWS = 6
+COLS = 7
+HEIGHT = ROWS + 1
+
+# Bit shifts between neighbouring cells: vertical, horizontal and the two diagonals
+SHIFTS = (1, HEIGHT, HEIGHT - 1, HEIGHT + 1)
+
+# Lowest bit of each column, and all the playable bits of each column
+BOTTOM = [1 << (col * HEIGHT) for col in range(COLS)]
+COLUMN = [((1 << ROWS) - 1) << (col * HEIGHT) for col in range(COLS)]
+BOTTOM_ROW = sum(BOTTOM)
+BOARD = sum(COLUMN)
+
+
+def has_four(bitboard):
+    """Check if a player's bitboard holds four in a row."""
+    for shift in SHIFTS:
+        pairs = bitboard & (bitboard >> shift)
+        if pairs & (pairs >> 2 * shift):
+            return True
+    return False
+
+
+def four_cells(bitboard):
+    """Bits of every line of four in a player's bitboard."""
+    cells = 0
+    for shift in SHIFTS:
+        pairs = bitboard & (bitboard >> shift)
+        starts = pairs & (pairs >> 2 * shift)
+        cells |= starts | starts << shift | starts << 2 * shift | starts << 3 * shift
+    return cells
+
+
+def winning_spots(bitboard):
+    """Bits of the cells that would complete a line of four for a player, filled or not."""
+    # Vertically, only the cell above three discs
+    spots = (bitboard << 1) & (bitboard << 2) & (bitboard << 3)
+    for shift in SHIFTS[1:]:
+        # The cell after or before three discs, or in the gap of three with one missing
+        pairs = (bitboard << shift) & (bitboard << 2 * shift)
+        spots |= pairs & (bitboard << 3 * shift)
+        spots |= pairs & (bitboard >> shift)
+        pairs = (bitboard >> shift) & (bitboard >> 2 * shift)
+        spots |= pairs & (bitboard << shift)
+        spots |= pairs & (bitboard >> 3 * shift)
+    return spots & BOARD
+
+
+def playable_cells(filled):
+    """Bits of the lowest empty cell of each column that isn't full."""
+    return (filled + BOTTOM_ROW) & BOARD
+
+
+def bit_position(bit):
+    """Row (counted from the top, as the games draw it) and column of a single bit."""
+    col, row = divmod(bit.bit_length() - 1, HEIGHT)
+    return ROWS - 1 - row, col
+
+
+class ConnectFourEngine:
+    """Discs, turn and result of one Connect Four game. Player 1 moves first."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Empty the board."""
+        self.boards = [0, 0]  # Bitboards of player 1 and player 2
+        self.heights = [col * HEIGHT for col in range(COLS)]  # Lowest empty bit of each column
+        self.current = 0  # Index of the player to move
+        self.moves = 0
+        self.history = []
+        self.winner = None
+        self.game_over = False
+
+    @property
+    def current_player(self):
+        """Number (1 or 2) of the player to move."""
+        return self.current + 1
+
+    def can_play(self, col):
+        """Check if a disc can be dropped into a column."""
+        return 0 <= col < COLS and not self.game_over and self.heights[col] < col * HEIGHT + ROWS
+
+    def valid_moves(self):
+        """Columns that aren't full, left to right."""
+        return [col for col in range(COLS) if self.can_play(col)]
+
+    def play(self, col):
+        """Drop the current player's disc into a column and pass the turn.
+
+        Returns the row (counted from the top) where the disc landed, or None
+        if the move isn't allowed.
+        """
+        if not self.can_play(col):
+            return None
+
+        bit = 1 << self.heights[col]
+        self.boards[self.current] |= bit
+        self.heights[col] += 1
+        self.moves += 1
+        self.history.append(col)
+
+        if has_four(self.boards[self.current]):
+            self.winner = self.current_player
+            self.game_over = True
+        elif self.moves == ROWS * COLS:
+            self.game_over = True
+        self.current ^= 1
+        return bit_position(bit)[0]
+
+    def copy(self):
+        """Return an independent copy of the game, for searching in another thread."""
+        other = ConnectFourEngine()
+        other.boards = list(self.boards)
+        other.heights = list(self.heights)
+        other.current = self.current
+        other.moves = self.moves
+        other.history = list(self.history)
+        other.winner = self.winner
+        other.game_over = self.game_over
+        return other
+
+    def undo(self):
+        """Take back the last move."""
+        col = self.history.pop()
+        self.current ^= 1
+        self.heights[col] -= 1
+        self.boards[self.current] &= ~(1 << self.heights[col])
+        self.moves -= 1
+        self.winner = None
+        self.game_over = False
+
+    def is_full(self):
+        """Check if the board is full."""
+        return self.moves == ROWS * COLS
+
+    def cell(self, row, col):
+        """Player (1 or 2) with a disc at a cell, row counted from the top, or 0."""
+        bit = 1 << (col * HEIGHT + ROWS - 1 - row)
+        if self.boards[0] & bit:
+            return 1
+        if self.boards[1] & bit:
+            return 2
+        return 0
+
+    def winning_cells(self):
+        """Cells (row, col) of the winner's lines of four, or an empty list."""
+        if self.winner is None:
+            return []
+        cells = four_cells(self.boards[self.winner - 1])
+        positions = []
+        while cells:
+            bit = cells & -cells
+            positions.append(bit_position(bit))
+            cells ^= bit
+        return positions
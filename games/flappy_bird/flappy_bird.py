@@ -1,54 +1,32 @@
 #!/usr/bin/env python3
-import os
 import sys
 import time
 import random
 import colorama
 from colorama import Fore, Back, Style
-
-# Platform-specific imports
-if os.name == 'nt':
-    import msvcrt
-else:
-    import select
-    import tty
-    import termios
+from games import terminal
+from games.game_loop import GameLoop
 
 # Initialize colorama
 colorama.init(autoreset=True)
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
+
+HEADER_STYLE = Back.GREEN + Fore.WHITE
+HEADER = [
+    "╔═══════════════════════════════════════════════════════════════╗",
+    "║                     FLAPPY BIRD                              ║",
+    "╚═══════════════════════════════════════════════════════════════╝",
+]
 
 def print_header():
     """Print the game header."""
-    print(f"{Back.GREEN}{Fore.WHITE}╔═══════════════════════════════════════════════════════════════╗{Style.RESET_ALL}")
-    print(f"{Back.GREEN}{Fore.WHITE}║                     FLAPPY BIRD                              ║{Style.RESET_ALL}")
-    print(f"{Back.GREEN}{Fore.WHITE}╚═══════════════════════════════════════════════════════════════╝{Style.RESET_ALL}")
+    for line in HEADER:
+        print(f"{HEADER_STYLE}{line}{Style.RESET_ALL}")
     print()
 
-def is_key_pressed():
-    """Check if a key has been pressed."""
-    if os.name == 'nt':
-        return msvcrt.kbhit()
-    else:
-        dr, dw, de = select.select([sys.stdin], [], [], 0)
-        return dr != []
-
-def get_key():
-    """Get a single key press."""
-    if os.name == 'nt':
-        return msvcrt.getch().decode('utf-8').lower()
-    else:
-        old_settings = termios.tcgetattr(sys.stdin)
-        try:
-            tty.setcbreak(sys.stdin.fileno())
-            key = sys.stdin.read(1)
-            return key.lower()
-        finally:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-
 class FlappyBird:
     def __init__(self, width=70, height=25):
         """Initialize the Flappy Bird game."""
@@ -135,51 +113,54 @@ class FlappyBird:
         if not self.game_over and not self.paused:
             self.bird_velocity = self.flap_strength
     
-    def draw(self):
-        """Draw the game state."""
-        # Create an empty board
-        board = [[' ' for _ in range(self.width)] for _ in range(self.height)]
+    def screen_size(self):
+        """Return the width and height of the screen the game draws on."""
+        return max(len(HEADER[0]), self.width + 2), len(HEADER) + self.height + 8
+    
+    def draw(self, screen, stats=None):
+        """Draw the header and game state into the screen's back buffer."""
+        screen.clear()
+        for row, line in enumerate(HEADER):
+            screen.text(0, row, line, HEADER_STYLE)
+        
+        # Score
+        top = len(HEADER) + 1
+        screen.text(0, top, f"Score: {self.score}", Fore.YELLOW)
+        
+        # Border
+        top += 1
+        screen.text(0, top, f"╔{'═' * self.width}╗", Fore.CYAN)
+        for y in range(self.height):
+            screen.put(0, top + 1 + y, "║", Fore.CYAN)
+            screen.put(self.width + 1, top + 1 + y, "║", Fore.CYAN)
+        screen.text(0, top + self.height + 1, f"╚{'═' * self.width}╝", Fore.CYAN)
         
-        # Draw pipes
+        # Draw pipes, clipped to the board
         for pipe in self.pipes:
+            start = max(pipe['x'], 0)
+            end = min(pipe['x'] + self.pipe_width, self.width)
+            if start >= end:
+                continue
             for y in range(self.height):
-                if pipe['x'] < self.width:  # Only draw if pipe is on screen
-                    if y < pipe['gap_start'] or y >= pipe['gap_end']:
-                        for x in range(pipe['x'], min(pipe['x'] + self.pipe_width, self.width)):
-                            board[y][x] = '█'
+                if y < pipe['gap_start'] or y >= pipe['gap_end']:
+                    screen.text(1 + start, top + 1 + y, '█' * (end - start), Fore.GREEN)
         
         # Draw bird
         bird_y = int(self.bird_y)
         if 0 <= bird_y < self.height:
-            board[bird_y][self.bird_x] = '>'
-        
-        # Print score
-        print(f"{Fore.YELLOW}Score: {self.score}{Style.RESET_ALL}")
-        
-        # Print the board with a border
-        print(f"{Fore.CYAN}╔{'═' * self.width}╗{Style.RESET_ALL}")
-        
-        for row in board:
-            print(f"{Fore.CYAN}║{Style.RESET_ALL}", end="")
-            for cell in row:
-                if cell == ' ':
-                    print(" ", end="")
-                elif cell == '>':
-                    print(f"{Fore.YELLOW}>{Style.RESET_ALL}", end="")
-                else:
-                    print(f"{Fore.GREEN}{cell}{Style.RESET_ALL}", end="")
-            print(f"{Fore.CYAN}║{Style.RESET_ALL}")
-        
-        print(f"{Fore.CYAN}╚{'═' * self.width}╝{Style.RESET_ALL}")
+            screen.put(1 + self.bird_x, top + 1 + bird_y, '>', Fore.YELLOW)
         
         # Game controls
-        print(f"{Fore.WHITE}Press SPACE to flap, P to pause, Q to quit{Style.RESET_ALL}")
+        bottom = top + self.height + 2
+        screen.text(0, bottom, "Press SPACE to flap, P to pause, Q to quit", Fore.WHITE)
         
         if self.paused:
-            print(f"{Fore.YELLOW}PAUSED - Press P to continue{Style.RESET_ALL}")
+            screen.text(0, bottom + 1, "PAUSED - Press P to continue", Fore.YELLOW)
         
         if self.game_over:
-            print(f"{Fore.RED}GAME OVER - Final Score: {self.score}{Style.RESET_ALL}")
+            screen.text(0, bottom + 2, f"GAME OVER - Final Score: {self.score}", Fore.RED)
+        
+        screen.text(0, bottom + 3, f"FPS: {screen.fps.fps:.1f}  {stats or ''}", Fore.WHITE)
 
 def show_instructions():
     """Display game instructions."""
@@ -233,46 +214,47 @@ def main():
         if choice == 1:  # Easy
             game.pipe_gap = 12
             game.gravity = 0.4
-            frame_time = 0.15  # Seconds per frame
+            tick_time = 0.15  # Seconds per game tick
         elif choice == 2:  # Medium
             game.pipe_gap = 10
             game.gravity = 0.5
-            frame_time = 0.12
+            tick_time = 0.12
         else:  # Hard
             game.pipe_gap = 8
             game.gravity = 0.6
-            frame_time = 0.1
+            tick_time = 0.1
         
         # Re-initialize pipes with new gap size
         game.pipes = []
         game.generate_pipes()
+        screen = terminal.Screen(*game.screen_size())
+        
+        def on_tick(keys):
+            """Apply the keys pressed since the last tick, then advance the game."""
+            for key in keys:
+                if key == 'q':
+                    raise KeyboardInterrupt
+                elif key == ' ':
+                    game.flap()
+                elif key == 'p':
+                    game.paused = not game.paused
+            
+            # Update game state
+            game.update()
+        
+        def render():
+            game.draw(screen, loop.stats)
+            screen.present()
+        
+        loop = GameLoop(tick_time, on_tick, render, lambda: not game.game_over)
         
         # Game loop
         try:
-            while not game.game_over:
-                clear_screen()
-                print_header()
-                game.draw()
-                
-                # Handle input
-                if is_key_pressed():
-                    key = get_key()
-                    if key == 'q':
-                        raise KeyboardInterrupt
-                    elif key == ' ':
-                        game.flap()
-                    elif key == 'p':
-                        game.paused = not game.paused
-                
-                # Update game state
-                game.update()
-                
-                time.sleep(frame_time)
+            loop.run()
             
             # Game over
-            clear_screen()
-            print_header()
-            game.draw()
+            render()
+            screen.close()
             
             print()
             play_again = input(f"{Fore.CYAN}Play again? (y/n): {Style.RESET_ALL}").lower()
@@ -280,6 +262,7 @@ def main():
                 break
         
         except KeyboardInterrupt:
+            screen.close()
             clear_screen()
             print_header()
             print(f"{Fore.GREEN}Game aborted.{Style.RESET_ALL}")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Expectimax 2048 bot for hints and autoplay.
+
+The bot looks ahead over the player's moves (taking the best) and the tile
+spawns after them (averaging over every empty cell, with a 2 nine times in
+ten and a 4 otherwise, as the engine spawns them). Leaf boards are scored by
+a heuristic that rewards empty cells, tiles that can merge and rows and
+columns that increase or decrease monotonically, and penalises large tiles.
+The heuristic is a sum over the board's rows and columns, so it is looked up
+per 16-bit row in a table computed once.
+
+The search deepens one move at a time until the time limit runs out, and
+keeps the answer of the deepest finished search. Boards already scored to
+the same depth come from a transposition cache instead of being searched
+again; spawn branches so unlikely they can't matter are cut off early.
+"""
+
+import time
+
+from games.game_2048.engine import DIRECTIONS, MOVES, transpose
+
+# Heuristic weights per row or column
+LOST_PENALTY = 200000.0
+MONOTONICITY_POWER = 4.0
+MONOTONICITY_WEIGHT = 47.0
+SUM_POWER = 3.5
+SUM_WEIGHT = 11.0
+MERGES_WEIGHT = 700.0
+EMPTY_WEIGHT = 270.0
+
+# Spawn branches less likely than this are scored without searching further
+PROBABILITY_CUTOFF = 0.0001
+
+# Per-move thinking time
+DEFAULT_TIME_LIMIT = 0.2
+
+_row_scores = None
+
+
+def row_score(row):
+    """Heuristic score of one 16-bit row (or column)."""
+    tiles = [row >> (4 * i) & 0xF for i in range(4)]
+
+    empty = tiles.count(0)
+    merges = 0
+    previous = 0
+    counter = 0
+    for tile in tiles:
+        if not tile:
+            continue
+        if tile == previous:
+            counter += 1
+        elif counter > 0:
+            merges += 1 + counter
+            counter = 0
+        previous = tile
+    if counter > 0:
+        merges += 1 + counter
+
+    # Penalise the smaller of the increases and decreases along the row
+    increasing = 0.0
+    decreasing = 0.0
+    for a, b in zip(tiles, tiles[1:]):
+        if a > b:
+            decreasing += a ** MONOTONICITY_POWER - b ** MONOTONICITY_POWER
+        else:
+            increasing += b ** MONOTONICITY_POWER - a ** MONOTONICITY_POWER
+
+    tile_sum = sum(tile ** SUM_POWER for tile in tiles)
+    return (LOST_PENALTY + EMPTY_WEIGHT * empty + MERGES_WEIGHT * merges
+            - MONOTONICITY_WEIGHT * min(increasing, decreasing) - SUM_WEIGHT * tile_sum)
+
+
+def row_scores():
+    """Return the heuristic table for every row, building it on first use."""
+    global _row_scores
+    if _row_scores is None:
+        _row_scores = [row_score(row) for row in range(65536)]
+    return _row_scores
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time limit runs out."""
+
+
+class Game2048Bot:
+    """Picks moves for a 2048 board with a time-limited expectimax search."""
+
+    def __init__(self, time_limit=DEFAULT_TIME_LIMIT, max_depth=6):
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.scores = row_scores()
+
+        # Statistics of the last search
+        self.nodes = 0
+        self.depth = 0
+        self.elapsed = 0.0
+
+    @property
+    def nodes_per_second(self):
+        """Nodes searched per second in the last search."""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    def evaluate(self, board):
+        """Score a board by its rows and columns."""
+        scores = self.scores
+        columns = transpose(board)
+        return (scores[board & 0xFFFF] + scores[board >> 16 & 0xFFFF]
+                + scores[board >> 32 & 0xFFFF] + scores[board >> 48]
+                + scores[columns & 0xFFFF] + scores[columns >> 16 & 0xFFFF]
+                + scores[columns >> 32 & 0xFFFF] + scores[columns >> 48])
+
+    def best_move(self, board):
+        """Return the best direction to move a board, or None if no move is left."""
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit
+        self.nodes = 0
+        self.depth = 0
+
+        moves = []
+        for direction in DIRECTIONS:
+            moved, _ = MOVES[direction](board)
+            if moved != board:
+                moves.append((direction, moved))
+        if not moves:
+            self.elapsed = time.perf_counter() - start
+            return None
+
+        # Deepen until time runs out, keeping the answer of the deepest finished search
+        best = moves[0][0]
+        for depth in range(1, self.max_depth + 1):
+            self.cache = {}
+            try:
+                scored = [(self.spawn_value(moved, depth, 1.0), direction) for direction, moved in moves]
+            except SearchTimeout:
+                break
+            best = max(scored)[1]
+            self.depth = depth
+            if len(moves) == 1:
+                break  # Nothing to choose between
+
+        self.cache = {}
+        self.elapsed = time.perf_counter() - start
+        return best
+
+    def move_value(self, board, depth, probability):
+        """Value of a board where the player moves next: the best of the moves."""
+        best = 0.0  # No move left: the game is lost
+        for direction in DIRECTIONS:
+            moved, _ = MOVES[direction](board)
+            if moved != board:
+                best = max(best, self.spawn_value(moved, depth, probability))
+        return best
+
+    def spawn_value(self, board, depth, probability):
+        """Value of a board where a tile spawns next: the average over the spawns."""
+        self.nodes += 1
+        if depth == 0 or probability < PROBABILITY_CUTOFF:
+            return self.evaluate(board)
+
+        cached = self.cache.get(board)
+        if cached is not None and cached[0] >= depth:
+            return cached[1]
+
+        if time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        empty = [i for i in range(16) if not board >> (4 * i) & 0xF]
+        if not empty:
+            return self.evaluate(board)
+
+        two = probability * 0.9 / len(empty)
+        four = probability * 0.1 / len(empty)
+        total = 0.0
+        for i in empty:
+            total += 0.9 * self.move_value(board | 1 << (4 * i), depth - 1, two)
+            total += 0.1 * self.move_value(board | 2 << (4 * i), depth - 1, four)
+        value = total / len(empty)
+
+        self.cache[board] = (depth, value)
+        return value
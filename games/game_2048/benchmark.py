@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark the bitboard 2048 engine against list-based moves.
+
+The list-based moves are the ones the games used before the engine: each
+row or column is copied into a list, compacted, merged and compacted again.
+
+Run from the repository root:
+    python -m games.game_2048.benchmark [--boards N] [--seed S]
+    python -m games.game_2048.benchmark --bot [--moves N] [--time-limit MS] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from games.game_2048.ai import Game2048Bot
+from games.game_2048.engine import DIRECTIONS, MOVES, SIZE, Game2048Engine
+
+
+def list_move(board, direction):
+    """Move a board given as rows of tile values; returns the new rows and the score gained."""
+    size = len(board)
+    if direction in ("left", "right"):
+        lines = [row[:] for row in board]
+    else:
+        lines = [[board[y][x] for y in range(size)] for x in range(size)]
+    towards_end = direction in ("right", "down")
+
+    score = 0
+    result = []
+    for line in lines:
+        if towards_end:
+            line.reverse()
+        line = [value for value in line if value]
+        for i in range(len(line) - 1):
+            if line[i] and line[i] == line[i + 1]:
+                line[i] *= 2
+                score += line[i]
+                line[i + 1] = 0
+        line = [value for value in line if value]
+        line += [0] * (size - len(line))
+        if towards_end:
+            line.reverse()
+        result.append(line)
+
+    if direction in ("up", "down"):
+        result = [[result[x][y] for x in range(size)] for y in range(size)]
+    return result, score
+
+
+def random_boards(count, seed):
+    """Return boards reached by random play, as engine ints and as rows of values."""
+    rng = random.Random(seed)
+    engine = Game2048Engine(seed=seed)
+    boards = []
+    while len(boards) < count:
+        boards.append((engine.board, engine.grid()))
+        if engine.move(rng.choice(DIRECTIONS)) is not None:
+            engine.add_random_tile()
+        if not engine.can_move():
+            engine.reset()
+    return boards
+
+
+def time_moves(boards, move):
+    """Apply every direction to every board; returns the elapsed time."""
+    start = time.perf_counter()
+    for board in boards:
+        for direction in DIRECTIONS:
+            move(board, direction)
+    return time.perf_counter() - start
+
+
+def benchmark_bot(moves, time_limit, seed):
+    """Let the expectimax bot play a number of moves, restarting after each game over.
+
+    Returns the bot, elapsed time, nodes searched, average depth and the largest tile.
+    """
+    bot = Game2048Bot(time_limit=time_limit)
+    engine = Game2048Engine(seed=seed)
+    nodes = 0
+    depths = 0
+    largest = 0
+
+    start = time.perf_counter()
+    for _ in range(moves):
+        direction = bot.best_move(engine.board)
+        nodes += bot.nodes
+        depths += bot.depth
+        if direction is None:
+            engine.reset()
+            continue
+        engine.move(direction)
+        engine.add_random_tile()
+        largest = max(largest, engine.max_tile)
+    elapsed = time.perf_counter() - start
+
+    return bot, elapsed, nodes, depths / moves, largest
+
+
+def main():
+    """Run the benchmark and print the move rates."""
+    parser = argparse.ArgumentParser(description="Benchmark the 2048 engine against list-based moves")
+    parser.add_argument("--boards", "-n", type=int, default=100000, help="Boards to move in each direction")
+    parser.add_argument("--bot", action="store_true", help="Benchmark the expectimax bot instead")
+    parser.add_argument("--moves", type=int, default=200, help="Moves for the bot to make")
+    parser.add_argument("--time-limit", type=float, default=50, help="Bot thinking time per move in milliseconds")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs")
+    args = parser.parse_args()
+
+    if args.bot:
+        bot, elapsed, nodes, depth, largest = benchmark_bot(args.moves, args.time_limit / 1000, args.seed)
+        print(f"{args.moves} moves in {elapsed:.2f}s: {nodes / elapsed:,.0f} nodes searched/s")
+        print(f"{elapsed / args.moves * 1000:.1f} ms per move, average depth {depth:.1f}, largest tile {largest}")
+        return
+
+    boards = random_boards(args.boards, args.seed)
+    moves = len(boards) * len(DIRECTIONS)
+
+    engine_time = time_moves([board for board, _ in boards], lambda board, direction: MOVES[direction](board))
+    list_time = time_moves([grid for _, grid in boards], list_move)
+
+    print(f"{moves} moves on {SIZE}x{SIZE} boards")
+    print(f"bitboard engine: {moves / engine_time:12,.0f} moves/s")
+    print(f"list-based:      {moves / list_time:12,.0f} moves/s")
+    print(f"speed-up: {list_time / engine_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Headless 2048 engine shared by the terminal and GUI games.
+
+The board is packed into one int of 4-bit exponents: on a board of size n,
+cell (x, y) is the nibble at bit 4 * (n * y + x), and holds 0 for an empty
+cell or e for a tile of 2 ** e. A row is then a 4n-bit number, so sliding a
+row left or right is a table lookup. For the classic 4x4 board the tables
+cover all 65536 rows and are computed once; other sizes (3x3 up to 8x8) fill
+a table lazily with the rows that actually occur. Up and down transpose the
+board, slide its rows and transpose it back. The 4x4 moves work on plain
+ints, so the AI can search boards without touching an engine object.
+
+The engine keeps the free cells and the number of neighbouring tiles that
+could merge up to date as cells change, so spawning a tile and checking if
+any move is left take constant time, whatever the board size.
+"""
+
+import random
+
+SIZE = 4
+MIN_SIZE = 3
+MAX_SIZE = 8
+DIRECTIONS = ("up", "down", "left", "right")
+
+# Exponents stop at 15 (a 32768 tile), as that is the most a nibble holds
+MAX_EXPONENT = 15
+
+
+def slide_row_left(row, size=SIZE):
+    """Slide and merge a row towards cell 0; returns the new row and the score gained."""
+    tiles = [row >> (4 * i) & 0xF for i in range(size)]
+    tiles = [tile for tile in tiles if tile]
+
+    merged = []
+    score = 0
+    i = 0
+    while i < len(tiles):
+        tile = tiles[i]
+        if i + 1 < len(tiles) and tiles[i + 1] == tile and tile < MAX_EXPONENT:
+            tile += 1
+            score += 1 << tile
+            i += 2
+        else:
+            i += 1
+        merged.append(tile)
+
+    result = 0
+    for i, tile in enumerate(merged):
+        result |= tile << (4 * i)
+    return result, score
+
+
+def reverse_row(row, size=SIZE):
+    """Reverse the order of the cells of a row."""
+    if size == SIZE:
+        return ((row & 0xF) << 12) | ((row & 0xF0) << 4) | ((row >> 4) & 0xF0) | (row >> 12)
+    result = 0
+    for i in range(size):
+        result |= (row >> (4 * i) & 0xF) << (4 * (size - 1 - i))
+    return result
+
+
+def build_row_tables():
+    """Return the results and scores of sliding every possible row left and right."""
+    left = [0] * 65536
+    right = [0] * 65536
+    left_score = [0] * 65536
+    right_score = [0] * 65536
+    for row in range(65536):
+        result, score = slide_row_left(row)
+        left[row] = result
+        left_score[row] = score
+        reversed_row = reverse_row(row)
+        right[reversed_row] = reverse_row(result)
+        right_score[reversed_row] = score
+    return left, right, left_score, right_score
+
+
+ROW_LEFT, ROW_RIGHT, ROW_LEFT_SCORE, ROW_RIGHT_SCORE = build_row_tables()
+
+
+def transpose(board):
+    """Swap the rows and columns of a 4x4 board."""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def slide_rows(board, table, scores):
+    """Slide every row of a 4x4 board with one of the row tables; returns the board and score gained."""
+    r0 = board & 0xFFFF
+    r1 = board >> 16 & 0xFFFF
+    r2 = board >> 32 & 0xFFFF
+    r3 = board >> 48
+    result = table[r0] | table[r1] << 16 | table[r2] << 32 | table[r3] << 48
+    return result, scores[r0] + scores[r1] + scores[r2] + scores[r3]
+
+
+def move_left(board):
+    """Slide a 4x4 board's tiles left; returns the new board and the score gained."""
+    return slide_rows(board, ROW_LEFT, ROW_LEFT_SCORE)
+
+
+def move_right(board):
+    """Slide a 4x4 board's tiles right; returns the new board and the score gained."""
+    return slide_rows(board, ROW_RIGHT, ROW_RIGHT_SCORE)
+
+
+def move_up(board):
+    """Slide a 4x4 board's tiles up; returns the new board and the score gained."""
+    result, score = slide_rows(transpose(board), ROW_LEFT, ROW_LEFT_SCORE)
+    return transpose(result), score
+
+
+def move_down(board):
+    """Slide a 4x4 board's tiles down; returns the new board and the score gained."""
+    result, score = slide_rows(transpose(board), ROW_RIGHT, ROW_RIGHT_SCORE)
+    return transpose(result), score
+
+
+# Direction -> function of a board returning the moved board and the score gained
+MOVES = {
+    "up": move_up,
+    "down": move_down,
+    "left": move_left,
+    "right": move_right,
+}
+
+
+class RowTable(dict):
+    """Results of sliding rows of a board size, computed the first time each row is met.
+
+    Maps a row to (new row, score gained).
+    """
+
+    def __init__(self, size, towards_end):
+        super().__init__()
+        self.size = size
+        self.towards_end = towards_end
+
+    def __missing__(self, row):
+        if self.towards_end:
+            result, score = slide_row_left(reverse_row(row, self.size), self.size)
+            value = (reverse_row(result, self.size), score)
+        else:
+            value = slide_row_left(row, self.size)
+        self[row] = value
+        return value
+
+
+def transpose_any(board, size):
+    """Swap the rows and columns of a board of any size."""
+    result = 0
+    for y in range(size):
+        for x in range(size):
+            result |= (board >> (4 * (size * y + x)) & 0xF) << (4 * (size * x + y))
+    return result
+
+
+class Game2048Engine:
+    """Board, score and tile spawns of one 2048 game."""
+
+    def __init__(self, size=SIZE, seed=None):
+        """Create a game with two random tiles; seeding it makes the spawns repeatable."""
+        if not MIN_SIZE <= size <= MAX_SIZE:
+            raise ValueError(f"Board size must be between {MIN_SIZE} and {MAX_SIZE}")
+        self.size = size
+        self.cells = size * size
+        self.row_mask = (1 << (4 * size)) - 1
+        self.rng = random.Random(seed)
+        if size != SIZE:
+            self.row_left = RowTable(size, towards_end=False)
+            self.row_right = RowTable(size, towards_end=True)
+        self.reset()
+
+    def reset(self):
+        """Start again with an empty board and two random tiles."""
+        self.board = 0
+        self.score = 0
+        self.max_exponent = 0
+
+        # Empty cells as indices size * y + x, and where each one sits in that
+        # list (-1 for filled cells), for O(1) random choice and removal
+        self.free = list(range(self.cells))
+        self.free_index = list(range(self.cells))
+        # Neighbouring tiles of equal value, which a move could merge
+        self.pairs = 0
+
+        self.add_random_tile()
+        self.add_random_tile()
+
+    def exponent(self, index):
+        """Return the exponent at a cell index, 0 if the cell is empty."""
+        return self.board >> (4 * index) & 0xF
+
+    def tile(self, x, y):
+        """Return the value of the tile at a cell, or 0 if it is empty."""
+        exponent = self.exponent(self.size * y + x)
+        return 1 << exponent if exponent else 0
+
+    def grid(self):
+        """Return the board as rows of tile values."""
+        return [[self.tile(x, y) for x in range(self.size)] for y in range(self.size)]
+
+    @property
+    def max_tile(self):
+        """The value of the largest tile on the board."""
+        return 1 << self.max_exponent if self.max_exponent else 0
+
+    @property
+    def moves_available(self):
+        """Whether any move is left: a free cell, or two neighbouring tiles that can merge."""
+        return bool(self.free) or self.pairs > 0
+
+    def can_move(self):
+        """Check if any move is left."""
+        return self.moves_available
+
+    def neighbours(self, index):
+        """Return the indices of the cells next to a cell."""
+        size = self.size
+        x = index % size
+        cells = []
+        if x > 0:
+            cells.append(index - 1)
+        if x < size - 1:
+            cells.append(index + 1)
+        if index >= size:
+            cells.append(index - size)
+        if index < self.cells - size:
+            cells.append(index + size)
+        return cells
+
+    def count_pairs(self, indices):
+        """Count the mergeable pairs that involve any of the given cells, each pair once."""
+        indices = set(indices)
+        pairs = 0
+        for index in indices:
+            exponent = self.exponent(index)
+            if not exponent or exponent == MAX_EXPONENT:
+                continue  # Empty cells and 32768 tiles never merge
+            for neighbour in self.neighbours(index):
+                if (neighbour not in indices or neighbour > index) and self.exponent(neighbour) == exponent:
+                    pairs += 1
+        return pairs
+
+    def set_cells(self, board, changed):
+        """Replace the board, updating the free cells, pairs and largest tile for the changed cells."""
+        self.pairs -= self.count_pairs(changed)
+        old = self.board
+        self.board = board
+        self.pairs += self.count_pairs(changed)
+
+        for index in changed:
+            was_empty = not old >> (4 * index) & 0xF
+            exponent = self.exponent(index)
+            if was_empty and exponent:
+                # Take the cell off the free list by moving the last free cell into its place
+                position = self.free_index[index]
+                last = self.free.pop()
+                if last != index:
+                    self.free[position] = last
+                    self.free_index[last] = position
+                self.free_index[index] = -1
+            elif exponent == 0 and not was_empty:
+                self.free_index[index] = len(self.free)
+                self.free.append(index)
+            if exponent > self.max_exponent:
+                self.max_exponent = exponent
+
+    def add_random_tile(self):
+        """Add a 2 (90% chance) or a 4 to a random empty cell; returns its (x, y) or None if full."""
+        if not self.free:
+            return None
+        cell = self.rng.choice(self.free)
+        exponent = 1 if self.rng.random() < 0.9 else 2
+        self.set_cells(self.board | exponent << (4 * cell), [cell])
+        return cell % self.size, cell // self.size
+
+    def slide(self, board, direction):
+        """Slide a board of this engine's size; returns the new board and the score gained."""
+        if self.size == SIZE:
+            return MOVES[direction](board)
+
+        size = self.size
+        vertical = direction in ("up", "down")
+        if vertical:
+            board = transpose_any(board, size)
+        table = self.row_right if direction in ("right", "down") else self.row_left
+
+        result = 0
+        score = 0
+        bits = 4 * size
+        for y in range(size):
+            row, gained = table[board >> (bits * y) & self.row_mask]
+            result |= row << (bits * y)
+            score += gained
+
+        if vertical:
+            result = transpose_any(result, size)
+        return result, score
+
+    def move(self, direction):
+        """Slide the tiles in a direction, without adding a new tile.
+
+        Returns the score gained, or None if nothing moved.
+        """
+        board, score = self.slide(self.board, direction)
+        if board == self.board:
+            return None
+
+        # Only the cells whose nibble changed need their bookkeeping updated
+        changed = []
+        diff = self.board ^ board
+        while diff:
+            index = (diff.bit_length() - 1) // 4
+            changed.append(index)
+            diff &= ~(0xF << (4 * index))
+        self.set_cells(board, changed)
+
+        self.score += score
+        return score
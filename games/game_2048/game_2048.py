@@ -2,9 +2,10 @@
 import os
 import sys
 import time
-import random
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
+from games.game_2048.engine import MAX_SIZE, MIN_SIZE, SIZE, Game2048Engine
 
 # Import msvcrt only on Windows
 if os.name == 'nt':
@@ -33,9 +34,12 @@ COLORS = {
     8192: (Fore.WHITE, Back.BLUE),
 }
 
+# Movement keys
+KEY_DIRECTIONS = {'w': "up", 's': "down", 'a': "left", 'd': "right"}
+
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -60,31 +64,8 @@ def getch():
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
         return ch
 
-class Game2048:
-    def __init__(self, size=4):
-        """Initialize the 2048 game with a given board size."""
-        self.size = size
-        self.board = [[0 for _ in range(size)] for _ in range(size)]
-        self.score = 0
-        self.max_tile = 0
-        # Add two random tiles to start
-        self.add_random_tile()
-        self.add_random_tile()
-    
-    def add_random_tile(self):
-        """Add a random tile (2 or 4) to an empty cell."""
-        # Find all empty cells
-        empty_cells = [(i, j) for i in range(self.size) for j in range(self.size) if self.board[i][j] == 0]
-        
-        if empty_cells:
-            # Choose a random empty cell
-            i, j = random.choice(empty_cells)
-            
-            # Add a 2 (90% chance) or 4 (10% chance)
-            self.board[i][j] = 2 if random.random() < 0.9 else 4
-            
-            # Update max tile
-            self.max_tile = max(self.max_tile, self.board[i][j])
+class Game2048(Game2048Engine):
+    """2048 game drawn in the terminal."""
     
     def display_board(self):
         """Display the current game board."""
@@ -99,9 +80,10 @@ class Game2048:
         print("┌" + "─" * cell_width + ("┬" + "─" * cell_width) * (self.size - 1) + "┐")
         
         # Print rows
+        board = self.grid()
         for i in range(self.size):
             for j in range(self.size):
-                value = self.board[i][j]
+                value = board[i][j]
                 if value == 0:
                     # Empty cell
                     print("│" + " " * cell_width, end="")
@@ -120,144 +102,9 @@ class Game2048:
         print("└" + "─" * cell_width + ("┴" + "─" * cell_width) * (self.size - 1) + "┘")
         print()
     
-    def move_left(self):
-        """Move tiles to the left and merge if possible."""
-        moved = False
-        for i in range(self.size):
-            # Compress the row (move all non-zero elements to the left)
-            row = [self.board[i][j] for j in range(self.size) if self.board[i][j] != 0]
-            row += [0] * (self.size - len(row))
-            
-            # Merge adjacent identical tiles
-            for j in range(self.size - 1):
-                if row[j] != 0 and row[j] == row[j + 1]:
-                    row[j] *= 2
-                    self.score += row[j]  # Add merged value to score
-                    self.max_tile = max(self.max_tile, row[j])  # Update max tile
-                    row[j + 1] = 0
-            
-            # Compress again after merging
-            row = [row[j] for j in range(self.size) if row[j] != 0]
-            row += [0] * (self.size - len(row))
-            
-            # Check if the move changed the row
-            if row != [self.board[i][j] for j in range(self.size)]:
-                moved = True
-            
-            # Update the board
-            for j in range(self.size):
-                self.board[i][j] = row[j]
-        
-        return moved
-    
-    def move_right(self):
-        """Move tiles to the right and merge if possible."""
-        moved = False
-        for i in range(self.size):
-            # Compress the row (move all non-zero elements to the right)
-            row = [self.board[i][j] for j in range(self.size) if self.board[i][j] != 0]
-            row = [0] * (self.size - len(row)) + row
-            
-            # Merge adjacent identical tiles from right to left
-            for j in range(self.size - 1, 0, -1):
-                if row[j] != 0 and row[j] == row[j - 1]:
-                    row[j] *= 2
-                    self.score += row[j]  # Add merged value to score
-                    self.max_tile = max(self.max_tile, row[j])  # Update max tile
-                    row[j - 1] = 0
-            
-            # Compress again after merging
-            row = [row[j] for j in range(self.size) if row[j] != 0]
-            row = [0] * (self.size - len(row)) + row
-            
-            # Check if the move changed the row
-            if row != [self.board[i][j] for j in range(self.size)]:
-                moved = True
-            
-            # Update the board
-            for j in range(self.size):
-                self.board[i][j] = row[j]
-        
-        return moved
-    
-    def move_up(self):
-        """Move tiles up and merge if possible."""
-        moved = False
-        for j in range(self.size):
-            # Compress the column (move all non-zero elements up)
-            col = [self.board[i][j] for i in range(self.size) if self.board[i][j] != 0]
-            col += [0] * (self.size - len(col))
-            
-            # Merge adjacent identical tiles
-            for i in range(self.size - 1):
-                if col[i] != 0 and col[i] == col[i + 1]:
-                    col[i] *= 2
-                    self.score += col[i]  # Add merged value to score
-                    self.max_tile = max(self.max_tile, col[i])  # Update max tile
-                    col[i + 1] = 0
-            
-            # Compress again after merging
-            col = [col[i] for i in range(self.size) if col[i] != 0]
-            col += [0] * (self.size - len(col))
-            
-            # Check if the move changed the column
-            if col != [self.board[i][j] for i in range(self.size)]:
-                moved = True
-            
-            # Update the board
-            for i in range(self.size):
-                self.board[i][j] = col[i]
-        
-        return moved
-    
-    def move_down(self):
-        """Move tiles down and merge if possible."""
-        moved = False
-        for j in range(self.size):
-            # Compress the column (move all non-zero elements down)
-            col = [self.board[i][j] for i in range(self.size) if self.board[i][j] != 0]
-            col = [0] * (self.size - len(col)) + col
-            
-            # Merge adjacent identical tiles from bottom to top
-            for i in range(self.size - 1, 0, -1):
-                if col[i] != 0 and col[i] == col[i - 1]:
-                    col[i] *= 2
-                    self.score += col[i]  # Add merged value to score
-                    self.max_tile = max(self.max_tile, col[i])  # Update max tile
-                    col[i - 1] = 0
-            
-            # Compress again after merging
-            col = [col[i] for i in range(self.size) if col[i] != 0]
-            col = [0] * (self.size - len(col)) + col
-            
-            # Check if the move changed the column
-            if col != [self.board[i][j] for i in range(self.size)]:
-                moved = True
-            
-            # Update the board
-            for i in range(self.size):
-                self.board[i][j] = col[i]
-        
-        return moved
-    
     def is_game_over(self):
         """Check if the game is over (no more moves possible)."""
-        # Check if board is full
-        if any(self.board[i][j] == 0 for i in range(self.size) for j in range(self.size)):
-            return False
-        
-        # Check if any adjacent cells have the same value
-        for i in range(self.size):
-            for j in range(self.size):
-                value = self.board[i][j]
-                # Check right neighbor
-                if j < self.size - 1 and self.board[i][j + 1] == value:
-                    return False
-                # Check bottom neighbor
-                if i < self.size - 1 and self.board[i + 1][j] == value:
-                    return False
-        
-        return True
+        return not self.can_move()
     
     def is_win(self):
         """Check if the player has won (reached 2048)."""
@@ -281,6 +128,20 @@ def show_instructions():
     print()
     input(f"{Fore.GREEN}Press Enter to start the game...{Style.RESET_ALL}")
 
+def choose_board_size():
+    """Ask for the board size, defaulting to the classic 4x4."""
+    while True:
+        answer = input(f"{Fore.CYAN}Board size ({MIN_SIZE}-{MAX_SIZE}, Enter for {SIZE}): {Style.RESET_ALL}").strip()
+        if not answer:
+            return SIZE
+        try:
+            size = int(answer)
+            if MIN_SIZE <= size <= MAX_SIZE:
+                return size
+            print(f"{Fore.RED}Please enter a number between {MIN_SIZE} and {MAX_SIZE}.{Style.RESET_ALL}")
+        except ValueError:
+            print(f"{Fore.RED}Please enter a valid number.{Style.RESET_ALL}")
+
 def get_arrow_key():
     """Get arrow key input (cross-platform)."""
     key = getch().lower()
@@ -308,10 +169,11 @@ def main():
     clear_screen()
     print_header()
     show_instructions()
+    size = choose_board_size()
     
     while True:
         # Start a new game
-        game = Game2048()
+        game = Game2048(size)
         
         # Game loop
         while not game.is_game_over() and not game.is_win():
@@ -334,14 +196,8 @@ def main():
                     return
                 
                 # Apply the move if valid
-                if key == 'w':
-                    moved = game.move_up()
-                elif key == 's':
-                    moved = game.move_down()
-                elif key == 'a':
-                    moved = game.move_left()
-                elif key == 'd':
-                    moved = game.move_right()
+                if key in KEY_DIRECTIONS:
+                    moved = game.move(KEY_DIRECTIONS[key]) is not None
                 
                 if not moved and key in {'w', 's', 'a', 'd'}:
                     print(f"{Fore.RED}Invalid move! Try a different direction.{Style.RESET_ALL}")
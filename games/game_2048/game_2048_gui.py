@@ -1,30 +1,61 @@
 #!/usr/bin/env python3
 import tkinter as tk
 from tkinter import messagebox, ttk
-import random
+from tkinter import font as tkfont
 import time
 import sys
 import os
 import math
+import threading
+
+from games.game_2048.ai import Game2048Bot
+from games.game_2048.engine import MAX_EXPONENT, MAX_SIZE, MIN_SIZE, SIZE, Game2048Engine
+
+# Width and height of the board in pixels, whatever the number of cells
+BOARD_PIXELS = 450
+
+# Slide animation: frames for the tiles to travel, then frames for merged and
+# new tiles to pop, each ANIMATION_FRAME_MS apart
+SLIDE_FRAMES = 6
+POP_SCALES = [1.12, 1.06, 1.0]
+NEW_TILE_SCALES = [0.4, 0.7, 1.0]
+ANIMATION_FRAME_MS = 15
+
+# Milliseconds between checks on a running search, and between autoplay moves
+SEARCH_POLL_MS = 20
+AUTOPLAY_DELAY = 50
 
 class Game2048GUI:
     def __init__(self, root):
         self.root = root
         self.root.title("2048")
-        self.root.geometry("600x700")
+        self.root.geometry("600x750")
         self.root.configure(bg="#FAF8EF")  # Light beige background
         self.root.resizable(True, True)
         
         # Game parameters
-        self.grid_size = 4
-        self.cell_size = 100
-        self.cell_padding = 10
-        self.board = None
+        self.set_board_geometry(SIZE)
+        self.engine = Game2048Engine(self.grid_size)  # Tiles, moves and scoring
+        self.board = None  # The engine's board as rows of tile values, for drawing
         self.score = 0
         self.high_score = 0
         self.game_over = False
         self.won = False
-        self.has_moved = False
+        
+        # Rendering state: pooled tile items, fonts per digit count, and the running animation
+        self.tile_items = []  # (rectangle, text) pairs, reused for whichever tiles are shown
+        self.tile_shown = []  # What each pair currently shows, to skip unchanged items
+        self.fonts = {}
+        self.animation_frames = []
+        self.animation_job = None
+        self.pending_move = None  # Latest key pressed while animating, replaces any earlier one
+        
+        # Hint and autoplay; the bot searches in a worker thread so the window stays responsive
+        self.bot = None  # Created by the first search, as building its tables takes a moment
+        self.search_thread = None
+        self.search_result = None  # (direction, board searched) once the thread finishes
+        self.search_callback = None
+        self.autoplay = False
         
         # Cell colors and fonts
         self.cell_colors = {
@@ -155,29 +186,51 @@ class Game2048GUI:
             bg="#FAF8EF",
             fg="#776E65"
         )
-        self.instructions_label.pack(pady=(10, 20))
+        self.instructions_label.pack(pady=(10, 5))
+        
+        # Board size selector
+        self.size_frame = tk.Frame(self.main_frame, bg="#FAF8EF")
+        self.size_frame.pack(pady=(0, 10))
+        
+        tk.Label(
+            self.size_frame,
+            text="Board size:",
+            font=("Helvetica", 12),
+            bg="#FAF8EF",
+            fg="#776E65"
+        ).pack(side=tk.LEFT, padx=5)
+        
+        self.size_var = tk.StringVar(value=str(self.grid_size))
+        self.size_spinbox = tk.Spinbox(
+            self.size_frame,
+            from_=MIN_SIZE,
+            to=MAX_SIZE,
+            textvariable=self.size_var,
+            width=3,
+            font=("Helvetica", 12),
+            state="readonly",
+            command=self.change_size
+        )
+        self.size_spinbox.pack(side=tk.LEFT)
         
         # Game canvas
         self.canvas_frame = tk.Frame(
             self.main_frame,
             bg="#BBADA0",
-            padx=self.cell_padding,
-            pady=self.cell_padding
+            padx=10,
+            pady=10
         )
         self.canvas_frame.pack(pady=10)
         
-        # Calculate canvas size
-        canvas_width = self.grid_size * (self.cell_size + self.cell_padding) + self.cell_padding
-        canvas_height = canvas_width
-        
         self.canvas = tk.Canvas(
             self.canvas_frame,
-            width=canvas_width,
-            height=canvas_height,
+            width=self.canvas_size(),
+            height=self.canvas_size(),
             bg="#BBADA0",
             highlightthickness=0
         )
         self.canvas.pack()
+        self.create_board_items()
         
         # Control buttons frame
         self.control_frame = tk.Frame(self.main_frame, bg="#FAF8EF")
@@ -197,6 +250,48 @@ class Game2048GUI:
         )
         self.new_button.pack(side=tk.LEFT, padx=10)
         
+        # Animation toggle
+        self.animate_var = tk.BooleanVar(value=True)
+        self.animate_check = tk.Checkbutton(
+            self.control_frame,
+            text="Animate",
+            variable=self.animate_var,
+            font=("Helvetica", 12),
+            bg="#FAF8EF",
+            fg="#776E65",
+            activebackground="#FAF8EF",
+            selectcolor="#FFFFFF"
+        )
+        self.animate_check.pack(side=tk.LEFT, padx=10)
+        
+        # Hint button
+        self.hint_button = tk.Button(
+            self.control_frame,
+            text="Hint",
+            font=("Helvetica", 14, "bold"),
+            bg="#8F7A66",
+            fg="#FFFFFF",
+            padx=10,
+            pady=5,
+            command=self.show_hint,
+            activebackground="#9F8A76"
+        )
+        self.hint_button.pack(side=tk.LEFT, padx=10)
+        
+        # Autoplay button
+        self.autoplay_button = tk.Button(
+            self.control_frame,
+            text="Autoplay",
+            font=("Helvetica", 14, "bold"),
+            bg="#8F7A66",
+            fg="#FFFFFF",
+            padx=10,
+            pady=5,
+            command=self.toggle_autoplay,
+            activebackground="#9F8A76"
+        )
+        self.autoplay_button.pack(side=tk.LEFT, padx=10)
+        
         # Quit button
         self.quit_button = tk.Button(
             self.control_frame,
@@ -221,6 +316,8 @@ class Game2048GUI:
         self.root.bind("s", lambda e: self.move("down"))
         self.root.bind("a", lambda e: self.move("left"))
         self.root.bind("d", lambda e: self.move("right"))
+        self.root.bind("h", lambda e: self.show_hint())
+        self.root.bind("p", lambda e: self.toggle_autoplay())
     
     def show_welcome(self):
         """Show welcome screen and instructions."""
@@ -250,6 +347,7 @@ class Game2048GUI:
             "Use your arrow keys or WASD to move the tiles.",
             "When two tiles with the same number touch,",
             "they merge into one with their sum!",
+            "Press H for a hint, or P to let the computer play.",
             "",
             "• You win when you create a tile with the number 2048",
             "• You lose when the board is full and no more moves are possible",
@@ -288,280 +386,364 @@ class Game2048GUI:
     
     def new_game(self):
         """Start a new game."""
-        # Initialize the board
-        self.board = [[0 for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # Drop any animation of the previous game
+        if self.animation_job:
+            self.root.after_cancel(self.animation_job)
+            self.animation_job = None
+        self.animation_frames = []
+        self.pending_move = None
+        self.stop_autoplay()
+        
+        # Initialize the board with two tiles
+        self.engine.reset()
+        self.board = self.engine.grid()
         self.score = 0
         self.score_var.set(str(self.score))
         self.game_over = False
         self.won = False
         
-        # Add two initial tiles
-        self.add_random_tile()
-        self.add_random_tile()
-        
         # Update the display
         self.draw_board()
         
         # Update game status
         self.instructions_label.config(text="Join the tiles and get to 2048!")
     
-    def add_random_tile(self):
-        """Add a random tile (2 or 4) to the board."""
-        # Find all empty cells
-        empty_cells = []
-        for y in range(self.grid_size):
-            for x in range(self.grid_size):
-                if self.board[y][x] == 0:
-                    empty_cells.append((x, y))
-        
-        if not empty_cells:
+    def set_board_geometry(self, size):
+        """Fit the cells of a board size into the same number of pixels."""
+        self.grid_size = size
+        self.cell_padding = 10 if size <= 5 else 6
+        self.cell_size = (BOARD_PIXELS - self.cell_padding * (size + 1)) // size
+    
+    def canvas_size(self):
+        """Return the width (and height) of the canvas for the board."""
+        return self.grid_size * (self.cell_size + self.cell_padding) + self.cell_padding
+    
+    def change_size(self):
+        """Start a new game on a board of the size chosen in the selector."""
+        size = int(self.size_var.get())
+        if size == self.grid_size:
             return
         
-        # Choose a random empty cell
-        x, y = random.choice(empty_cells)
+        self.stop_autoplay()
+        self.set_board_geometry(size)
+        self.engine = Game2048Engine(size)
         
-        # 90% chance of 2, 10% chance of 4
-        self.board[y][x] = 2 if random.random() < 0.9 else 4
-    
-    def draw_board(self):
-        """Draw the game board."""
+        # Rebuild the static cells and the tile pool for the new number of cells
         self.canvas.delete("all")
+        self.canvas.config(width=self.canvas_size(), height=self.canvas_size())
+        self.fonts.clear()
+        self.create_board_items()
+        
+        # The bot only searches 4x4 boards
+        bot_state = tk.NORMAL if size == SIZE else tk.DISABLED
+        self.hint_button.config(state=bot_state)
+        self.autoplay_button.config(state=bot_state)
         
-        # Draw the background grid
+        self.new_game()
+    
+    def cell_center(self, x, y):
+        """Return the canvas position of the center of a board cell."""
+        step = self.cell_size + self.cell_padding
+        return (x * step + self.cell_padding + self.cell_size / 2,
+                y * step + self.cell_padding + self.cell_size / 2)
+    
+    def create_board_items(self):
+        """Draw the empty cells once and create the pool of tile items."""
+        half = self.cell_size / 2
         for y in range(self.grid_size):
             for x in range(self.grid_size):
-                # Calculate position
-                x1 = x * (self.cell_size + self.cell_padding) + self.cell_padding
-                y1 = y * (self.cell_size + self.cell_padding) + self.cell_padding
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                
-                # Draw empty cell
+                cx, cy = self.cell_center(x, y)
                 self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
+                    cx - half, cy - half, cx + half, cy + half,
                     fill="#CCC0B3",
                     outline="",
                     width=0
                 )
         
-        # Draw the tiles
+        # One tile item per cell is enough, as there are never more tiles than cells
+        self.tile_items = []
+        for _ in range(self.grid_size * self.grid_size):
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, outline="", width=0, state=tk.HIDDEN)
+            text = self.canvas.create_text(0, 0, text="", state=tk.HIDDEN)
+            self.tile_items.append((rect, text))
+        self.tile_shown = [None] * len(self.tile_items)
+    
+    def tile_font(self, value):
+        """Return the font for a tile value, created once per number of digits."""
+        digits = len(str(value))
+        if digits not in self.fonts:
+            size = max(8, int(min(24, 48 / (digits * 0.8)) * self.cell_size / 100))
+            self.fonts[digits] = tkfont.Font(family="Helvetica", size=size, weight="bold")
+        return self.fonts[digits]
+    
+    def draw_tiles(self, tiles):
+        """Show tiles given as (center x, center y, value, scale), hiding the unused items.
+        
+        Pooled items are only moved or recolored when what they show changes.
+        """
+        for i, (rect, text) in enumerate(self.tile_items):
+            tile = tiles[i] if i < len(tiles) else None
+            shown = self.tile_shown[i]
+            if tile == shown:
+                continue
+            
+            if tile is None:
+                self.canvas.itemconfig(rect, state=tk.HIDDEN)
+                self.canvas.itemconfig(text, state=tk.HIDDEN)
+            else:
+                cx, cy, value, scale = tile
+                half = self.cell_size * scale / 2
+                self.canvas.coords(rect, cx - half, cy - half, cx + half, cy + half)
+                self.canvas.coords(text, cx, cy)
+                if shown is None or shown[2] != value:
+                    self.canvas.itemconfig(
+                        rect,
+                        fill=self.cell_colors.get(value, "#3E3933"),  # Default to dark color for very high values
+                        state=tk.NORMAL
+                    )
+                    self.canvas.itemconfig(
+                        text,
+                        text=str(value),
+                        font=self.tile_font(value),
+                        fill=self.text_colors.get(value, "#F9F6F2"),  # Default to white for very high values
+                        state=tk.NORMAL
+                    )
+            self.tile_shown[i] = tile
+    
+    def board_tiles(self, scales=None):
+        """Return the tiles of the current board for draw_tiles, optionally scaled per cell."""
+        tiles = []
         for y in range(self.grid_size):
             for x in range(self.grid_size):
                 value = self.board[y][x]
-                if value == 0:
+                if value:
+                    scale = scales.get((x, y), 1.0) if scales else 1.0
+                    tiles.append((*self.cell_center(x, y), value, scale))
+        return tiles
+    
+    def draw_board(self):
+        """Draw the game board."""
+        self.draw_tiles(self.board_tiles())
+    
+    def slide_paths(self, board, direction):
+        """Work out where each tile of a board goes in a move.
+        
+        Returns a list of (from cell, to cell, value) for every tile, and the
+        set of cells where two tiles merge.
+        """
+        n = self.grid_size
+        if direction == "left":
+            lines = [[(x, y) for x in range(n)] for y in range(n)]
+        elif direction == "right":
+            lines = [[(x, y) for x in range(n - 1, -1, -1)] for y in range(n)]
+        elif direction == "up":
+            lines = [[(x, y) for y in range(n)] for x in range(n)]
+        else:
+            lines = [[(x, y) for y in range(n - 1, -1, -1)] for x in range(n)]
+        
+        paths = []
+        merged = set()
+        for line in lines:
+            filled = 0
+            mergeable = None  # Value of the last tile placed, if it can still merge
+            for x, y in line:
+                value = board[y][x]
+                if not value:
                     continue
-                
-                # Calculate position
-                x1 = x * (self.cell_size + self.cell_padding) + self.cell_padding
-                y1 = y * (self.cell_size + self.cell_padding) + self.cell_padding
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                
-                # Choose colors
-                bg_color = self.cell_colors.get(value, "#3E3933")  # Default to dark color for very high values
-                fg_color = self.text_colors.get(value, "#F9F6F2")  # Default to white for very high values
-                
-                # Calculate font size based on number of digits
-                digits = int(math.log10(value)) + 1 if value > 0 else 1
-                font_size = min(24, int(48 / (digits * 0.8)))
-                
-                # Draw tile
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=bg_color,
-                    outline="",
-                    width=0
-                )
-                
-                # Draw value
-                self.canvas.create_text(
-                    (x1 + x2) / 2,
-                    (y1 + y2) / 2,
-                    text=str(value),
-                    font=("Helvetica", font_size, "bold"),
-                    fill=fg_color
-                )
+                if value == mergeable:
+                    target = line[filled - 1]
+                    merged.add(target)
+                    mergeable = None
+                else:
+                    target = line[filled]
+                    filled += 1
+                    # 32768 tiles are the largest the engine holds, so they never merge
+                    mergeable = value if value < 1 << MAX_EXPONENT else None
+                paths.append(((x, y), target, value))
+        return paths, merged
+    
+    def start_animation(self, paths, merged, new_tile):
+        """Queue the frames of a move and start playing them."""
+        frames = []
+        for frame in range(1, SLIDE_FRAMES + 1):
+            t = frame / SLIDE_FRAMES
+            tiles = []
+            for (x1, y1), (x2, y2), value in paths:
+                cx1, cy1 = self.cell_center(x1, y1)
+                cx2, cy2 = self.cell_center(x2, y2)
+                tiles.append((cx1 + (cx2 - cx1) * t, cy1 + (cy2 - cy1) * t, value, 1.0))
+            frames.append(tiles)
+        
+        for pop, grow in zip(POP_SCALES, NEW_TILE_SCALES):
+            scales = {cell: pop for cell in merged}
+            if new_tile:
+                scales[new_tile] = grow
+            frames.append(self.board_tiles(scales))
+        
+        # The last frame is always the plain board
+        frames[-1] = self.board_tiles()
+        
+        self.animation_frames = frames
+        self.animation_step()
+    
+    def animation_step(self):
+        """Draw the next animation frame; the one after loop that drives all animation."""
+        self.animation_job = None
+        self.draw_tiles(self.animation_frames.pop(0))
+        if self.animation_frames:
+            self.animation_job = self.root.after(ANIMATION_FRAME_MS, self.animation_step)
+        elif self.pending_move:
+            # Play the move pressed during the animation, only the latest one
+            direction = self.pending_move
+            self.pending_move = None
+            self.move(direction)
     
     def move(self, direction):
         """Move tiles in the specified direction."""
-        if self.game_over:
+        if self.game_over or self.board is None:
+            return
+        
+        # Keys held down during an animation don't pile up, only the latest is kept
+        if self.animation_frames:
+            self.pending_move = direction
             return
         
         # Save the original board for comparison
         original_board = [row[:] for row in self.board]
         
-        # Apply the move
-        self.has_moved = False
-        if direction == "up":
-            self.move_up()
-        elif direction == "down":
-            self.move_down()
-        elif direction == "left":
-            self.move_left()
-        elif direction == "right":
-            self.move_right()
-        
-        # Check if the board has changed
-        if self.has_moved:
-            self.add_random_tile()
-            self.draw_board()
+        # Apply the move, and add a tile if the board changed
+        if self.engine.move(direction) is not None:
+            self.score = self.engine.score
+            self.score_var.set(str(self.score))
+            new_tile = self.engine.add_random_tile()
+            self.board = self.engine.grid()
+            if self.animate_var.get():
+                paths, merged = self.slide_paths(original_board, direction)
+                self.start_animation(paths, merged, new_tile)
+            else:
+                self.draw_board()
             
             # Update high score if needed
             if self.score > self.high_score:
                 self.high_score = self.score
                 self.high_var.set(str(self.high_score))
             
-            # Check for game over or win
+            # Check for win or game over
+            if self.engine.max_tile >= 2048 and not self.won:
+                self.won = True
+                self.show_win_message()
             self.check_game_state()
     
-    def move_left(self):
-        """Move and merge tiles to the left."""
-        for y in range(self.grid_size):
-            # Shift all non-zero tiles to the left
-            row = [self.board[y][x] for x in range(self.grid_size) if self.board[y][x] != 0]
-            row += [0] * (self.grid_size - len(row))
-            
-            # Merge adjacent identical tiles
-            for x in range(self.grid_size - 1):
-                if row[x] != 0 and row[x] == row[x + 1]:
-                    row[x] *= 2
-                    row[x + 1] = 0
-                    self.score += row[x]
-                    self.score_var.set(str(self.score))
-                    
-                    # Check for win condition
-                    if row[x] == 2048 and not self.won:
-                        self.won = True
-                        self.show_win_message()
-            
-            # Shift again after merging
-            row = [val for val in row if val != 0]
-            row += [0] * (self.grid_size - len(row))
-            
-            # Update the board
-            for x in range(self.grid_size):
-                if self.board[y][x] != row[x]:
-                    self.has_moved = True
-                    self.board[y][x] = row[x]
+    def check_game_state(self):
+        """Check if the game is over."""
+        if not self.engine.can_move():
+            self.game_over = True
+            self.stop_autoplay()
+            self.instructions_label.config(text="Game Over! No more moves possible.")
+            messagebox.showinfo("Game Over", f"Game Over! Your final score is {self.score}.")
     
-    def move_right(self):
-        """Move and merge tiles to the right."""
-        for y in range(self.grid_size):
-            # Shift all non-zero tiles to the right
-            row = [self.board[y][x] for x in range(self.grid_size) if self.board[y][x] != 0]
-            row = [0] * (self.grid_size - len(row)) + row
-            
-            # Merge adjacent identical tiles from right to left
-            for x in range(self.grid_size - 1, 0, -1):
-                if row[x] != 0 and row[x] == row[x - 1]:
-                    row[x] *= 2
-                    row[x - 1] = 0
-                    self.score += row[x]
-                    self.score_var.set(str(self.score))
-                    
-                    # Check for win condition
-                    if row[x] == 2048 and not self.won:
-                        self.won = True
-                        self.show_win_message()
-            
-            # Shift again after merging
-            row = [val for val in row if val != 0]
-            row = [0] * (self.grid_size - len(row)) + row
-            
-            # Update the board
-            for x in range(self.grid_size):
-                if self.board[y][x] != row[x]:
-                    self.has_moved = True
-                    self.board[y][x] = row[x]
+    def start_search(self, callback):
+        """Search for the best move in a worker thread, then call callback with its direction.
+        
+        The callback isn't called if the board changed while the bot was thinking.
+        """
+        if self.search_thread and self.search_thread.is_alive():
+            # The running search's result goes to the latest caller
+            self.search_callback = callback
+            return
+        
+        board = self.engine.board
+        
+        def search():
+            if self.bot is None:
+                self.bot = Game2048Bot()
+            self.search_result = (self.bot.best_move(board), board)
+        
+        self.search_result = None
+        self.search_callback = callback
+        self.search_thread = threading.Thread(target=search, daemon=True)
+        self.search_thread.start()
+        self.root.after(SEARCH_POLL_MS, self.poll_search)
     
-    def move_up(self):
-        """Move and merge tiles upward."""
-        for x in range(self.grid_size):
-            # Shift all non-zero tiles upward
-            col = [self.board[y][x] for y in range(self.grid_size) if self.board[y][x] != 0]
-            col += [0] * (self.grid_size - len(col))
-            
-            # Merge adjacent identical tiles
-            for y in range(self.grid_size - 1):
-                if col[y] != 0 and col[y] == col[y + 1]:
-                    col[y] *= 2
-                    col[y + 1] = 0
-                    self.score += col[y]
-                    self.score_var.set(str(self.score))
-                    
-                    # Check for win condition
-                    if col[y] == 2048 and not self.won:
-                        self.won = True
-                        self.show_win_message()
-            
-            # Shift again after merging
-            col = [val for val in col if val != 0]
-            col += [0] * (self.grid_size - len(col))
-            
-            # Update the board
-            for y in range(self.grid_size):
-                if self.board[y][x] != col[y]:
-                    self.has_moved = True
-                    self.board[y][x] = col[y]
+    def poll_search(self):
+        """Hand the result of a finished search back to the UI thread."""
+        if self.search_thread.is_alive():
+            self.root.after(SEARCH_POLL_MS, self.poll_search)
+            return
+        
+        direction, board = self.search_result
+        if board == self.engine.board and self.engine.size == SIZE:
+            self.search_callback(direction)
+            return
+        
+        # The board changed while the bot was thinking, so the result is dropped
+        self.clear_thinking()
+        if self.autoplay:
+            self.autoplay_step()
     
-    def move_down(self):
-        """Move and merge tiles downward."""
-        for x in range(self.grid_size):
-            # Shift all non-zero tiles downward
-            col = [self.board[y][x] for y in range(self.grid_size) if self.board[y][x] != 0]
-            col = [0] * (self.grid_size - len(col)) + col
-            
-            # Merge adjacent identical tiles from bottom to top
-            for y in range(self.grid_size - 1, 0, -1):
-                if col[y] != 0 and col[y] == col[y - 1]:
-                    col[y] *= 2
-                    col[y - 1] = 0
-                    self.score += col[y]
-                    self.score_var.set(str(self.score))
-                    
-                    # Check for win condition
-                    if col[y] == 2048 and not self.won:
-                        self.won = True
-                        self.show_win_message()
-            
-            # Shift again after merging
-            col = [val for val in col if val != 0]
-            col = [0] * (self.grid_size - len(col)) + col
-            
-            # Update the board
-            for y in range(self.grid_size):
-                if self.board[y][x] != col[y]:
-                    self.has_moved = True
-                    self.board[y][x] = col[y]
+    def clear_thinking(self):
+        """Take down the "Thinking..." status if nothing replaced it."""
+        if self.instructions_label.cget("text") == "Thinking...":
+            self.instructions_label.config(text="Join the tiles and get to 2048!")
     
-    def check_game_state(self):
-        """Check if the game is over or won."""
-        # Check if the board is full
-        is_full = all(self.board[y][x] != 0 for y in range(self.grid_size) for x in range(self.grid_size))
+    def search_stats(self):
+        """Describe the bot's last search."""
+        return f"depth {self.bot.depth}, {self.bot.nodes_per_second:,.0f} nodes/s"
+    
+    def show_hint(self):
+        """Ask the bot for the best move and show it."""
+        if self.game_over or self.board is None or self.autoplay or self.grid_size != SIZE:
+            return
         
-        if is_full:
-            # Check if there are any possible moves
-            can_move = False
-            
-            # Check horizontal adjacency
-            for y in range(self.grid_size):
-                for x in range(self.grid_size - 1):
-                    if self.board[y][x] == self.board[y][x + 1]:
-                        can_move = True
-                        break
-            
-            # Check vertical adjacency
-            if not can_move:
-                for x in range(self.grid_size):
-                    for y in range(self.grid_size - 1):
-                        if self.board[y][x] == self.board[y + 1][x]:
-                            can_move = True
-                            break
-            
-            if not can_move:
-                self.game_over = True
-                self.instructions_label.config(text="Game Over! No more moves possible.")
-                messagebox.showinfo("Game Over", f"Game Over! Your final score is {self.score}.")
+        self.instructions_label.config(text="Thinking...")
+        self.start_search(self.hint_found)
+    
+    def hint_found(self, direction):
+        """Show the move the bot suggests."""
+        if direction is None:
+            self.instructions_label.config(text="No move left")
+        else:
+            self.instructions_label.config(text=f"Hint: move {direction.upper()} ({self.search_stats()})")
+    
+    def toggle_autoplay(self):
+        """Let the bot play the game, or take over again."""
+        if self.autoplay:
+            self.stop_autoplay()
+            self.instructions_label.config(text="Autoplay off")
+            return
+        if self.game_over or self.board is None or self.grid_size != SIZE:
+            return
+        
+        self.autoplay = True
+        self.autoplay_button.config(text="Stop")
+        self.autoplay_step()
+    
+    def stop_autoplay(self):
+        """Stop the bot playing; a search already running is left to finish and ignored."""
+        self.autoplay = False
+        self.autoplay_button.config(text="Autoplay")
+    
+    def autoplay_step(self):
+        """Start the search for the bot's next move, once the last one has been animated."""
+        if not self.autoplay or self.game_over:
+            return
+        if self.animation_frames:
+            self.root.after(AUTOPLAY_DELAY, self.autoplay_step)
+            return
+        self.start_search(self.autoplay_move)
+    
+    def autoplay_move(self, direction):
+        """Make the move the bot found and go on to the next one."""
+        if not self.autoplay:
+            self.clear_thinking()
+            return
+        if direction is None:
+            self.stop_autoplay()
+            self.instructions_label.config(text="No move left")
+            return
+        self.instructions_label.config(text=f"Autoplay: {self.search_stats()}")
+        self.move(direction)
+        self.root.after(AUTOPLAY_DELAY, self.autoplay_step)
     
     def show_win_message(self):
         """Show a message when the player wins."""
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Fixed-timestep game loop shared by the real-time terminal games.
+
+The simulation advances in ticks of a fixed length, paid for out of the real
+time that has passed (measured with time.perf_counter), so the game runs at
+the same speed however long drawing takes. Rendering is paced separately:
+after every batch of ticks, and in between no more than max_fps times a
+second. All keys pressed since the previous tick are
+read in one go and handed to the game together.
+"""
+
+import os
+import sys
+import time
+
+# Platform-specific imports
+if os.name == 'nt':
+    import msvcrt
+else:
+    import select
+    import tty
+    import termios
+
+# Arrow keys, as the final byte of an ANSI escape sequence or after a Windows prefix byte
+ANSI_ARROWS = {"A": "up", "B": "down", "C": "right", "D": "left"}
+WINDOWS_ARROWS = {b"H": "up", b"P": "down", b"M": "right", b"K": "left"}
+
+
+class KeyReader:
+    """Non-blocking keyboard input for the duration of a with block.
+
+    On Unix the terminal is put in cbreak mode once on entry, so keys arrive
+    without Enter and aren't echoed, and restored on exit.
+    """
+
+    def __init__(self):
+        self.fd = None
+        self.old_settings = None
+
+    def __enter__(self):
+        if os.name != 'nt' and sys.stdin.isatty():
+            self.fd = sys.stdin.fileno()
+            self.old_settings = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.old_settings is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+            self.old_settings = None
+        return False
+
+    def drain(self):
+        """Return every key pressed since the last call, oldest first.
+
+        Letters come back lower-case; arrow keys as "up", "down", "left" and
+        "right".
+        """
+        if os.name == 'nt':
+            return self._drain_windows()
+        if self.fd is None:
+            return []
+
+        data = b""
+        while select.select([self.fd], [], [], 0)[0]:
+            chunk = os.read(self.fd, 1024)
+            if not chunk:
+                break  # End of input
+            data += chunk
+        return self._decode(data.decode('utf-8', 'ignore'))
+
+    def _drain_windows(self):
+        keys = []
+        while msvcrt.kbhit():
+            key = msvcrt.getch()
+            if key in (b"\x00", b"\xe0"):
+                # Special keys come as a prefix byte followed by a key code
+                name = WINDOWS_ARROWS.get(msvcrt.getch())
+                if name:
+                    keys.append(name)
+            else:
+                keys.append(key.decode('utf-8', 'ignore').lower())
+        return keys
+
+    @staticmethod
+    def _decode(text):
+        keys = []
+        i = 0
+        while i < len(text):
+            if text.startswith("\x1b[", i) and i + 2 < len(text):
+                name = ANSI_ARROWS.get(text[i + 2])
+                if name:
+                    keys.append(name)
+                i += 3
+                continue
+            keys.append(text[i].lower())
+            i += 1
+        return keys
+
+
+class FrameStats:
+    """Time spent ticking, rendering and idling in the most recent frame, in milliseconds."""
+
+    def __init__(self):
+        self.ticks = 0
+        self.tick_ms = 0.0
+        self.render_ms = 0.0
+        self.idle_ms = 0.0
+
+    def __str__(self):
+        return f"tick {self.tick_ms:5.2f} ms  render {self.render_ms:5.2f} ms  idle {self.idle_ms:6.2f} ms"
+
+
+class GameLoop:
+    """Runs a game with fixed-length simulation ticks and separately paced rendering.
+
+    on_tick(keys) advances the game by one tick, given the keys pressed since
+    the previous tick. render() draws the current state. The loop runs until
+    running() returns False. tick_time may be changed while the loop runs,
+    e.g. to speed a game up.
+    """
+
+    # Give up on catching up after this many ticks in one frame, rather than never drawing again
+    MAX_TICKS_PER_FRAME = 5
+
+    def __init__(self, tick_time, on_tick, render, running, max_fps=30):
+        self.tick_time = tick_time
+        self.on_tick = on_tick
+        self.render = render
+        self.running = running
+        self.frame_time = 1.0 / max_fps
+        self.stats = FrameStats()
+
+    def run(self):
+        """Run the loop until the game stops, restoring the terminal afterwards."""
+        with KeyReader() as keys:
+            previous = time.perf_counter()
+            last_render = previous - self.frame_time
+            lag = 0.0
+
+            while self.running():
+                frame_start = time.perf_counter()
+                lag += frame_start - previous
+                previous = frame_start
+
+                # Pay for as many whole ticks as the elapsed time allows
+                ticks = 0
+                while lag >= self.tick_time and self.running():
+                    self.on_tick(keys.drain())
+                    lag -= self.tick_time
+                    ticks += 1
+                    if ticks == self.MAX_TICKS_PER_FRAME:
+                        lag = 0.0
+                        break
+
+                # Draw each new game state, and otherwise at the frame rate
+                tick_end = time.perf_counter()
+                if ticks or tick_end - last_render >= self.frame_time:
+                    self.render()
+                    last_render = tick_end
+                render_end = time.perf_counter()
+
+                # Sleep until the next tick is due or the next frame may be drawn
+                wake = min(frame_start + self.tick_time - lag, last_render + self.frame_time)
+                idle = wake - render_end
+                if idle > 0:
+                    time.sleep(idle)
+
+                self.stats.ticks = ticks
+                self.stats.tick_ms = (tick_end - frame_start) * 1000
+                self.stats.render_ms = (render_end - tick_end) * 1000
+                self.stats.idle_ms = max(idle, 0.0) * 1000
@@ -1,16 +1,16 @@
 #!/usr/bin/env python3
-import os
 import random
 import time
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
 
 # Initialize colorama
 colorama.init()
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
-import os
 import sys
 import time
 import random
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
 
 # Initialize colorama
 colorama.init(autoreset=True)
@@ -24,7 +24,7 @@ CARD_COLORS = [
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
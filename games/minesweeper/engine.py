@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Headless Minesweeper engine shared by the terminal and GUI games.
+
+The board is held in two flat bytearrays, one with the number of mines next
+to each cell (or MINE) and one with whether each cell is hidden, revealed or
+flagged. Both have a one-cell border around the board that is never hidden,
+so the eight neighbours of any cell are found by adding fixed offsets to its
+index, without bounds checks. Revealing an empty cell floods outwards with a
+queue instead of recursion, visiting every cell at most once, so boards of
+hundreds of thousands of cells open in a single click without hitting the
+recursion limit. Running counts of revealed cells and flags make the win
+check and the mine and flag counters constant-time.
+"""
+
+import random
+from collections import deque
+
+# Value in `counts` marking a mine
+MINE = 9
+
+# Values in `state`
+HIDDEN = 0
+REVEALED = 1
+FLAGGED = 2
+BORDER = 3
+
+
+class MinesweeperEngine:
+    """Mines, numbers and revealed and flagged cells of one Minesweeper game."""
+
+    def __init__(self, rows, cols, num_mines, seed=None):
+        """Create an empty board; mines are laid by place_mines."""
+        self.rows = rows
+        self.cols = cols
+        self.num_mines = min(num_mines, rows * cols - 1)  # Ensure mines don't exceed board size - 1
+        self.safe_cells = rows * cols - self.num_mines
+        self.rng = random.Random(seed)
+
+        # Cells are indexed (row + 1) * stride + col + 1 in a board with a border
+        self.stride = cols + 2
+        stride = self.stride
+        self.offsets = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        self.reset()
+
+    def reset(self):
+        """Clear the board of mines, flags and revealed cells."""
+        stride = self.stride
+        size = (self.rows + 2) * stride
+        self.counts = bytearray(size)
+        self.state = bytearray(size)
+
+        # The border is never hidden, so flood fills stop at it
+        self.state[:stride] = bytes([BORDER]) * stride
+        self.state[size - stride:] = bytes([BORDER]) * stride
+        self.state[::stride] = bytes([BORDER]) * (self.rows + 2)
+        self.state[stride - 1::stride] = bytes([BORDER]) * (self.rows + 2)
+
+        self.revealed_count = 0
+        self.flag_count = 0
+        self.mines_placed = False
+        self.game_over = False
+        self.win = False
+
+    def index(self, row, col):
+        """Index of a cell in the flat arrays."""
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, index):
+        """Row and column of an index in the flat arrays."""
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def is_valid_cell(self, row, col):
+        """Check if a cell is within the board boundaries."""
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def cells(self):
+        """Indices of every cell on the board, row by row."""
+        stride = self.stride
+        return [i for row in range(1, self.rows + 1) for i in range(row * stride + 1, row * stride + self.cols + 1)]
+
+    def place_mines(self, safe_cell=None):
+        """Lay the mines at random and number the cells around them.
+
+        If a safe cell is given, no mine is placed on it or next to it (or
+        only off the cell itself, when the board is too full to spare its
+        neighbours).
+        """
+        cells = self.cells()
+        if safe_cell is not None:
+            index = self.index(*safe_cell)
+            safe = {index}
+            if len(cells) - 9 >= self.num_mines:
+                safe.update(index + offset for offset in self.offsets)
+            cells = [i for i in cells if i not in safe]
+
+        counts = self.counts
+        offsets = self.offsets
+        mines = self.rng.sample(cells, self.num_mines)
+        for mine in mines:
+            for offset in offsets:
+                counts[mine + offset] += 1
+        for mine in mines:
+            counts[mine] = MINE
+        self.mines_placed = True
+
+    def is_mine(self, row, col):
+        """Check if a cell holds a mine."""
+        return self.counts[self.index(row, col)] == MINE
+
+    def adjacent_mines(self, row, col):
+        """Number of mines next to a cell."""
+        return self.counts[self.index(row, col)]
+
+    def is_revealed(self, row, col):
+        """Check if a cell has been revealed."""
+        return self.state[self.index(row, col)] == REVEALED
+
+    def is_flagged(self, row, col):
+        """Check if a cell has been flagged."""
+        return self.state[self.index(row, col)] == FLAGGED
+
+    def reveal(self, row, col):
+        """Reveal a cell, flooding outwards from it if it has no mines around it.
+
+        Returns the indices of the newly revealed cells, empty if the game is
+        over or the cell is off the board, already revealed or flagged.
+        Revealing a mine ends the game, and so does revealing the last safe
+        cell, which wins it.
+        """
+        if self.game_over or not self.is_valid_cell(row, col):
+            return []
+        index = self.index(row, col)
+        state = self.state
+        if state[index] != HIDDEN:
+            return []
+
+        state[index] = REVEALED
+        revealed = [index]
+        counts = self.counts
+        if counts[index] == MINE:
+            self.revealed_count += 1
+            self.game_over = True
+            return revealed
+
+        if counts[index] == 0:
+            offsets = self.offsets
+            queue = deque([index])
+            while queue:
+                cell = queue.popleft()
+                for offset in offsets:
+                    neighbour = cell + offset
+                    if state[neighbour] == HIDDEN:
+                        # Cells next to an empty cell are never mines
+                        state[neighbour] = REVEALED
+                        revealed.append(neighbour)
+                        if counts[neighbour] == 0:
+                            queue.append(neighbour)
+
+        # No mine has been revealed, or the game would be over
+        self.revealed_count += len(revealed)
+        if self.revealed_count == self.safe_cells:
+            self.win = True
+            self.game_over = True
+        return revealed
+
+    def toggle_flag(self, row, col):
+        """Toggle a flag on or off at a hidden cell; returns whether anything changed."""
+        if not self.is_valid_cell(row, col):
+            return False
+        index = self.index(row, col)
+        if self.state[index] == HIDDEN:
+            self.state[index] = FLAGGED
+            self.flag_count += 1
+        elif self.state[index] == FLAGGED:
+            self.state[index] = HIDDEN
+            self.flag_count -= 1
+        else:
+            return False
+        return True
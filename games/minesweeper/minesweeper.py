@@ -1,17 +1,17 @@
 #!/usr/bin/env python3
-import os
 import sys
 import time
-import random
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
+from games.minesweeper.engine import MinesweeperEngine
 
 # Initialize colorama
 colorama.init(autoreset=True)
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -32,54 +32,13 @@ NUMBER_COLORS = {
     8: Fore.BLACK
 }
 
-class Minesweeper:
+class Minesweeper(MinesweeperEngine):
     def __init__(self, rows, cols, num_mines):
         """Initialize the Minesweeper game."""
-        self.rows = rows
-        self.cols = cols
-        self.num_mines = min(num_mines, rows * cols - 1)  # Ensure mines don't exceed board size - 1
+        super().__init__(rows, cols, num_mines)
         
-        # Create the board
-        self.board = [['0' for _ in range(cols)] for _ in range(rows)]
-        self.revealed = [[False for _ in range(cols)] for _ in range(rows)]
-        self.flagged = [[False for _ in range(cols)] for _ in range(rows)]
-        
-        # Place mines randomly
+        # Place mines randomly and number the cells around them
         self.place_mines()
-        
-        # Calculate numbers for adjacent cells
-        self.calculate_numbers()
-        
-        # Game state
-        self.game_over = False
-        self.win = False
-    
-    def place_mines(self):
-        """Place mines randomly on the board."""
-        mines_placed = 0
-        while mines_placed < self.num_mines:
-            row = random.randint(0, self.rows - 1)
-            col = random.randint(0, self.cols - 1)
-            
-            if self.board[row][col] != 'M':
-                self.board[row][col] = 'M'
-                mines_placed += 1
-    
-    def calculate_numbers(self):
-        """Calculate numbers for cells adjacent to mines."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.board[row][col] == 'M':
-                    continue
-                
-                # Count adjacent mines
-                mines = 0
-                for r in range(max(0, row-1), min(self.rows, row+2)):
-                    for c in range(max(0, col-1), min(self.cols, col+2)):
-                        if self.board[r][c] == 'M':
-                            mines += 1
-                
-                self.board[row][col] = str(mines)
     
     def display_board(self, reveal_all=False):
         """Display the current game board."""
@@ -93,88 +52,44 @@ class Minesweeper:
         for row in range(self.rows):
             print(f"{row+1:2d} | ", end='')
             for col in range(self.cols):
-                if reveal_all and self.board[row][col] == 'M':
+                if reveal_all and self.is_mine(row, col):
                     # Show all mines when game is over
                     print(f"{Fore.RED}M{Style.RESET_ALL} ", end='')
-                elif self.flagged[row][col]:
+                elif self.is_flagged(row, col):
                     # Flagged cell
                     print(f"{Fore.RED}F{Style.RESET_ALL} ", end='')
-                elif not self.revealed[row][col]:
+                elif not self.is_revealed(row, col):
                     # Unrevealed cell
                     print(f"■ ", end='')
-                elif self.board[row][col] == '0':
-                    # Empty cell
-                    print(f"  ", end='')
-                elif self.board[row][col] == 'M':
+                elif self.is_mine(row, col):
                     # Mine (only shown when game is over)
                     print(f"{Fore.RED}M{Style.RESET_ALL} ", end='')
+                elif self.adjacent_mines(row, col) == 0:
+                    # Empty cell
+                    print(f"  ", end='')
                 else:
                     # Number cell
-                    number = int(self.board[row][col])
+                    number = self.adjacent_mines(row, col)
                     color = NUMBER_COLORS.get(number, Fore.WHITE)
                     print(f"{color}{number}{Style.RESET_ALL} ", end='')
             print()
         print()
     
-    def is_valid_cell(self, row, col):
-        """Check if a cell is within the board boundaries."""
-        return 0 <= row < self.rows and 0 <= col < self.cols
-    
     def reveal_cell(self, row, col):
         """Reveal a cell and its adjacent cells if it's empty."""
-        if not self.is_valid_cell(row, col) or self.revealed[row][col] or self.flagged[row][col]:
-            return
-        
-        # Reveal the cell
-        self.revealed[row][col] = True
-        
-        # If it's a mine, game over
-        if self.board[row][col] == 'M':
-            self.game_over = True
-            return
-        
-        # If it's an empty cell, reveal adjacent cells recursively
-        if self.board[row][col] == '0':
-            for r in range(max(0, row-1), min(self.rows, row+2)):
-                for c in range(max(0, col-1), min(self.cols, col+2)):
-                    if (r, c) != (row, col):
-                        self.reveal_cell(r, c)
-    
-    def toggle_flag(self, row, col):
-        """Toggle a flag on or off at the specified cell."""
-        if not self.is_valid_cell(row, col) or self.revealed[row][col]:
-            return
-        
-        self.flagged[row][col] = not self.flagged[row][col]
+        self.reveal(row, col)
     
     def check_win(self):
-        """Check if the player has won."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.board[row][col] != 'M' and not self.revealed[row][col]:
-                    return False
-        
-        self.win = True
-        self.game_over = True
-        return True
+        """Check if the player has won (the engine decides when the last safe cell is revealed)."""
+        return self.win
     
     def get_unrevealed_count(self):
         """Get the number of unrevealed cells."""
-        count = 0
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if not self.revealed[row][col]:
-                    count += 1
-        return count
+        return self.rows * self.cols - self.revealed_count
     
     def get_flags_count(self):
         """Get the number of flagged cells."""
-        count = 0
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.flagged[row][col]:
-                    count += 1
-        return count
+        return self.flag_count
 
 def show_instructions():
     """Display game instructions."""
@@ -1,11 +1,26 @@
 #!/usr/bin/env python3
 import tkinter as tk
 from tkinter import messagebox, Label, Button, Frame, StringVar, IntVar, Radiobutton
-import random
 import time
 import sys
 import os
 
+from games.minesweeper.engine import MinesweeperEngine, MINE, HIDDEN, FLAGGED
+from games.minesweeper.solver import MinesweeperSolver
+
+# Size of a cell on the board canvas, in pixels
+CELL_SIZE = 24
+
+# Largest custom board
+MAX_CUSTOM_SIZE = 100
+
+# Colors of a hinted cell, by kind of hint
+HINT_COLORS = {
+    "safe": "#4CAF50",
+    "mine": "#F44336",
+    "guess": "#FF9800",
+}
+
 class MinesweeperGUI:
     def __init__(self, root):
         self.root = root
@@ -33,16 +48,22 @@ class MinesweeperGUI:
         }
         
         # Game state
-        self.board = []  # Will hold cell values (mines, numbers)
-        self.buttons = []  # Will hold Button widgets
-        self.revealed = []  # Cells that have been revealed
-        self.flagged = []  # Cells that have been flagged
+        self.engine = None  # Mines, numbers, revealed and flagged cells
+        self.cell_items = []  # Canvas rectangle of each cell, by engine index
+        self.text_items = {}  # Canvas text of cells showing a number, flag or mine
         self.game_over = False
         self.first_click = True
         
+        # Solver for hints and guess-free boards
+        self.solver = MinesweeperSolver()
+        self.hint_cell = None  # Engine index of the highlighted cell
+        
         # Create widgets
         self.create_widgets()
         
+        # Key bindings
+        self.root.bind("h", lambda e: self.show_hint())
+        
         # Show welcome screen
         self.show_welcome()
     
@@ -88,6 +109,17 @@ class MinesweeperGUI:
         )
         self.flags_label.pack(side=tk.RIGHT, padx=10)
         
+        # Hints and messages
+        self.hint_var = StringVar(value="")
+        self.hint_label = Label(
+            self.info_frame,
+            textvariable=self.hint_var,
+            font=("Helvetica", 12),
+            bg=self.colors["background"],
+            fg=self.colors["text"]
+        )
+        self.hint_label.pack(side=tk.LEFT, expand=True)
+        
         # Game board frame with scrollbars
         self.board_container = Frame(self.main_frame, bg=self.colors["background"])
         self.board_container.pack(fill=tk.BOTH, expand=True, pady=10)
@@ -112,9 +144,9 @@ class MinesweeperGUI:
         self.h_scrollbar.config(command=self.canvas.xview)
         self.v_scrollbar.config(command=self.canvas.yview)
         
-        # Frame inside canvas for the board
-        self.board_frame = Frame(self.canvas, bg=self.colors["background"])
-        self.canvas.create_window((0, 0), window=self.board_frame, anchor=tk.NW)
+        # Clicks anywhere on the board are mapped to cells by their position
+        self.canvas.bind("<Button-1>", self.on_left_click)
+        self.canvas.bind("<Button-3>", self.on_right_click)
         
         # Difficulty selection frame
         self.difficulty_frame = Frame(self.main_frame, bg=self.colors["background"])
@@ -175,6 +207,45 @@ class MinesweeperGUI:
         )
         self.hard_radio.pack(side=tk.LEFT, padx=5)
         
+        self.custom_radio = Radiobutton(
+            self.difficulty_frame,
+            text="Custom",
+            variable=self.difficulty_var,
+            value="custom",
+            command=self.change_difficulty,
+            bg=self.colors["background"],
+            fg=self.colors["text"],
+            selectcolor="#444444",
+            activebackground=self.colors["background"],
+            activeforeground=self.colors["text"]
+        )
+        self.custom_radio.pack(side=tk.LEFT, padx=5)
+        
+        # Custom board size and mines, applied when Custom is selected
+        self.custom_vars = {}
+        for name, value, upper in (("Rows", 30, MAX_CUSTOM_SIZE), ("Cols", 30, MAX_CUSTOM_SIZE),
+                                   ("Mines", 150, MAX_CUSTOM_SIZE * MAX_CUSTOM_SIZE - 1)):
+            Label(
+                self.difficulty_frame,
+                text=f"{name}:",
+                font=("Helvetica", 12),
+                bg=self.colors["background"],
+                fg=self.colors["text"]
+            ).pack(side=tk.LEFT, padx=(10, 2))
+            
+            self.custom_vars[name] = StringVar(value=str(value))
+            spinbox = tk.Spinbox(
+                self.difficulty_frame,
+                from_=1 if name == "Mines" else 5,
+                to=upper,
+                textvariable=self.custom_vars[name],
+                width=5,
+                font=("Helvetica", 12),
+                command=self.change_custom_board
+            )
+            spinbox.bind("<Return>", lambda event: self.change_custom_board())
+            spinbox.pack(side=tk.LEFT)
+        
         # Control buttons at the bottom
         self.control_frame = Frame(self.main_frame, bg=self.colors["background"])
         self.control_frame.pack(fill=tk.X, pady=10)
@@ -190,6 +261,32 @@ class MinesweeperGUI:
         )
         self.new_game_button.pack(side=tk.LEFT, padx=10)
         
+        # Hint button
+        self.hint_button = Button(
+            self.control_frame,
+            text="Hint",
+            font=("Helvetica", 12),
+            bg="#2196F3",
+            fg="white",
+            command=self.show_hint
+        )
+        self.hint_button.pack(side=tk.LEFT, padx=10)
+        
+        # No-guess mode: boards that can be cleared by logic alone
+        self.no_guess_var = tk.BooleanVar(value=False)
+        self.no_guess_check = tk.Checkbutton(
+            self.control_frame,
+            text="No guessing",
+            variable=self.no_guess_var,
+            font=("Helvetica", 12),
+            bg=self.colors["background"],
+            fg=self.colors["text"],
+            selectcolor="#444444",
+            activebackground=self.colors["background"],
+            activeforeground=self.colors["text"]
+        )
+        self.no_guess_check.pack(side=tk.LEFT, padx=10)
+        
         # Quit button
         self.quit_button = Button(
             self.control_frame,
@@ -208,7 +305,7 @@ class MinesweeperGUI:
         """Show welcome screen and instructions."""
         welcome_window = tk.Toplevel(self.root)
         welcome_window.title("Welcome to Minesweeper")
-        welcome_window.geometry("500x400")
+        welcome_window.geometry("500x460")
         welcome_window.configure(bg=self.colors["background"])
         welcome_window.transient(self.root)
         welcome_window.grab_set()
@@ -241,8 +338,10 @@ class MinesweeperGUI:
             "• Easy: 9x9 grid with 10 mines",
             "• Medium: 16x16 grid with 40 mines",
             "• Hard: 16x30 grid with 99 mines",
+            f"• Custom: up to {MAX_CUSTOM_SIZE}x{MAX_CUSTOM_SIZE} with the mines you choose",
             "",
-            "Your first click is always safe!"
+            "Your first click is always safe! Press H or Hint for a hint,",
+            "and tick No guessing for boards solvable by logic alone."
         ]
         
         for line in instructions:
@@ -271,6 +370,28 @@ class MinesweeperGUI:
         self.difficulty = self.difficulty_var.get()
         self.new_game()
     
+    def change_custom_board(self):
+        """Start a new custom game when the custom size or mines change."""
+        if self.difficulty == "custom":
+            self.new_game()
+    
+    def custom_board(self):
+        """Return the custom rows, columns and mines, keeping them in range."""
+        values = {}
+        for name, var in self.custom_vars.items():
+            try:
+                values[name] = int(var.get())
+            except ValueError:
+                values[name] = 0
+        rows = min(max(values["Rows"], 5), MAX_CUSTOM_SIZE)
+        cols = min(max(values["Cols"], 5), MAX_CUSTOM_SIZE)
+        mines = min(max(values["Mines"], 1), rows * cols - 1)
+        
+        self.custom_vars["Rows"].set(str(rows))
+        self.custom_vars["Cols"].set(str(cols))
+        self.custom_vars["Mines"].set(str(mines))
+        return rows, cols, mines
+    
     def initialize_board(self):
         """Initialize the game board with the selected difficulty."""
         # Set board dimensions and number of mines based on difficulty
@@ -278,87 +399,87 @@ class MinesweeperGUI:
             self.rows, self.cols, self.num_mines = 9, 9, 10
         elif self.difficulty == "medium":
             self.rows, self.cols, self.num_mines = 16, 16, 40
-        else:  # hard
+        elif self.difficulty == "hard":
             self.rows, self.cols, self.num_mines = 16, 30, 99
+        else:  # custom
+            self.rows, self.cols, self.num_mines = self.custom_board()
         
         # Update mines counter
         self.mines_var.set(f"Mines: {self.num_mines}")
         self.flags_var.set("Flags: 0")
         
-        # Clear existing board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
-        
         # Reset game state
-        self.board = [['0' for _ in range(self.cols)] for _ in range(self.rows)]
-        self.buttons = []
-        self.revealed = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        self.flagged = [[False for _ in range(self.cols)] for _ in range(self.rows)]
+        self.engine = MinesweeperEngine(self.rows, self.cols, self.num_mines)
         self.game_over = False
         self.first_click = True
+        self.hint_cell = None
+        self.hint_var.set("")
         
-        # Create buttons for each cell
+        # Draw one rectangle per cell; later updates only recolor them
+        self.canvas.delete("all")
+        self.cell_items = [None] * len(self.engine.state)
+        self.text_items = {}
         for row in range(self.rows):
-            button_row = []
             for col in range(self.cols):
-                button = Button(
-                    self.board_frame,
-                    width=2,
-                    height=1,
-                    bg=self.colors["cell_bg"],
-                    relief=tk.RAISED,
-                    borderwidth=2
+                x, y = col * CELL_SIZE, row * CELL_SIZE
+                self.cell_items[self.engine.index(row, col)] = self.canvas.create_rectangle(
+                    x + 1, y + 1, x + CELL_SIZE - 1, y + CELL_SIZE - 1,
+                    fill=self.colors["cell_bg"],
+                    outline="#555555"
                 )
-                button.grid(row=row, column=col, padx=1, pady=1)
-                button.bind("<Button-1>", lambda event, r=row, c=col: self.left_click(r, c))
-                button.bind("<Button-3>", lambda event, r=row, c=col: self.right_click(r, c))
-                button_row.append(button)
-            self.buttons.append(button_row)
         
         # Update canvas scroll region
-        self.board_frame.update_idletasks()
-        self.canvas.config(scrollregion=self.canvas.bbox("all"))
+        self.canvas.config(scrollregion=(0, 0, self.cols * CELL_SIZE, self.rows * CELL_SIZE))
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
     
-    def place_mines(self, first_row, first_col):
-        """Place mines randomly on the board, avoiding the first clicked cell."""
-        mines_placed = 0
-        while mines_placed < self.num_mines:
-            row = random.randint(0, self.rows - 1)
-            col = random.randint(0, self.cols - 1)
-            
-            # Avoid placing mines at or around the first click
-            if abs(row - first_row) <= 1 and abs(col - first_col) <= 1:
-                continue
-            
-            if self.board[row][col] != 'M':
-                self.board[row][col] = 'M'
-                mines_placed += 1
+    def event_cell(self, event):
+        """Return the row and column of the cell under a mouse event, or None."""
+        col = int(self.canvas.canvasx(event.x) // CELL_SIZE)
+        row = int(self.canvas.canvasy(event.y) // CELL_SIZE)
+        if not self.engine.is_valid_cell(row, col):
+            return None
+        return row, col
     
-    def calculate_numbers(self):
-        """Calculate numbers for cells adjacent to mines."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.board[row][col] == 'M':
-                    continue
-                
-                # Count adjacent mines
-                mines = 0
-                for r in range(max(0, row-1), min(self.rows, row+2)):
-                    for c in range(max(0, col-1), min(self.cols, col+2)):
-                        if self.board[r][c] == 'M':
-                            mines += 1
-                
-                self.board[row][col] = str(mines)
+    def on_left_click(self, event):
+        """Reveal the cell under a left click."""
+        cell = self.event_cell(event)
+        if cell is not None:
+            self.left_click(*cell)
+    
+    def on_right_click(self, event):
+        """Flag the cell under a right click."""
+        cell = self.event_cell(event)
+        if cell is not None:
+            self.right_click(*cell)
+    
+    def set_cell_text(self, index, text, color):
+        """Show text on a cell, creating its text item the first time."""
+        item = self.text_items.get(index)
+        if item is None:
+            row, col = self.engine.position(index)
+            self.text_items[index] = self.canvas.create_text(
+                col * CELL_SIZE + CELL_SIZE // 2,
+                row * CELL_SIZE + CELL_SIZE // 2,
+                text=text,
+                fill=color,
+                font=("Helvetica", 11, "bold")
+            )
+        else:
+            self.canvas.itemconfig(item, text=text, fill=color)
     
     def left_click(self, row, col):
         """Handle left click on a cell (reveal)."""
-        if self.game_over or self.flagged[row][col]:
+        if self.game_over or self.engine.is_flagged(row, col):
             return
+        self.clear_hint()
         
-        # First click is always safe
+        # First click is always safe: no mines at or around it
         if self.first_click:
-            self.place_mines(row, col)
-            self.calculate_numbers()
+            if self.no_guess_var.get():
+                self.place_solvable_mines(row, col)
+            else:
+                self.engine.place_mines(safe_cell=(row, col))
             self.first_click = False
         
         self.reveal_cell(row, col)
@@ -369,22 +490,20 @@ class MinesweeperGUI:
             self.show_all_mines()
             messagebox.showinfo("Congratulations", "You found all the mines!")
     
-    def right_click(self, event, row, col):
+    def right_click(self, row, col):
         """Handle right click on a cell (flag)."""
-        if self.game_over or self.revealed[row][col]:
+        if self.game_over or not self.engine.toggle_flag(row, col):
             return
+        self.clear_hint()
         
-        # Toggle flag
-        self.flagged[row][col] = not self.flagged[row][col]
-        
-        if self.flagged[row][col]:
-            self.buttons[row][col].config(text="🚩", fg=self.colors["flag"])
+        index = self.engine.index(row, col)
+        if self.engine.is_flagged(row, col):
+            self.set_cell_text(index, "🚩", self.colors["flag"])
         else:
-            self.buttons[row][col].config(text="")
+            self.set_cell_text(index, "", self.colors["flag"])
         
         # Update flag counter
-        flag_count = sum(sum(row) for row in self.flagged)
-        self.flags_var.set(f"Flags: {flag_count}")
+        self.flags_var.set(f"Flags: {self.engine.flag_count}")
         
         # Check if game is won
         if self.check_win():
@@ -392,68 +511,102 @@ class MinesweeperGUI:
             self.show_all_mines()
             messagebox.showinfo("Congratulations", "You found all the mines!")
     
-    def reveal_cell(self, row, col):
-        """Reveal a cell and its adjacent cells if it's empty."""
-        if not self.is_valid_cell(row, col) or self.revealed[row][col] or self.flagged[row][col]:
+    def place_solvable_mines(self, row, col):
+        """Lay mines that can all be found by logic from the first click."""
+        self.root.config(cursor="watch")
+        self.root.update_idletasks()
+        try:
+            found = self.solver.place_solvable_mines(self.engine, (row, col))
+        finally:
+            self.root.config(cursor="")
+        
+        if not found:
+            self.hint_var.set("No guess-free board found in time; this one may need a guess")
+    
+    def show_hint(self):
+        """Highlight a safe cell, a mine, or the best guess, and say which it is."""
+        if self.game_over:
+            return
+        if self.first_click:
+            self.hint_var.set("Hint: click anywhere, the first click is always safe")
             return
         
-        # Reveal the cell
-        self.revealed[row][col] = True
-        
-        # Update button appearance
-        button = self.buttons[row][col]
-        button.config(relief=tk.SUNKEN, bg=self.colors["revealed_bg"])
-        
-        # If it's a mine, game over
-        if self.board[row][col] == 'M':
-            button.config(text="💣", fg=self.colors["mine"])
+        hint = self.solver.hint(self.engine)
+        if hint is None:
+            return
+        index, kind, probability = hint
+        row, col = self.engine.position(index)
+        
+        self.clear_hint()
+        self.hint_cell = index
+        self.canvas.itemconfig(self.cell_items[index], fill=HINT_COLORS[kind])
+        self.scroll_to_cell(row, col)
+        
+        if kind == "safe":
+            self.hint_var.set(f"Hint: row {row + 1}, column {col + 1} is safe")
+        elif kind == "mine":
+            self.hint_var.set(f"Hint: row {row + 1}, column {col + 1} is a mine")
+        else:
+            self.hint_var.set(f"Hint: no safe cell; row {row + 1}, column {col + 1} "
+                              f"is the best guess ({probability:.0%} mine)")
+    
+    def clear_hint(self):
+        """Remove the hint highlight and message."""
+        if self.hint_cell is not None:
+            if self.engine.state[self.hint_cell] in (HIDDEN, FLAGGED):
+                self.canvas.itemconfig(self.cell_items[self.hint_cell], fill=self.colors["cell_bg"])
+            self.hint_cell = None
+        self.hint_var.set("")
+    
+    def scroll_to_cell(self, row, col):
+        """Scroll a board larger than the view to bring a cell to the middle."""
+        left, right = self.canvas.xview()
+        top, bottom = self.canvas.yview()
+        self.canvas.xview_moveto((col + 0.5) / self.cols - (right - left) / 2)
+        self.canvas.yview_moveto((row + 0.5) / self.rows - (bottom - top) / 2)
+    
+    def reveal_cell(self, row, col):
+        """Reveal a cell and its adjacent cells if it's empty."""
+        engine = self.engine
+        revealed = engine.reveal(row, col)
+        
+        # Recolor every cell the flood fill opened in one pass; Tk redraws
+        # the canvas once afterwards
+        itemconfig = self.canvas.itemconfig
+        revealed_bg = self.colors["revealed_bg"]
+        numbers = self.colors["numbers"]
+        for index in revealed:
+            itemconfig(self.cell_items[index], fill=revealed_bg)
+            number = engine.counts[index]
+            if number and number != MINE:
+                self.set_cell_text(index, str(number), numbers[min(number, len(numbers)) - 1])
+        
+        # If it's a mine, game over; the clicked cell decides, not the game state
+        if revealed and engine.counts[revealed[0]] == MINE:
+            self.set_cell_text(revealed[0], "💣", self.colors["mine"])
             self.game_over = True
             self.show_all_mines()
             messagebox.showinfo("Game Over", "You hit a mine!")
-            return
-        
-        # If it's a number, show it
-        if self.board[row][col] != '0':
-            number = int(self.board[row][col])
-            color_idx = min(number - 1, len(self.colors["numbers"]) - 1)
-            button.config(text=str(number), fg=self.colors["numbers"][color_idx])
-        
-        # If it's an empty cell, reveal adjacent cells recursively
-        if self.board[row][col] == '0':
-            for r in range(max(0, row-1), min(self.rows, row+2)):
-                for c in range(max(0, col-1), min(self.cols, col+2)):
-                    if (r, c) != (row, col):
-                        self.reveal_cell(r, c)
-    
-    def is_valid_cell(self, row, col):
-        """Check if a cell is within the board boundaries."""
-        return 0 <= row < self.rows and 0 <= col < self.cols
     
     def check_win(self):
         """Check if the player has won."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                # If a non-mine cell is still hidden, game is not won
-                if self.board[row][col] != 'M' and not self.revealed[row][col]:
-                    return False
-                
-                # If a mine is not flagged, game is not won
-                if self.board[row][col] == 'M' and not self.flagged[row][col]:
-                    return False
-        
-        return True
+        # Every safe cell must be revealed and every mine flagged. Flags can only
+        # sit on hidden cells, so once the safe cells are all revealed the flags
+        # are all on mines, and there are as many of them as mines
+        return self.engine.win and self.engine.flag_count == self.num_mines
     
     def show_all_mines(self):
         """Reveal all mines on the board."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.board[row][col] == 'M':
-                    if not self.flagged[row][col]:
-                        # Show unflagged mines
-                        self.buttons[row][col].config(text="💣", fg=self.colors["mine"])
-                elif self.flagged[row][col]:
-                    # Show incorrectly flagged cells
-                    self.buttons[row][col].config(text="❌", fg=self.colors["mine"])
+        counts = self.engine.counts
+        state = self.engine.state
+        for index in self.engine.cells():
+            if counts[index] == MINE:
+                if state[index] != FLAGGED:
+                    # Show unflagged mines
+                    self.set_cell_text(index, "💣", self.colors["mine"])
+            elif state[index] == FLAGGED:
+                # Show incorrectly flagged cells
+                self.set_cell_text(index, "❌", self.colors["mine"])
     
     def new_game(self):
         """Start a new game with the current difficulty."""
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Minesweeper solver for hints and guess-free boards.
+
+Every revealed number gives a constraint: the hidden cells around it hold
+exactly that many mines. Most moves follow from one constraint, or from one
+constraint whose cells contain another's; these deductions are repeated
+until they prove nothing more, and the cells they settle are taken out of
+the constraints. The constraints left that share hidden cells are grouped
+into connected components along the frontier, and each component's
+solutions are enumerated by backtracking, counted by the number of mines
+they use. Cells that are a mine in every solution of their component, or in
+none, are certain. Exact probabilities then weigh each component's
+solutions by the ways the other components and the cells off the frontier
+can hold the rest of the mines, from binomial coefficients that are
+memoized as the same ones come up over and over.
+
+A board can be played without guessing if revealing its first cell and then
+only cells the solver proves safe clears the whole board. The generator lays
+mines again until it finds such a board or runs out of time.
+"""
+
+import time
+from functools import lru_cache
+
+from games.minesweeper.engine import MinesweeperEngine, MINE, HIDDEN, REVEALED, FLAGGED
+
+# Backtracking steps allowed per component before giving up on it
+MAX_NODES = 200000
+
+# Components remembered between solves, as most of the frontier is unchanged by a move
+MAX_CACHED_COMPONENTS = 10000
+
+# Time allowed to find a guess-free board: a base plus a share per cell, up to a cap
+NO_GUESS_BASE_TIME = 0.5
+NO_GUESS_TIME_PER_CELL = 0.002
+NO_GUESS_MAX_TIME = 5.0
+
+
+@lru_cache(maxsize=None)
+def binomial(n, k):
+    """Ways to choose k of n cells; 0 if k is out of range."""
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    ways = 1
+    for i in range(1, k + 1):
+        ways = ways * (n - k + i) // i  # Stays exact: the running product is C(n - k + i, i)
+    return ways
+
+
+def multiply(a, b):
+    """Product of two polynomials given as coefficient lists (by number of mines)."""
+    product = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                product[i + j] += x * y
+    return product
+
+
+def no_guess_time_limit(rows, cols):
+    """Time budget for generating a guess-free board of the given size."""
+    return min(NO_GUESS_BASE_TIME + NO_GUESS_TIME_PER_CELL * rows * cols, NO_GUESS_MAX_TIME)
+
+
+class MinesweeperSolver:
+    """Finds safe cells, mines and mine probabilities from what a board shows."""
+
+    def __init__(self, max_nodes=MAX_NODES):
+        self.max_nodes = max_nodes
+        self.cache = {}
+
+        # Statistics of the last solve or generated board
+        self.components = 0
+        self.nodes = 0
+        self.attempts = 0
+
+    def constraints(self, engine, known_mines, boundary):
+        """Constraints from the revealed numbers, as (hidden cells, mines among them)."""
+        counts = engine.counts
+        state = engine.state
+        offsets = engine.offsets
+        constraints = set()
+        for cell in boundary:
+            value = counts[cell]
+            unknown = []
+            for offset in offsets:
+                neighbour = cell + offset
+                if state[neighbour] == HIDDEN or state[neighbour] == FLAGGED:
+                    if neighbour in known_mines:
+                        value -= 1
+                    else:
+                        unknown.append(neighbour)
+            if unknown:
+                constraints.add((tuple(unknown), value))
+        return constraints
+
+    def simple_deductions(self, constraints):
+        """Cells proven safe or mines by single constraints or pairs where one contains the other."""
+        safe = set()
+        mines = set()
+        by_cell = {}
+        for constraint in constraints:
+            cells, value = constraint
+            if value == 0:
+                safe.update(cells)
+            elif value == len(cells):
+                mines.update(cells)
+            for cell in cells:
+                by_cell.setdefault(cell, []).append(constraint)
+
+        for cells, value in constraints:
+            inner = set(cells)
+            for other, other_value in by_cell[cells[0]]:
+                if len(other) <= len(cells) or not inner.issubset(other):
+                    continue
+                # The other constraint's extra cells hold the difference in mines
+                extra = [cell for cell in other if cell not in inner]
+                difference = other_value - value
+                if difference == 0:
+                    safe.update(extra)
+                elif difference == len(extra):
+                    mines.update(extra)
+        return safe, mines
+
+    def reduce(self, constraints, safe, mines):
+        """Take cells known to be safe or mines out of the constraints."""
+        reduced = set()
+        for cells, value in constraints:
+            rest = tuple(cell for cell in cells if cell not in safe and cell not in mines)
+            if rest:
+                reduced.add((rest, value - sum(cell in mines for cell in cells)))
+        return reduced
+
+    def split_components(self, constraints):
+        """Group constraints that share cells; returns lists of constraints."""
+        by_cell = {}
+        for constraint in constraints:
+            for cell in constraint[0]:
+                by_cell.setdefault(cell, []).append(constraint)
+
+        components = []
+        seen = set()
+        for constraint in constraints:
+            if constraint in seen:
+                continue
+            seen.add(constraint)
+            component = [constraint]
+            for current in component:  # Grows while it is walked
+                for cell in current[0]:
+                    for other in by_cell[cell]:
+                        if other not in seen:
+                            seen.add(other)
+                            component.append(other)
+            components.append(component)
+        return components
+
+    def enumerate_component(self, component):
+        """Count the solutions of one component by the number of mines they use.
+
+        Returns the component's cells, the number of solutions for each mine
+        count and, for each mine count, how many of those solutions put a mine
+        on each cell. Returns None if the search takes more than max_nodes steps.
+        """
+        key = tuple(sorted(component))
+        if key in self.cache:
+            return self.cache[key]
+
+        # Order the cells constraint by constraint, so constraints close early
+        variables = []
+        position = {}
+        for cells, _ in component:
+            for cell in cells:
+                if cell not in position:
+                    position[cell] = len(variables)
+                    variables.append(cell)
+        n = len(variables)
+
+        need = [value for _, value in component]  # Mines still to place per constraint
+        left = [len(cells) for cells, _ in component]  # Cells still unassigned per constraint
+        var_constraints = [[] for _ in range(n)]
+        for c, (cells, _) in enumerate(component):
+            for cell in cells:
+                var_constraints[position[cell]].append(c)
+
+        weights = {}
+        tallies = {}
+        result = (variables, weights, tallies)
+        if any(need[c] < 0 or need[c] > left[c] for c in range(len(component))):
+            self.store(key, result)
+            return result  # No solutions
+
+        # Iterative backtracking: stack holds the values of cells 0..i-1
+        stack = []
+        mines = 0
+        i, value = 0, 0
+        nodes = 0
+        while True:
+            if i < n:
+                nodes += 1
+                if nodes > self.max_nodes:
+                    self.nodes += nodes
+                    self.store(key, None)
+                    return None
+
+                feasible = True
+                for c in var_constraints[i]:
+                    need[c] -= value
+                    left[c] -= 1
+                    if need[c] < 0 or need[c] > left[c]:
+                        feasible = False
+                if feasible:
+                    stack.append(value)
+                    mines += value
+                    i += 1
+                    value = 0
+                    continue
+                for c in var_constraints[i]:
+                    need[c] += value
+                    left[c] += 1
+                if value == 0:
+                    value = 1
+                    continue
+            else:
+                # A solution: every cell is assigned
+                weights[mines] = weights.get(mines, 0) + 1
+                tally = tallies.get(mines)
+                if tally is None:
+                    tally = tallies[mines] = [0] * n
+                for j, assigned in enumerate(stack):
+                    if assigned:
+                        tally[j] += 1
+
+            # Go back to the last cell set to 0 and try a mine there instead
+            while stack:
+                i -= 1
+                assigned = stack.pop()
+                mines -= assigned
+                for c in var_constraints[i]:
+                    need[c] += assigned
+                    left[c] += 1
+                if assigned == 0:
+                    value = 1
+                    break
+            else:
+                break
+
+        self.nodes += nodes
+        self.store(key, result)
+        return result
+
+    def store(self, key, result):
+        """Remember a component's solutions, forgetting them all when the cache is full."""
+        if len(self.cache) >= MAX_CACHED_COMPONENTS:
+            self.cache.clear()
+        self.cache[key] = result
+
+    def solve(self, engine, known_mines=frozenset(), boundary=None, probabilities=True):
+        """Work out what can be known about the hidden cells of a board.
+
+        known_mines are cells already proven to be mines; flags are not trusted.
+        boundary, if given, holds the revealed numbered cells that may still
+        have hidden neighbours, to save scanning the board for them.
+
+        Returns the set of cells certain to be safe, the set certain to be
+        mines (besides known_mines), and a dict of the mine probability of
+        every hidden cell. With probabilities=False, the dict is None and the
+        search stops at the first step that proves anything: single
+        constraints and pairs, then the components, then the mine count.
+        """
+        counts = engine.counts
+        state = engine.state
+        if boundary is None:
+            boundary = [i for i in engine.cells() if state[i] == REVEALED and 0 < counts[i] < MINE]
+        self.nodes = 0
+        constraints = self.constraints(engine, known_mines, boundary)
+
+        # Settle what single constraints and pairs prove, and take it out of
+        # the constraints, which splits and shrinks the components
+        safe = set()
+        mines = set()
+        while True:
+            new_safe, new_mines = self.simple_deductions(constraints)
+            new_safe -= safe
+            new_mines -= mines
+            if not new_safe and not new_mines:
+                break
+            safe |= new_safe
+            mines |= new_mines
+            constraints = self.reduce(constraints, new_safe, new_mines)
+        if not probabilities and (safe or mines):
+            self.components = 0
+            return safe, mines, None
+        deduced_safe = set(safe)
+        deduced_mines = set(mines)
+
+        components = self.split_components(constraints)
+        self.components = len(components)
+
+        solved = []
+        frontier = set()
+        for component in components:
+            result = self.enumerate_component(component)
+            if result is None:
+                continue  # Too big: treated like the cells off the frontier
+            variables, weights, tallies = result
+            solutions = sum(weights.values())
+            if not solutions:
+                continue  # Contradicts known_mines
+            solved.append(result)
+            frontier.update(variables)
+            for j, cell in enumerate(variables):
+                mined = sum(tally[j] for tally in tallies.values())
+                if mined == 0:
+                    safe.add(cell)
+                elif mined == solutions:
+                    mines.add(cell)
+
+        if not probabilities and (safe or mines):
+            return safe, mines, None  # The mine count isn't needed
+
+        # The cells off the frontier share the mines the components don't use
+        others = [i for i in engine.cells()
+                  if (state[i] == HIDDEN or state[i] == FLAGGED) and i not in frontier and i not in known_mines
+                  and i not in deduced_safe and i not in deduced_mines]
+        free = len(others)
+        remaining = engine.num_mines - len(known_mines) - len(deduced_mines)
+
+        polynomials = [[weights.get(k, 0) for k in range(max(weights) + 1)] for _, weights, _ in solved]
+        prefix = [[1]]
+        for polynomial in polynomials:
+            prefix.append(multiply(prefix[-1], polynomial))
+        suffix = [[1]]
+        for polynomial in reversed(polynomials):
+            suffix.append(multiply(suffix[-1], polynomial))
+        suffix.reverse()
+
+        total = sum(ways * binomial(free, remaining - k) for k, ways in enumerate(prefix[-1]))
+        if not total:
+            return safe, mines, ({} if probabilities else None)  # The board contradicts known_mines
+
+        probability = dict.fromkeys(deduced_safe, 0)
+        probability.update(dict.fromkeys(deduced_mines, total))
+        for c, (variables, weights, tallies) in enumerate(solved):
+            rest = multiply(prefix[c], suffix[c + 1])
+            for k, tally in tallies.items():
+                # Arrangements of everything else when this component uses k mines
+                ways = sum(count * binomial(free, remaining - k - j) for j, count in enumerate(rest))
+                for j, cell in enumerate(variables):
+                    probability[cell] = probability.get(cell, 0) + tally[j] * ways
+        if free:
+            mined = sum(ways * binomial(free - 1, remaining - k - 1) for k, ways in enumerate(prefix[-1]))
+            for cell in others:
+                probability[cell] = mined
+
+        for cell, mined in probability.items():
+            if mined == 0:
+                safe.add(cell)
+            elif mined == total:
+                mines.add(cell)
+
+        if not probabilities:
+            return safe, mines, None
+        return safe, mines, {cell: mined / total for cell, mined in probability.items()}
+
+    def hint(self, engine):
+        """Suggest a move as (cell index, kind, mine probability).
+
+        kind is "safe" for a cell certain to be safe, "mine" for an unflagged
+        cell certain to be a mine, or "guess" for the hidden cell least likely
+        to be a mine when nothing is certain. Returns None if no cell is hidden.
+        """
+        state = engine.state
+
+        # Try the quick deductions before working out every probability
+        for probabilities in (False, True):
+            safe, mines, probability = self.solve(engine, probabilities=probabilities)
+            safe = sorted(cell for cell in safe if state[cell] == HIDDEN)
+            if safe:
+                return safe[0], "safe", 0.0
+            mines = sorted(cell for cell in mines if state[cell] == HIDDEN)
+            if mines:
+                return mines[0], "mine", 1.0
+
+        guesses = [(p, cell) for cell, p in probability.items() if state[cell] == HIDDEN]
+        if not guesses:
+            return None
+        p, cell = min(guesses)
+        return cell, "guess", p
+
+    def is_solvable(self, engine, start, deadline=None):
+        """Check if a board can be cleared from its start cell without guessing.
+
+        Plays a copy of the board, revealing only cells the solver proves
+        safe. Gives up (returning False) if the deadline passes.
+        """
+        board = MinesweeperEngine(engine.rows, engine.cols, engine.num_mines)
+        board.counts[:] = engine.counts
+        board.mines_placed = True
+        counts = board.counts
+        state = board.state
+        offsets = board.offsets
+
+        boundary = {cell for cell in board.reveal(*start) if counts[cell]}
+        known_mines = set()
+        while not board.game_over:
+            if deadline is not None and time.perf_counter() > deadline:
+                return False
+
+            # Numbers with nothing unknown left around them no longer tell anything
+            boundary = {cell for cell in boundary
+                        if any(state[cell + offset] == HIDDEN and cell + offset not in known_mines
+                               for offset in offsets)}
+            safe, mines, _ = self.solve(board, known_mines, boundary, probabilities=False)
+            if not safe and not mines:
+                return False
+
+            known_mines |= mines
+            for cell in safe:
+                row, col = board.position(cell)
+                boundary.update(i for i in board.reveal(row, col) if counts[i])
+        return board.win
+
+    def place_solvable_mines(self, engine, safe_cell, time_limit=None):
+        """Lay mines again and again until the board can be cleared without guessing.
+
+        The first click at safe_cell is always safe. Returns whether a
+        guess-free board was found before the time limit (by default, one
+        scaled to the board size); otherwise the last board laid is kept.
+        """
+        if time_limit is None:
+            time_limit = no_guess_time_limit(engine.rows, engine.cols)
+        deadline = time.perf_counter() + time_limit
+
+        self.attempts = 0
+        while True:
+            engine.reset()
+            engine.place_mines(safe_cell)
+            self.attempts += 1
+            if self.is_solvable(engine, safe_cell, deadline):
+                return True
+            if time.perf_counter() > deadline:
+                return False
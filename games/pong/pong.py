@@ -1,54 +1,32 @@
 #!/usr/bin/env python3
-import os
 import sys
 import time
 import random
 import colorama
 from colorama import Fore, Back, Style
-
-# Platform-specific imports
-if os.name == 'nt':
-    import msvcrt
-else:
-    import select
-    import tty
-    import termios
+from games import terminal
+from games.game_loop import GameLoop
 
 # Initialize colorama
 colorama.init(autoreset=True)
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
+
+HEADER_STYLE = Back.GREEN + Fore.WHITE
+HEADER = [
+    "╔═══════════════════════════════════════════════════════════════╗",
+    "║                        PONG                                  ║",
+    "╚═══════════════════════════════════════════════════════════════╝",
+]
 
 def print_header():
     """Print the game header."""
-    print(f"{Back.GREEN}{Fore.WHITE}╔═══════════════════════════════════════════════════════════════╗{Style.RESET_ALL}")
-    print(f"{Back.GREEN}{Fore.WHITE}║                        PONG                                  ║{Style.RESET_ALL}")
-    print(f"{Back.GREEN}{Fore.WHITE}╚═══════════════════════════════════════════════════════════════╝{Style.RESET_ALL}")
+    for line in HEADER:
+        print(f"{HEADER_STYLE}{line}{Style.RESET_ALL}")
     print()
 
-def is_key_pressed():
-    """Check if a key has been pressed."""
-    if os.name == 'nt':
-        return msvcrt.kbhit()
-    else:
-        dr, dw, de = select.select([sys.stdin], [], [], 0)
-        return dr != []
-
-def get_key():
-    """Get a single key press."""
-    if os.name == 'nt':
-        return msvcrt.getch().decode('utf-8').lower()
-    else:
-        old_settings = termios.tcgetattr(sys.stdin)
-        try:
-            tty.setcbreak(sys.stdin.fileno())
-            key = sys.stdin.read(1)
-            return key.lower()
-        finally:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-
 class Pong:
     def __init__(self, width=60, height=20):
         """Initialize the Pong game."""
@@ -162,50 +140,54 @@ class Pong:
             elif paddle_center > ball_target + 1:
                 self.move_right_paddle("up")
 
-    def draw(self):
-        """Draw the game board."""
-        # Create an empty board
-        board = [[" " for _ in range(self.width)] for _ in range(self.height)]
+    def screen_size(self):
+        """Return the width and height of the screen the game draws on."""
+        return max(len(HEADER[0]), self.width + 2), len(HEADER) + self.height + 7
+
+    def draw(self, screen, stats=None):
+        """Draw the header and game board into the screen's back buffer."""
+        screen.clear()
+        for row, line in enumerate(HEADER):
+            screen.text(0, row, line, HEADER_STYLE)
+
+        # Scores
+        top = len(HEADER) + 1
+        score = f"Player 1: {self.left_score} "
+        screen.text(0, top, score, Fore.CYAN)
+        screen.text(len(score), top, "|", Fore.WHITE)
+        screen.text(len(score) + 1, top, f" Player 2: {self.right_score}", Fore.CYAN)
+
+        # Border
+        top += 1
+        screen.text(0, top, f"╔{'═' * self.width}╗", Fore.WHITE)
+        for y in range(self.height):
+            screen.put(0, top + 1 + y, "║", Fore.WHITE)
+            screen.put(self.width + 1, top + 1 + y, "║", Fore.WHITE)
+        screen.text(0, top + self.height + 1, f"╚{'═' * self.width}╝", Fore.WHITE)
 
         # Draw the paddles
         for i in range(self.paddle_height):
             if 0 <= self.left_paddle_y + i < self.height:
-                board[self.left_paddle_y + i][0] = "█"
+                screen.put(1, top + 1 + self.left_paddle_y + i, "█", Fore.GREEN)
             if 0 <= self.right_paddle_y + i < self.height:
-                board[self.right_paddle_y + i][self.width - 1] = "█"
+                screen.put(self.width, top + 1 + self.right_paddle_y + i, "█", Fore.GREEN)
 
         # Draw the ball
         if 0 <= self.ball_y < self.height and 0 <= self.ball_x < self.width:
-            board[self.ball_y][self.ball_x] = "●"
+            screen.put(1 + self.ball_x, top + 1 + self.ball_y, "●", Fore.YELLOW)
 
         # Draw the center line
         for i in range(0, self.height, 2):
-            board[i][self.width // 2] = "│"
+            screen.put(1 + self.width // 2, top + 1 + i, "│", Fore.WHITE)
 
-        # Print the scores and the board
-        print(f"{Fore.CYAN}Player 1: {self.left_score} {Fore.WHITE}|{Fore.CYAN} Player 2: {self.right_score}{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}╔{'═' * self.width}╗{Style.RESET_ALL}")
-        
-        for row in board:
-            print(f"{Fore.WHITE}║{Style.RESET_ALL}", end="")
-            for cell in row:
-                if cell == "█":  # Paddle
-                    print(f"{Fore.GREEN}{cell}{Style.RESET_ALL}", end="")
-                elif cell == "●":  # Ball
-                    print(f"{Fore.YELLOW}{cell}{Style.RESET_ALL}", end="")
-                elif cell == "│":  # Center line
-                    print(f"{Fore.WHITE}{cell}{Style.RESET_ALL}", end="")
-                else:
-                    print(cell, end="")
-            print(f"{Fore.WHITE}║{Style.RESET_ALL}")
-        
-        print(f"{Fore.WHITE}╚{'═' * self.width}╝{Style.RESET_ALL}")
-        
         # Instructions
-        print(f"{Fore.CYAN}Controls: [W/S] - Move left paddle, [P] - Pause, [Q] - Quit{Style.RESET_ALL}")
-        
+        bottom = top + self.height + 2
+        screen.text(0, bottom, "Controls: [W/S] - Move left paddle, [P] - Pause, [Q] - Quit", Fore.CYAN)
+
         if self.pause:
-            print(f"{Fore.YELLOW}PAUSED - Press [Space] to continue{Style.RESET_ALL}")
+            screen.text(0, bottom + 1, "PAUSED - Press [Space] to continue", Fore.YELLOW)
+
+        screen.text(0, bottom + 2, f"FPS: {screen.fps.fps:.1f}  {stats or ''}", Fore.WHITE)
 
 def show_instructions():
     """Display game instructions."""
@@ -273,49 +255,53 @@ def main():
         game.ai_difficulty = difficulty
         game.paddle_height = paddle_height
         
-        frame_time = 0.1  # seconds per frame
+        tick_time = 0.1  # seconds per game tick
         unpause_time = 0
+        screen = terminal.Screen(*game.screen_size())
+        
+        def on_tick(keys):
+            """Apply the keys pressed since the last tick, then advance the game."""
+            nonlocal unpause_time
+            
+            # Handle input
+            for key in keys:
+                if key == 'q':
+                    raise KeyboardInterrupt
+                elif key == 'w':
+                    game.move_left_paddle("up")
+                elif key == 's':
+                    game.move_left_paddle("down")
+                elif key == 'p':
+                    game.pause = not game.pause
+                elif key == ' ' and game.pause:
+                    game.pause = False
+            
+            # Move AI paddle
+            game.move_ai()
+            
+            # Update ball position
+            if game.pause and time.time() > unpause_time:
+                game.pause = False
+            
+            game.update_ball()
+            
+            # Set unpause time if ball was reset
+            if game.pause:
+                unpause_time = time.time() + 1.5
+        
+        def render():
+            game.draw(screen, loop.stats)
+            screen.present()
+        
+        loop = GameLoop(tick_time, on_tick, render, lambda: not game.game_over)
         
         # Game loop
         try:
-            while not game.game_over:
-                clear_screen()
-                print_header()
-                game.draw()
-                
-                # Handle input
-                if is_key_pressed():
-                    key = get_key()
-                    if key == 'q':
-                        raise KeyboardInterrupt
-                    elif key == 'w':
-                        game.move_left_paddle("up")
-                    elif key == 's':
-                        game.move_left_paddle("down")
-                    elif key == 'p':
-                        game.pause = not game.pause
-                    elif key == ' ' and game.pause:
-                        game.pause = False
-                
-                # Move AI paddle
-                game.move_ai()
-                
-                # Update ball position
-                if game.pause and time.time() > unpause_time:
-                    game.pause = False
-                
-                game.update_ball()
-                
-                # Set unpause time if ball was reset
-                if game.pause:
-                    unpause_time = time.time() + 1.5
-                
-                time.sleep(frame_time)
+            loop.run()
             
             # Game over
-            clear_screen()
-            print_header()
-            game.draw()
+            render()
+            screen.close()
             if game.winner == "Player 1":
                 print(f"{Fore.GREEN}Congratulations! You win!{Style.RESET_ALL}")
             else:
@@ -327,6 +313,7 @@ def main():
                 break
         
         except KeyboardInterrupt:
+            screen.close()
             clear_screen()
             print_header()
             print(f"{Fore.GREEN}Game aborted.{Style.RESET_ALL}")
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 import random
-import os
 import time
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
 
 # Initialize colorama
 colorama.init()
@@ -41,7 +41,7 @@ CHOICE_ART = {
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -5,6 +5,7 @@ import time
 import random
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
 
 # Platform-specific imports
 if os.name == 'nt':
@@ -19,7 +20,7 @@ colorama.init(autoreset=True)
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Snake autopilot that never crashes: BFS shortcuts along a Hamiltonian cycle.
+
+A Hamiltonian cycle visits every cell of the board once, so a snake that
+just follows it can never run into itself. Following it is slow, though, so
+the autopilot looks for shortcuts to the food with a breadth-first search.
+The search only moves forward along the cycle and stays in the stretch of
+empty cells between the head and the tail, which keeps the body in cycle
+order. While the body is in order the plain cycle is always a way out, so
+every shortcut is safe.
+
+A path is planned once per piece of food and followed as the body moves.
+Cells ahead of the head only get emptier as the tail follows, so the path
+stays safe and there is nothing to recompute until the food is eaten. If
+the food lies behind the head, beside the body, the snake follows the cycle
+and plans as soon as the tail has passed the food, which is an O(1) check
+per move.
+"""
+
+import time
+from collections import deque
+
+
+def hamiltonian_cycle(width, height):
+    """Return a cycle through every cell of a wrapping board, as a list of (x, y).
+
+    Column 0 is the way back up; the rest of the board is swept row by row.
+    That needs an even number of rows, so with an odd number the last row is
+    spliced in between (0, 0) and (1, 0), using the wrap-around edges.
+    """
+    if width == 1 or height == 1:
+        # A single row or column is a cycle thanks to the wrap-around
+        return [(x, y) for y in range(height) for x in range(width)]
+
+    rows = height if height % 2 == 0 else height - 1
+    cycle = []
+    for y in range(rows):
+        xs = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+        cycle.extend((x, y) for x in xs)
+    cycle.extend((0, y) for y in range(rows - 1, -1, -1))
+
+    if rows < height:
+        # (0, 0) -> (0, last) wraps vertically, the row runs left wrapping to
+        # the right edge, and (1, last) -> (1, 0) wraps back to the start
+        last = height - 1
+        cycle.append((0, last))
+        cycle.extend((x, last) for x in range(width - 1, 0, -1))
+    return cycle
+
+
+class SnakeBot:
+    """Steers a SnakeEngine's snake to the food without ever crashing."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.size = width * height
+
+        # Cells are indices y * width + x
+        self.cycle = [y * width + x for x, y in hamiltonian_cycle(width, height)]
+        self.cycle_index = [0] * self.size
+        for position, index in enumerate(self.cycle):
+            self.cycle_index[index] = position
+        self.neighbours = [
+            [y * width + (x + 1) % width, y * width + (x - 1) % width,
+             (y + 1) % height * width + x, (y - 1) % height * width + x]
+            for y in range(height) for x in range(width)
+        ]
+
+        self.planning_time = 0.0  # Seconds spent choosing moves, for benchmarking
+        self.moves = 0
+        self.reset()
+
+    def reset(self):
+        """Forget the planned path, e.g. for a new game or after the player steered."""
+        self.path = deque()
+        self.target = None
+        # The body isn't known to lie in cycle order until the snake has
+        # followed the cycle for a whole body length
+        self.ordered = False
+        self.catch_up = 0
+
+    def offset(self, start, index):
+        """Return how many steps along the cycle a cell lies ahead of another."""
+        return (self.cycle_index[index] - self.cycle_index[start]) % self.size
+
+    def cell_index(self, cell):
+        """Return the index of an (x, y) cell."""
+        return cell[1] * self.width + cell[0]
+
+    def direction(self, start, index):
+        """Return the (dx, dy) step from one cell to a neighbouring one."""
+        width = self.width
+        dx = (index % width - start % width) % width
+        dy = (index // width - start // width) % self.height
+        if dx:
+            return (1, 0) if dx == 1 else (-1, 0)
+        return (0, 1) if dy == 1 else (0, -1)
+
+    def next_direction(self, engine):
+        """Return the direction the snake should take next."""
+        start = time.perf_counter()
+        head = self.cell_index(engine.body[0])
+        if len(engine.body) == 1:
+            self.ordered = True
+
+        if self.ordered:
+            index = self.next_cell(engine, head)
+        else:
+            index = self.catch_up_cell(engine, head)
+
+        self.planning_time += time.perf_counter() - start
+        self.moves += 1
+        return self.direction(head, index)
+
+    def next_cell(self, engine, head):
+        """Pick the next cell while the body lies in cycle order."""
+        # Keep following a path planned earlier, as long as it leads to the same food
+        if self.path and self.target == engine.food and self.path[0] in self.neighbours[head]:
+            return self.path.popleft()
+        self.path.clear()
+
+        ahead = self.cycle[(self.cycle_index[head] + 1) % self.size]
+        if engine.food is None:
+            return ahead
+
+        # Empty cells run from the head up to the tail along the cycle
+        food = self.cell_index(engine.food)
+        tail_offset = self.offset(head, self.cell_index(engine.body[-1])) or self.size
+        food_offset = self.offset(head, food)
+        if food_offset >= tail_offset:
+            # The food is beside the body; go round until the tail has passed it
+            return ahead
+
+        self.target = engine.food
+        self.path = self.shortcut(head, food, food_offset)
+        return self.path.popleft()
+
+    def shortcut(self, head, food, food_offset):
+        """Return the shortest path to the food that only moves forward along the cycle.
+
+        Only cells between the head and the food are searched, and those are
+        all empty, so the search never looks at the body.
+        """
+        cycle_index = self.cycle_index
+        size = self.size
+        base = cycle_index[head]
+        parents = {head: None}
+        frontier = [head]
+
+        while food not in parents:
+            next_frontier = []
+            for cell in frontier:
+                cell_offset = (cycle_index[cell] - base) % size
+                for neighbour in self.neighbours[cell]:
+                    if neighbour in parents:
+                        continue
+                    offset = (cycle_index[neighbour] - base) % size
+                    if cell_offset < offset <= food_offset:
+                        parents[neighbour] = cell
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+
+        path = deque()
+        cell = food
+        while cell != head:
+            path.appendleft(cell)
+            cell = parents[cell]
+        return path
+
+    def catch_up_cell(self, engine, head):
+        """Pick the next cell while getting the body back into cycle order.
+
+        Once the snake has followed the cycle for as many moves as it is long,
+        the whole body lies on the cycle in order.
+        """
+        ahead = self.cycle[(self.cycle_index[head] + 1) % self.size]
+        if self.is_free(engine, ahead):
+            self.catch_up += 1
+            if self.catch_up >= len(engine.body):
+                self.ordered = True
+            return ahead
+
+        # The cycle is blocked by the body; step aside and start catching up again
+        self.catch_up = 0
+        for neighbour in self.neighbours[head]:
+            if self.is_free(engine, neighbour):
+                return neighbour
+        return ahead
+
+    def is_free(self, engine, index):
+        """Check if the head may move into a cell: empty, or the tail that moves out of it."""
+        cell = (index % self.width, index // self.width)
+        body = engine.body
+        if len(body) > 1 and cell == body[1]:
+            return False  # The snake can't turn straight back
+        return cell not in engine.occupied or cell == body[-1]
+
+    def play(self, engine):
+        """Turn the snake the way the bot likes and move it; returns True if it ate."""
+        engine.change_direction(self.next_direction(engine))
+        return engine.step()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Snake autopilot's path planning.
+
+Run from the repository root:
+    python -m games.snake.benchmark [--moves N] [--seed S]
+"""
+
+import argparse
+import time
+
+from games.snake.ai import SnakeBot
+from games.snake.engine import SnakeEngine
+
+# The terminal game's easy board, and a large board for a long snake
+BOARDS = [(30, 15), (100, 100)]
+
+
+def benchmark_autopilot(width, height, moves, seed):
+    """Let the autopilot play a number of moves, restarting if the board fills up.
+
+    Returns the bot, elapsed time, games played and the longest snake.
+    """
+    engine = SnakeEngine(width, height, seed=seed)
+    bot = SnakeBot(width, height)
+    games = 1
+    longest = 1
+
+    start = time.perf_counter()
+    for _ in range(moves):
+        bot.play(engine)
+        if engine.game_over:
+            longest = max(longest, len(engine.body))
+            engine.reset()
+            bot.reset()
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    return bot, elapsed, games, max(longest, len(engine.body))
+
+
+def main():
+    """Run the benchmark on each board and print the planning time per move."""
+    parser = argparse.ArgumentParser(description="Benchmark the Snake autopilot")
+    parser.add_argument("--moves", "-n", type=int, default=100000, help="Moves to play on each board")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs")
+    args = parser.parse_args()
+
+    for width, height in BOARDS:
+        bot, elapsed, games, longest = benchmark_autopilot(width, height, args.moves, args.seed)
+        print(f"{width}x{height}: {args.moves} moves in {elapsed:.2f}s, "
+              f"{bot.planning_time / bot.moves * 1e6:.1f} us planning per move on average")
+        print(f"  {games} games, longest snake {longest} of {width * height} cells")
+
+
+if __name__ == "__main__":
+    main()
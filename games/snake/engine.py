@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Headless Snake engine shared by the terminal and GUI games.
+
+The body is a deque of (x, y) cells, head first, so the snake moves by adding
+a head and dropping the tail in constant time. A set of the cells the body
+covers answers collision checks without scanning the body, and an index of
+the free cells lets food be placed uniformly at random in constant time, even
+on a nearly full board. The cost of a move doesn't depend on the snake's
+length, so boards with thousands of segments play as smoothly as small ones.
+"""
+
+import random
+from collections import deque
+
+DIRECTIONS = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
+
+class SnakeEngine:
+    """Board, snake body and food of one Snake game. The snake wraps around the edges."""
+
+    def __init__(self, width=20, height=10, seed=None):
+        """Create a game with a one-cell snake in the middle of the board."""
+        self.width = width
+        self.height = height
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        """Start again with a one-cell snake heading right."""
+        self.body = deque()
+        self.occupied = set()
+
+        # Free cells as indices y * width + x, and where each one sits in that
+        # list (-1 for cells under the snake), for O(1) removal by swapping
+        self.free = list(range(self.width * self.height))
+        self.free_index = list(range(self.width * self.height))
+
+        self.direction = DIRECTIONS["right"]
+        self.game_over = False
+        self.add_head((self.width // 2, self.height // 2))
+        self.food = self.new_food()
+
+    def add_head(self, cell):
+        """Put a new head on the snake and take its cell off the free list."""
+        self.body.appendleft(cell)
+        self.occupied.add(cell)
+
+        index = cell[1] * self.width + cell[0]
+        position = self.free_index[index]
+        last = self.free.pop()
+        if last != index:
+            self.free[position] = last
+            self.free_index[last] = position
+        self.free_index[index] = -1
+
+    def remove_tail(self):
+        """Drop the snake's tail, give its cell back to the free list and return it."""
+        cell = self.body.pop()
+        self.occupied.discard(cell)
+
+        index = cell[1] * self.width + cell[0]
+        self.free_index[index] = len(self.free)
+        self.free.append(index)
+        return cell
+
+    def new_food(self):
+        """Return a random free cell for the food, or None if the snake fills the board."""
+        if not self.free:
+            return None
+        index = self.rng.choice(self.free)
+        return index % self.width, index // self.width
+
+    def change_direction(self, new_dir):
+        """Change the snake's direction, unless it would turn straight back."""
+        if (new_dir[0] * -1, new_dir[1] * -1) != self.direction:
+            self.direction = new_dir
+
+    def next_head(self, direction=None):
+        """Return the cell the head moves to next, in the current or a given direction."""
+        head_x, head_y = self.body[0]
+        dir_x, dir_y = direction or self.direction
+        return (head_x + dir_x) % self.width, (head_y + dir_y) % self.height
+
+    def step(self):
+        """Move the snake one cell in its direction.
+
+        The tail moves out of the way first, so the head may follow it into
+        the cell it leaves. Running into the rest of the body ends the game,
+        as does filling the whole board. Returns True if the snake ate the
+        food and grew.
+        """
+        if self.game_over:
+            return False
+
+        head = self.next_head()
+        ate = head == self.food
+        tail = None if ate else self.remove_tail()
+
+        if head in self.occupied:
+            # Put the tail back so the body is left as it was when the snake crashed
+            if tail is not None:
+                self.body.append(tail)
+                self.occupied.add(tail)
+                index = tail[1] * self.width + tail[0]
+                self.free.pop()
+                self.free_index[index] = -1
+            self.game_over = True
+            return False
+
+        self.add_head(head)
+        if ate:
+            self.food = self.new_food()
+            if self.food is None:
+                self.game_over = True
+        return ate
@@ -1,125 +1,84 @@
 #!/usr/bin/env python3
-import os
-import random
 import time
-import msvcrt
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
+from games.game_loop import GameLoop
+from games.snake.ai import SnakeBot
+from games.snake.engine import SnakeEngine
 
 # Initialize colorama
 colorama.init()
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
+
+HEADER_STYLE = Back.GREEN + Fore.BLACK
+HEADER = [
+    "╔═══════════════════════════════════════════════════════════════╗",
+    "║                         SNAKE                                 ║",
+    "╚═══════════════════════════════════════════════════════════════╝",
+]
 
 def print_header():
     """Print the game header."""
-    print(f"{Back.GREEN}{Fore.BLACK}╔═══════════════════════════════════════════════════════════════╗{Style.RESET_ALL}")
-    print(f"{Back.GREEN}{Fore.BLACK}║                         SNAKE                                 ║{Style.RESET_ALL}")
-    print(f"{Back.GREEN}{Fore.BLACK}╚═══════════════════════════════════════════════════════════════╝{Style.RESET_ALL}")
+    for line in HEADER:
+        print(f"{HEADER_STYLE}{line}{Style.RESET_ALL}")
     print()
 
-def is_key_pressed():
-    """Check if a key is pressed (Windows only)."""
-    return msvcrt.kbhit()
-
-def get_key():
-    """Get the pressed key (Windows only)."""
-    if is_key_pressed():
-        key = msvcrt.getch()
-        return key
-    return None
-
-class Snake:
+class Snake(SnakeEngine):
     """Snake game class."""
     def __init__(self, width=20, height=10):
-        self.width = width
-        self.height = height
-        self.snake = [(width // 2, height // 2)]  # Snake starts in the middle
-        self.direction = (1, 0)  # Initial direction: right
-        self.food = self.new_food()
+        super().__init__(width, height)
         self.score = 0
-        self.game_over = False
         self.speed = 0.2  # Initial delay between moves in seconds
-    
-    def new_food(self):
-        """Generate a new food position."""
-        while True:
-            food = (random.randint(0, self.width - 1), random.randint(0, self.height - 1))
-            if food not in self.snake:
-                return food
-    
-    def change_direction(self, new_dir):
-        """Change snake's direction."""
-        # Prevent 180-degree turns
-        if (new_dir[0] * -1, new_dir[1] * -1) != self.direction:
-            self.direction = new_dir
+        self.autopilot = False  # Let the bot steer
     
     def move(self):
         """Move the snake in the current direction."""
-        if self.game_over:
-            return
-        
-        # Calculate new head position
-        head_x, head_y = self.snake[0]
-        dir_x, dir_y = self.direction
-        new_x = (head_x + dir_x) % self.width  # Wrap around the edges
-        new_y = (head_y + dir_y) % self.height
-        
-        # Check if snake hits itself
-        if (new_x, new_y) in self.snake:
-            self.game_over = True
-            return
-        
-        # Add new head
-        self.snake.insert(0, (new_x, new_y))
-        
-        # Check if snake eats food
-        if (new_x, new_y) == self.food:
+        if self.step():
             self.score += 1
-            self.food = self.new_food()
             # Increase speed slightly
             self.speed = max(0.05, self.speed * 0.95)
-        else:
-            # Remove tail if no food eaten
-            self.snake.pop()
     
-    def draw(self):
-        """Draw the game board."""
-        clear_screen()
-        print_header()
-        print(f"{Fore.YELLOW}Score: {self.score}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Use WASD keys to move. Press Q to quit.{Style.RESET_ALL}")
-        print()
+    def screen_size(self):
+        """Return the width and height of the screen the game draws on."""
+        return max(len(HEADER[0]), self.width * 2 + 2), len(HEADER) + self.height + 9
+    
+    def draw(self, screen, stats=None):
+        """Draw the header and game board into the screen's back buffer."""
+        screen.clear()
+        for row, line in enumerate(HEADER):
+            screen.text(0, row, line, HEADER_STYLE)
         
-        # Draw the game board
-        print(f"{Fore.WHITE}╔{'═' * (self.width * 2)}╗{Style.RESET_ALL}")
+        top = len(HEADER) + 1
+        autopilot = "  (autopilot)" if self.autopilot else ""
+        screen.text(0, top, f"Score: {self.score}{autopilot}", Fore.YELLOW)
+        screen.text(0, top + 1, "Use WASD keys to move. P toggles autopilot, Q quits.", Fore.CYAN)
         
+        # Draw the border, each board cell is two characters wide
+        top += 3
+        screen.text(0, top, f"╔{'═' * (self.width * 2)}╗", Fore.WHITE)
         for y in range(self.height):
-            print(f"{Fore.WHITE}║{Style.RESET_ALL}", end="")
-            
-            for x in range(self.width):
-                if (x, y) == self.snake[0]:
-                    # Snake head
-                    print(f"{Back.GREEN}{Fore.WHITE}▓▓{Style.RESET_ALL}", end="")
-                elif (x, y) in self.snake[1:]:
-                    # Snake body
-                    print(f"{Back.GREEN}  {Style.RESET_ALL}", end="")
-                elif (x, y) == self.food:
-                    # Food
-                    print(f"{Back.RED}  {Style.RESET_ALL}", end="")
-                else:
-                    # Empty space
-                    print("  ", end="")
-            
-            print(f"{Fore.WHITE}║{Style.RESET_ALL}")
+            screen.put(0, top + 1 + y, "║", Fore.WHITE)
+            screen.put(self.width * 2 + 1, top + 1 + y, "║", Fore.WHITE)
+        screen.text(0, top + self.height + 1, f"╚{'═' * (self.width * 2)}╝", Fore.WHITE)
+        
+        # Food, then the snake body and head
+        if self.food:
+            food_x, food_y = self.food
+            screen.text(1 + food_x * 2, top + 1 + food_y, "  ", Back.RED)
+        for x, y in self.body:
+            screen.text(1 + x * 2, top + 1 + y, "  ", Back.GREEN)
+        head_x, head_y = self.body[0]
+        screen.text(1 + head_x * 2, top + 1 + head_y, "▓▓", Back.GREEN + Fore.WHITE)
         
-        print(f"{Fore.WHITE}╚{'═' * (self.width * 2)}╝{Style.RESET_ALL}")
+        bottom = top + self.height + 2
+        screen.text(0, bottom, f"FPS: {screen.fps.fps:.1f}  {stats or ''}", Fore.WHITE)
         
         if self.game_over:
-            print()
-            print(f"{Fore.RED}Game Over! Your final score: {self.score}{Style.RESET_ALL}")
+            screen.text(0, bottom + 2, f"Game Over! Your final score: {self.score}", Fore.RED)
 
 def main():
     """Main game function."""
@@ -135,6 +94,7 @@ def main():
     print(f"{Fore.WHITE}  D - Right{Style.RESET_ALL}")
     print(f"{Fore.WHITE}Collect the {Fore.RED}red{Style.RESET_ALL}{Fore.WHITE} food to grow longer.{Style.RESET_ALL}")
     print(f"{Fore.WHITE}The game ends if the snake runs into itself.{Style.RESET_ALL}")
+    print(f"{Fore.WHITE}Press P to let the autopilot steer, and P again to take over.{Style.RESET_ALL}")
     print(f"{Fore.WHITE}Press Q at any time to quit the game.{Style.RESET_ALL}")
     print()
     
@@ -171,40 +131,57 @@ def main():
     print(f"{Fore.GREEN}Starting game in 3 seconds...{Style.RESET_ALL}")
     time.sleep(3)
     
-    # Game loop
-    last_move_time = time.time()
+    screen = terminal.Screen(*game.screen_size())
+    bot = SnakeBot(game.width, game.height)
+    quit_by_player = False
     
-    while not game.game_over:
-        # Draw the game
-        game.draw()
-        
-        # Check for user input
-        if is_key_pressed():
-            key = get_key()
-            
-            if key == b'w':  # Up
+    def on_tick(keys):
+        """Turn the snake for the keys pressed since the last tick, then move it."""
+        nonlocal quit_by_player
+        for key in keys:
+            if key == 'p':
+                game.autopilot = not game.autopilot
+                bot.reset()
+            elif game.autopilot and key != 'q':
+                continue  # The bot is steering
+            elif key in ('w', 'up'):
                 game.change_direction((0, -1))
-            elif key == b's':  # Down
+            elif key in ('s', 'down'):
                 game.change_direction((0, 1))
-            elif key == b'a':  # Left
+            elif key in ('a', 'left'):
                 game.change_direction((-1, 0))
-            elif key == b'd':  # Right
+            elif key in ('d', 'right'):
                 game.change_direction((1, 0))
-            elif key == b'q':  # Quit
+            elif key == 'q':  # Quit
                 game.game_over = True
-                print(f"{Fore.YELLOW}Game exited by player.{Style.RESET_ALL}")
-        
-        # Move the snake at regular intervals
-        current_time = time.time()
-        if current_time - last_move_time > game.speed:
-            game.move()
-            last_move_time = current_time
+                quit_by_player = True
+                return
         
-        # Small delay to prevent excessive CPU usage
-        time.sleep(0.05)
+        if game.autopilot:
+            game.change_direction(bot.next_direction(game))
+        game.move()
+        # The snake speeds up as it eats
+        loop.tick_time = game.speed
+    
+    def render():
+        game.draw(screen, loop.stats)
+        screen.present()
+    
+    loop = GameLoop(game.speed, on_tick, render, lambda: not game.game_over)
+    
+    # Game loop
+    try:
+        loop.run()
+    except KeyboardInterrupt:
+        screen.close()
+        raise
     
     # Final game state
-    game.draw()
+    render()
+    screen.close()
+    
+    if quit_by_player:
+        print(f"{Fore.YELLOW}Game exited by player.{Style.RESET_ALL}")
     
     # Ask to play again
     print()
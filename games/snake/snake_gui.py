@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 import os
-import random
 import time
 import tkinter as tk
+from collections import deque
 from tkinter import messagebox
 
+from games.snake.ai import SnakeBot
+from games.snake.engine import SnakeEngine
+
+# Snake colors
+HEAD_COLOR = "#CCFF99"  # Bright green
+BODY_COLOR = "#669966"  # Darker green
+
 class SnakeGUI:
     def __init__(self, root):
         self.root = root
@@ -22,14 +29,17 @@ class SnakeGUI:
         self.cell_size = 25  # Size of each cell in pixels
         self.delay = 150  # Milliseconds between updates (lower = faster)
         
-        self.snake = [(self.width // 2, self.height // 2)]  # Start in the middle
-        self.direction = (1, 0)  # Initial direction: right
-        self.food = None
+        self.engine = SnakeEngine(self.width, self.height)  # Snake body, food and collisions
         self.score = 0
-        self.game_over = False
         self.game_running = False
+        self.autopilot = False
+        self.bot = SnakeBot(self.width, self.height)
         self.level = 1
         
+        # Canvas items, kept from tick to tick and moved rather than redrawn
+        self.food_item = None
+        self.segment_items = deque()  # One rectangle per snake segment, head first
+        
         # Create UI elements
         self.create_widgets()
         
@@ -42,6 +52,8 @@ class SnakeGUI:
         self.root.bind("s", lambda e: self.change_direction((0, 1)))
         self.root.bind("a", lambda e: self.change_direction((-1, 0)))
         self.root.bind("d", lambda e: self.change_direction((1, 0)))
+        self.root.bind("p", lambda e: self.toggle_autopilot())
+        self.root.bind("P", lambda e: self.toggle_autopilot())
         
         # Show welcome screen
         self.show_welcome()
@@ -186,6 +198,21 @@ class SnakeGUI:
             width=8
         )
         quit_button.pack(side=tk.RIGHT, padx=5)
+        
+        # Autopilot button
+        self.autopilot_button = tk.Button(
+            difficulty_frame,
+            text="Autopilot",
+            command=self.toggle_autopilot,
+            bg="#336666",
+            fg="#FFFFFF",
+            activebackground="#339999",
+            activeforeground="#FFFFFF",
+            font=("Helvetica", 12),
+            width=10,
+            state=tk.DISABLED
+        )
+        self.autopilot_button.pack(side=tk.RIGHT, padx=5)
     
     def show_welcome(self):
         """Show welcome screen with instructions."""
@@ -204,6 +231,7 @@ class SnakeGUI:
             "Control the snake using arrow keys or WASD",
             "Collect food to grow longer",
             "Avoid hitting the walls or yourself",
+            "Press P or click 'Autopilot' to let the computer steer",
             "Select difficulty and click 'Start Game' to play"
         ]
         
@@ -233,14 +261,15 @@ class SnakeGUI:
             self.delay = 70
         
         # Reset game variables
-        self.snake = [(self.width // 2, self.height // 2)]
-        self.direction = (1, 0)
+        self.engine.reset()
         self.score = 0
-        self.game_over = False
+        self.autopilot = False
+        self.bot.reset()
+        self.autopilot_button.config(text="Autopilot", state=tk.NORMAL)
         self.score_label.config(text="Score: 0")
         
-        # Create new food
-        self.create_food()
+        # Draw the board from scratch; later ticks only touch what moved
+        self.create_board_items()
         
         # Update start button
         self.start_button.config(text="Restart", state=tk.DISABLED)
@@ -254,127 +283,66 @@ class SnakeGUI:
         """Clear the canvas."""
         self.canvas.delete("all")
     
-    def create_food(self):
-        """Create a new food item at a random location."""
-        while True:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            
-            # Make sure food doesn't appear on the snake
-            if (x, y) not in self.snake:
-                self.food = (x, y)
-                break
-    
     def change_direction(self, new_dir):
         """Change snake's direction if it's not going in the opposite direction."""
-        if not self.game_running or self.game_over:
+        if not self.game_running or self.engine.game_over or self.autopilot:
             return
         
-        # Prevent 180-degree turns
-        if (new_dir[0] * -1, new_dir[1] * -1) != self.direction:
-            self.direction = new_dir
+        self.engine.change_direction(new_dir)
+    
+    def toggle_autopilot(self):
+        """Let the autopilot steer the snake, or take over again."""
+        if not self.game_running or self.engine.game_over:
+            return
+        
+        self.autopilot = not self.autopilot
+        self.bot.reset()
+        self.autopilot_button.config(text="Stop Autopilot" if self.autopilot else "Autopilot")
+        self.info_label.config(text="Autopilot on" if self.autopilot else "Game in progress...")
     
     def update(self):
         """Update the game state and redraw."""
         if not self.game_running:
             return
         
-        if self.game_over:
+        if self.engine.game_over:
             self.start_button.config(state=tk.NORMAL)
+            self.autopilot_button.config(state=tk.DISABLED)
             self.show_game_over()
             return
         
-        # Move the snake
+        # Move the snake, then draw it unless it crashed (filling the board also ends the game)
+        if self.autopilot:
+            self.engine.change_direction(self.bot.next_direction(self.engine))
         self.move_snake()
-        
-        # Check for collisions
-        self.check_collisions()
-        
-        # Redraw everything
-        self.redraw()
+        if not self.engine.game_over or self.engine.food is None:
+            self.redraw()
         
         # Schedule the next update
         self.root.after(self.delay, self.update)
     
     def move_snake(self):
         """Move the snake in the current direction."""
-        if self.game_over:
-            return
-        
-        # Calculate new head position
-        head_x, head_y = self.snake[0]
-        dir_x, dir_y = self.direction
-        
-        # New position with wrap-around
-        new_x = (head_x + dir_x) % self.width
-        new_y = (head_y + dir_y) % self.height
-        
-        # Add new head
-        self.snake.insert(0, (new_x, new_y))
-        
-        # Check if snake eats food
-        if (new_x, new_y) == self.food:
-            # Snake grows and doesn't remove tail
+        if self.engine.step():
+            # Snake ate the food and grew
             self.score += 10
             self.score_label.config(text=f"Score: {self.score}")
             
-            # Create new food
-            self.create_food()
-            
             # Speed up the game slightly as the snake grows
             if self.delay > 30:  # Minimum delay to keep the game playable
                 self.delay = int(self.delay * 0.98)
-        else:
-            # Remove tail if no food eaten
-            self.snake.pop()
     
-    def check_collisions(self):
-        """Check for collisions with self."""
-        head = self.snake[0]
-        
-        # Check if snake hits itself
-        if head in self.snake[1:]:
-            self.game_over = True
+    def cell_bounds(self, x, y, inset):
+        """Return the canvas rectangle of a grid cell, shrunk by inset pixels."""
+        return (x * self.cell_size + inset, y * self.cell_size + inset,
+                (x + 1) * self.cell_size - inset, (y + 1) * self.cell_size - inset)
     
-    def redraw(self):
-        """Redraw the game."""
+    def create_board_items(self):
+        """Clear the canvas and create the grid, food and snake items for a new game."""
         self.clear_canvas()
         
-        # Draw food
-        if self.food:
-            x, y = self.food
-            food_x1 = x * self.cell_size + 2
-            food_y1 = y * self.cell_size + 2
-            food_x2 = (x + 1) * self.cell_size - 2
-            food_y2 = (y + 1) * self.cell_size - 2
-            
-            self.canvas.create_oval(
-                food_x1, food_y1, food_x2, food_y2,
-                fill="#FF6666",  # Red
-                outline="#FF6666"
-            )
-        
-        # Draw snake
-        for i, (x, y) in enumerate(self.snake):
-            snake_x1 = x * self.cell_size + 1
-            snake_y1 = y * self.cell_size + 1
-            snake_x2 = (x + 1) * self.cell_size - 1
-            snake_y2 = (y + 1) * self.cell_size - 1
-            
-            # Head is a different color
-            if i == 0:
-                color = "#CCFF99"  # Bright green for head
-            else:
-                color = "#669966"  # Darker green for body
-            
-            self.canvas.create_rectangle(
-                snake_x1, snake_y1, snake_x2, snake_y2,
-                fill=color,
-                outline="#000000"
-            )
-        
-        # Draw grid lines (optional)
-        if self.level_var.get() == 1:  # Only draw grid in easy mode
+        # Grid lines are a static layer under everything else (easy mode only)
+        if self.level_var.get() == 1:
             for x in range(self.width):
                 self.canvas.create_line(
                     x * self.cell_size, 0, 
@@ -388,6 +356,51 @@ class SnakeGUI:
                     self.width * self.cell_size, y * self.cell_size,
                     fill="#111111"
                 )
+        
+        self.food_item = self.canvas.create_oval(
+            *self.cell_bounds(*self.engine.food, 2),
+            fill="#FF6666",  # Red
+            outline="#FF6666"
+        )
+        
+        self.segment_items = deque()
+        for i, (x, y) in enumerate(self.engine.body):
+            self.segment_items.append(self.canvas.create_rectangle(
+                *self.cell_bounds(x, y, 1),
+                fill=HEAD_COLOR if i == 0 else BODY_COLOR,
+                outline="#000000"
+            ))
+    
+    def redraw(self):
+        """Update the canvas after the snake moved one cell.
+        
+        Only the ends of the snake change: the old head is recolored as body,
+        and the tail item is moved to the new head, or a new head item is
+        added if the snake grew. The work per tick doesn't depend on the
+        snake's length.
+        """
+        items = self.segment_items
+        self.canvas.itemconfig(items[0], fill=BODY_COLOR)
+        
+        head_bounds = self.cell_bounds(*self.engine.body[0], 1)
+        if len(items) < len(self.engine.body):
+            # The snake grew, so the tail stays where it is
+            head_item = self.canvas.create_rectangle(
+                *head_bounds,
+                fill=HEAD_COLOR,
+                outline="#000000"
+            )
+        else:
+            head_item = items.pop()
+            self.canvas.coords(head_item, *head_bounds)
+            self.canvas.itemconfig(head_item, fill=HEAD_COLOR)
+        items.appendleft(head_item)
+        
+        if self.engine.food:
+            self.canvas.coords(self.food_item, *self.cell_bounds(*self.engine.food, 2))
+        else:
+            # The snake fills the board, so there is no food left to show
+            self.canvas.itemconfig(self.food_item, state=tk.HIDDEN)
     
     def show_game_over(self):
         """Show game over screen."""
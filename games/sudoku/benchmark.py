@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark Sudoku puzzle generation.
+
+Run from the repository root:
+    python -m games.sudoku.benchmark [--count N] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from games.sudoku import grader
+
+
+def benchmark_generation(difficulty, count, rng):
+    """Generate count puzzles and return generation times, grading times and cells removed."""
+    times = []
+    grade_times = []
+    removed = []
+
+    for _ in range(count):
+        start = time.perf_counter()
+        puzzle, _ = grader.generate_puzzle(difficulty, rng)
+        times.append(time.perf_counter() - start)
+        removed.append(sum(row.count(0) for row in puzzle))
+
+        start = time.perf_counter()
+        grader.grade(puzzle)
+        grade_times.append(time.perf_counter() - start)
+
+    return times, grade_times, removed
+
+
+def main():
+    """Run the benchmark and print a summary per difficulty."""
+    parser = argparse.ArgumentParser(description="Benchmark Sudoku puzzle generation")
+    parser.add_argument("--count", "-n", type=int, default=50, help="Puzzles to generate per difficulty")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    print(f"{'Difficulty':<12}{'Mean ms':>10}{'Min ms':>10}{'Max ms':>10}{'Grade ms':>10}{'Avg removed':>14}")
+    for difficulty in grader.DIFFICULTIES:
+        times, grade_times, removed = benchmark_generation(difficulty, args.count, rng)
+        mean = sum(times) / len(times) * 1000
+        grade_mean = sum(grade_times) / len(grade_times) * 1000
+        print(f"{difficulty:<12}{mean:>10.2f}{min(times) * 1000:>10.2f}{max(times) * 1000:>10.2f}"
+              f"{grade_mean:>10.2f}{sum(removed) / len(removed):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Incremental conflict tracking for a Sudoku board.
+
+The tracker keeps how many times each digit appears in every row, column and
+box. Changing one cell only touches that cell and the peers that hold its old
+or new digit, so validity checks, conflict highlighting and completion checks
+never rescan the whole grid.
+"""
+
+from games.sudoku.solver import ROW_OF, COL_OF, BOX_OF
+from games.sudoku.grader import PEERS
+
+
+class ConflictTracker:
+    """Live digit counts per unit and the set of conflicting cells of a board."""
+
+    def __init__(self, board):
+        """Start tracking a 9x9 board; all later changes must go through set()."""
+        self.board = board
+        self.row_counts = [[0] * 10 for _ in range(9)]
+        self.col_counts = [[0] * 10 for _ in range(9)]
+        self.box_counts = [[0] * 10 for _ in range(9)]
+        self.filled = 0
+        self.conflicts = set()
+
+        # Every cell needs to be drawn once
+        self.dirty = {(i, j) for i in range(9) for j in range(9)}
+
+        for i in range(9):
+            for j in range(9):
+                if board[i][j]:
+                    self._count(i * 9 + j, board[i][j], 1)
+                    self.filled += 1
+
+        for idx in range(81):
+            self._refresh(idx)
+
+    def _count(self, idx, num, delta):
+        """Adjust the count of a digit in the units of cell idx."""
+        self.row_counts[ROW_OF[idx]][num] += delta
+        self.col_counts[COL_OF[idx]][num] += delta
+        self.box_counts[BOX_OF[idx]][num] += delta
+
+    def _refresh(self, idx):
+        """Recompute whether cell idx is in conflict, marking it dirty if that changed."""
+        cell = (idx // 9, idx % 9)
+        num = self.board[cell[0]][cell[1]]
+        conflict = bool(num) and (self.row_counts[ROW_OF[idx]][num] > 1 or
+                                  self.col_counts[COL_OF[idx]][num] > 1 or
+                                  self.box_counts[BOX_OF[idx]][num] > 1)
+
+        if conflict != (cell in self.conflicts):
+            if conflict:
+                self.conflicts.add(cell)
+            else:
+                self.conflicts.discard(cell)
+            self.dirty.add(cell)
+
+    def can_place(self, row, col, num):
+        """Check if a digit fits in a cell without clashing with any peer."""
+        idx = row * 9 + col
+        own = 1 if self.board[row][col] == num else 0
+        return (self.row_counts[ROW_OF[idx]][num] - own == 0 and
+                self.col_counts[COL_OF[idx]][num] - own == 0 and
+                self.box_counts[BOX_OF[idx]][num] - own == 0)
+
+    def in_conflict(self, row, col):
+        """Check if a cell shares its digit with a peer."""
+        return (row, col) in self.conflicts
+
+    def set(self, row, col, num):
+        """Put a digit (0 to erase) in a cell and update the conflict set."""
+        idx = row * 9 + col
+        old = self.board[row][col]
+        if old == num:
+            return
+
+        if old:
+            self._count(idx, old, -1)
+            self.filled -= 1
+
+        self.board[row][col] = num
+        if num:
+            self._count(idx, num, 1)
+            self.filled += 1
+
+        self.dirty.add((row, col))
+
+        # Only this cell and peers holding the old or new digit can change state
+        self._refresh(idx)
+        for peer in PEERS[idx]:
+            value = self.board[peer // 9][peer % 9]
+            if value and (value == old or value == num):
+                self._refresh(peer)
+
+    def is_complete(self):
+        """Check if every cell is filled and nothing conflicts."""
+        return self.filled == 81 and not self.conflicts
+
+    def pop_dirty(self):
+        """Return the cells changed since the last call and forget them."""
+        dirty = self.dirty
+        self.dirty = set()
+        return dirty
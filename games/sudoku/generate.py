@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Generate Sudoku puzzles in bulk across a pool of worker processes.
+
+Run from the repository root:
+    python -m games.sudoku.generate --difficulty hard --count 10000 --workers 4
+
+Each puzzle is written as soon as a worker finishes it, one CSV row per
+puzzle with its 81 digits, clue count and generation time. With --bank the
+puzzles go straight into the game's puzzle bank instead.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import multiprocessing
+
+from games.sudoku import grader
+from games.sudoku.puzzle_bank import PuzzleBank, pack, unpack
+
+
+def generate_one(task):
+    """Generate one puzzle for a (difficulty, seed) task.
+
+    Returns (packed puzzle, clue count, seconds).
+    """
+    difficulty, seed = task
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    puzzle, _ = grader.generate_puzzle(difficulty, rng)
+    elapsed = time.perf_counter() - start
+
+    clues = sum(1 for row in puzzle for num in row if num)
+    return pack(puzzle), clues, elapsed
+
+
+def generate(difficulty, count, workers, seed=None):
+    """Yield (packed puzzle, clue count, seconds) for count puzzles as they finish."""
+    base_seed = random.randrange(2 ** 32) if seed is None else seed
+    tasks = ((difficulty, base_seed + i) for i in range(count))
+
+    if workers <= 1:
+        for task in tasks:
+            yield generate_one(task)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        # Small chunks keep results streaming out while the workers stay busy
+        chunksize = max(1, min(32, count // (workers * 8)))
+        for result in pool.imap_unordered(generate_one, tasks, chunksize):
+            yield result
+
+
+def main():
+    """Parse the command line and write the generated puzzles."""
+    parser = argparse.ArgumentParser(description="Generate Sudoku puzzles in bulk")
+    parser.add_argument("--difficulty", "-d", choices=grader.DIFFICULTIES, default="medium",
+                        help="Difficulty of the generated puzzles")
+    parser.add_argument("--count", "-n", type=int, default=100, help="Number of puzzles to generate")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes")
+    parser.add_argument("--output", "-o", default=None,
+                        help="CSV file to write (default: sudoku_<difficulty>.csv, '-' for stdout)")
+    parser.add_argument("--bank", action="store_true",
+                        help="Add the puzzles to the game's puzzle bank instead of a CSV file")
+    parser.add_argument("--seed", type=int, default=None, help="Base random seed for repeatable runs")
+    args = parser.parse_args()
+
+    bank = PuzzleBank() if args.bank else None
+    output = None
+    if bank is None:
+        path = args.output or f"sudoku_{args.difficulty}.csv"
+        output = sys.stdout if path == "-" else open(path, "w", newline="")
+        output.write("puzzle,clues,seconds\n")
+
+    start = time.perf_counter()
+    total_time = 0.0
+    total_clues = 0
+    done = 0
+
+    try:
+        for puzzle, clues, elapsed in generate(args.difficulty, args.count, args.workers, args.seed):
+            if bank is not None:
+                bank.push(args.difficulty, unpack(puzzle))
+            else:
+                output.write(f"{puzzle},{clues},{elapsed:.6f}\n")
+                output.flush()
+
+            done += 1
+            total_time += elapsed
+            total_clues += clues
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+
+    wall = time.perf_counter() - start
+    if done:
+        print(f"Generated {done} {args.difficulty} puzzles in {wall:.2f}s "
+              f"({done / wall:.1f}/s, {total_time / done * 1000:.2f} ms each, "
+              f"{total_clues / done:.1f} clues on average)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Grade Sudoku puzzles by the human solving techniques they need.
+
+The grader solves a puzzle the way a person would, always reaching for the
+simplest technique that makes progress, and rates it by the hardest technique
+it had to use. Puzzles these techniques cannot finish need guessing.
+"""
+
+import random
+
+from games.sudoku import solver
+from games.sudoku.solver import ALL_DIGITS, ROW_OF, COL_OF, BOX_OF, POPCOUNT, DIGIT_OF_BIT
+
+# Techniques from simplest to hardest
+TECHNIQUES = ["naked single", "hidden single", "naked pair", "hidden pair", "pointing", "x-wing", "guessing"]
+
+# Difficulty a puzzle gets when a technique is the hardest one it needs
+TECHNIQUE_DIFFICULTY = {
+    "naked single": "easy",
+    "hidden single": "easy",
+    "naked pair": "medium",
+    "hidden pair": "medium",
+    "pointing": "medium",
+    "x-wing": "hard",
+    "guessing": "hard",
+}
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+# Fewest cells removed from the solved board before a puzzle is graded
+MIN_CELLS_REMOVED = {"easy": 40, "medium": 46, "hard": 52}
+
+# Number of solved boards to try before settling for the closest grade
+MAX_ATTEMPTS = 10
+
+# Cells of every row, column and box, and the 20 peers of each cell
+ROWS = [[r * 9 + c for c in range(9)] for r in range(9)]
+COLS = [[r * 9 + c for r in range(9)] for c in range(9)]
+BOXES = [[i for i in range(81) if BOX_OF[i] == b] for b in range(9)]
+UNITS = ROWS + COLS + BOXES
+PEERS = [sorted(set(ROWS[ROW_OF[i]] + COLS[COL_OF[i]] + BOXES[BOX_OF[i]]) - {i}) for i in range(81)]
+
+# Single bits for each digit
+BITS = [1 << k for k in range(9)]
+
+
+class TechniqueSolver:
+    """Solve a puzzle with human techniques, tracking the hardest one used."""
+
+    def __init__(self, board):
+        self.grid = [0] * 81
+        self.cands = [ALL_DIGITS] * 81
+        self.unsolved = 81
+        self.broken = False
+        self.hardest = 0
+
+        for i in range(9):
+            for j in range(9):
+                if board[i][j]:
+                    self.assign(i * 9 + j, board[i][j])
+
+    def assign(self, idx, num):
+        """Place a digit and remove it from the candidates of every peer."""
+        bit = 1 << (num - 1)
+        if not self.cands[idx] & bit:
+            self.broken = True
+            return
+
+        self.grid[idx] = num
+        self.cands[idx] = 0
+        self.unsolved -= 1
+
+        cands = self.cands
+        for peer in PEERS[idx]:
+            if cands[peer] & bit:
+                cands[peer] &= ~bit
+                if not cands[peer]:
+                    self.broken = True
+
+    def eliminate(self, cells, mask, keep=()):
+        """Remove candidate digits from cells, skipping those in keep.
+
+        Returns True if any candidate was removed.
+        """
+        cands = self.cands
+        changed = False
+        for idx in cells:
+            if cands[idx] & mask and idx not in keep:
+                cands[idx] &= ~mask
+                changed = True
+                if not cands[idx]:
+                    self.broken = True
+        return changed
+
+    def naked_single(self):
+        """Fill every cell that has only one candidate left."""
+        cands = self.cands
+        progress = False
+        for idx in range(81):
+            if POPCOUNT[cands[idx]] == 1 and not self.grid[idx]:
+                self.assign(idx, DIGIT_OF_BIT[cands[idx]])
+                progress = True
+        return progress
+
+    def hidden_single(self):
+        """Fill a digit that fits in only one cell of some unit."""
+        cands = self.cands
+        for unit in UNITS:
+            once = twice = 0
+            for idx in unit:
+                twice |= once & cands[idx]
+                once |= cands[idx]
+
+            single = once & ~twice
+            if single:
+                bit = single & -single
+                for idx in unit:
+                    if cands[idx] & bit:
+                        self.assign(idx, DIGIT_OF_BIT[bit])
+                        return True
+        return False
+
+    def naked_pair(self):
+        """Two cells of a unit sharing the same two candidates claim them."""
+        cands = self.cands
+        for unit in UNITS:
+            seen = {}
+            for idx in unit:
+                mask = cands[idx]
+                if POPCOUNT[mask] != 2:
+                    continue
+                if mask in seen:
+                    if self.eliminate(unit, mask, (idx, seen[mask])):
+                        return True
+                else:
+                    seen[mask] = idx
+        return False
+
+    def hidden_pair(self):
+        """Two digits confined to the same two cells of a unit clear those cells."""
+        cands = self.cands
+        for unit in UNITS:
+            # Bit mask of positions within the unit for each digit
+            where = {}
+            for bit in BITS:
+                positions = 0
+                for pos, idx in enumerate(unit):
+                    if cands[idx] & bit:
+                        positions |= 1 << pos
+                if POPCOUNT[positions] == 2:
+                    where.setdefault(positions, []).append(bit)
+
+            for positions, bits in where.items():
+                if len(bits) != 2:
+                    continue
+                pair = bits[0] | bits[1]
+                cells = [unit[pos] for pos in range(9) if positions & (1 << pos)]
+                if self.eliminate(cells, ALL_DIGITS & ~pair):
+                    return True
+        return False
+
+    def pointing(self):
+        """A digit confined to one row or column of a box is removed from the rest of that line."""
+        cands = self.cands
+        for box in BOXES:
+            for bit in BITS:
+                cells = [idx for idx in box if cands[idx] & bit]
+                if len(cells) < 2:
+                    continue
+
+                rows = {ROW_OF[idx] for idx in cells}
+                if len(rows) == 1 and self.eliminate(ROWS[rows.pop()], bit, box):
+                    return True
+
+                cols = {COL_OF[idx] for idx in cells}
+                if len(cols) == 1 and self.eliminate(COLS[cols.pop()], bit, box):
+                    return True
+        return False
+
+    def x_wing(self):
+        """A digit confined to the same two columns in two rows (or vice versa) clears those columns."""
+        cands = self.cands
+        for bit in BITS:
+            for lines, cross_of, cross_lines in ((ROWS, COL_OF, COLS), (COLS, ROW_OF, ROWS)):
+                seen = {}
+                for line in lines:
+                    positions = tuple(cross_of[idx] for idx in line if cands[idx] & bit)
+                    if len(positions) != 2:
+                        continue
+                    if positions in seen:
+                        keep = set(line) | set(seen[positions])
+                        changed = self.eliminate(cross_lines[positions[0]], bit, keep)
+                        changed = self.eliminate(cross_lines[positions[1]], bit, keep) or changed
+                        if changed:
+                            return True
+                    else:
+                        seen[positions] = line
+        return False
+
+    def run(self):
+        """Solve as far as the techniques allow and return the hardest one used."""
+        steps = [self.naked_single, self.hidden_single, self.naked_pair,
+                 self.hidden_pair, self.pointing, self.x_wing]
+
+        while self.unsolved and not self.broken:
+            for level, step in enumerate(steps):
+                if step():
+                    self.hardest = max(self.hardest, level)
+                    break
+            else:
+                return TECHNIQUES[-1]  # Stuck, the puzzle needs guessing
+
+        return TECHNIQUES[self.hardest]
+
+
+def hardest_technique(board):
+    """Return the hardest technique needed to solve a 9x9 board."""
+    return TechniqueSolver(board).run()
+
+
+def grade(board):
+    """Return the difficulty of a 9x9 board based on the techniques it needs."""
+    return TECHNIQUE_DIFFICULTY[hardest_technique(board)]
+
+
+def remove_numbers(board, difficulty, rng=random):
+    """Blank cells of a solved board in place until it grades at difficulty.
+
+    The solution always stays unique. Cells whose removal would make the
+    puzzle harder than asked for are put back. Returns the grade reached.
+    """
+    target = DIFFICULTIES.index(difficulty)
+    search = solver.SudokuSolver(board)
+
+    # Create a list of all cell positions
+    positions = list(range(81))
+    rng.shuffle(positions)
+
+    removed = 0
+    reached = DIFFICULTIES[0]
+    for idx in positions:
+        num = search.remove(idx)
+
+        # Keep the cell blank only if the puzzle still has a unique solution
+        if search.count_solutions(2) != 1:
+            search.place(idx, num)
+            continue
+
+        board[idx // 9][idx % 9] = 0
+        removed += 1
+        if removed < MIN_CELLS_REMOVED[difficulty]:
+            continue
+
+        current = grade(board)
+        if DIFFICULTIES.index(current) > target:
+            # Too hard, put the number back
+            search.place(idx, num)
+            board[idx // 9][idx % 9] = num
+            removed -= 1
+            continue
+
+        reached = current
+        if DIFFICULTIES.index(current) == target:
+            break  # Target grade reached
+
+    return reached
+
+
+def generate_puzzle(difficulty="medium", rng=random):
+    """Generate a unique-solution puzzle graded at difficulty.
+
+    Returns (puzzle, solution) boards. If no solved board reaches the target
+    within MAX_ATTEMPTS, the closest puzzle found is returned.
+    """
+    best = None
+    best_level = -1
+    for _ in range(MAX_ATTEMPTS):
+        solution = solver.generate_solved_board(rng)
+        puzzle = [row[:] for row in solution]
+
+        # Grades never overshoot the target, so the highest one is the closest
+        level = DIFFICULTIES.index(remove_numbers(puzzle, difficulty, rng))
+        if level > best_level:
+            best, best_level = (puzzle, solution), level
+        if level == DIFFICULTIES.index(difficulty):
+            break
+
+    return best
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+On-disk bank of pre-generated Sudoku puzzles.
+
+Each difficulty has its own file of fixed-size records: 81 digits (0 for an
+empty cell) followed by a newline. Because every record has the same length,
+taking a puzzle is a seek to the last record, a read and a truncate, no matter
+how many puzzles the bank holds. A background process tops each difficulty
+back up to the watermark.
+"""
+
+import os
+import multiprocessing
+
+from games.sudoku import solver, grader
+
+# Default location of the bank and number of puzzles to keep per difficulty
+BANK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzle_bank")
+DEFAULT_WATERMARK = 20
+
+# Size of one record on disk: 81 digits plus a newline
+RECORD_SIZE = 82
+
+
+def pack(board):
+    """Pack a 9x9 board into an 81-digit string."""
+    return "".join(str(num) for row in board for num in row)
+
+
+def unpack(record):
+    """Unpack an 81-digit string into a 9x9 board."""
+    return [[int(record[i * 9 + j]) for j in range(9)] for i in range(9)]
+
+
+def is_valid_record(record):
+    """Check if a record is 81 digits describing a puzzle with one solution."""
+    if len(record) != 81 or not record.isdigit():
+        return False
+    return solver.count_solutions(unpack(record)) == 1
+
+
+class PuzzleBank:
+    """Persistent store of validated puzzles for each difficulty."""
+
+    def __init__(self, directory=BANK_DIR, watermark=DEFAULT_WATERMARK):
+        self.directory = directory
+        self.watermark = watermark
+        self.lock = multiprocessing.get_context("spawn").Lock()
+        self.worker = None
+
+    def path(self, difficulty):
+        """Return the bank file for a difficulty."""
+        return os.path.join(self.directory, f"{difficulty}.txt")
+
+    def count(self, difficulty):
+        """Return the number of puzzles stored for a difficulty."""
+        try:
+            return os.path.getsize(self.path(difficulty)) // RECORD_SIZE
+        except OSError:
+            return 0
+
+    def push(self, difficulty, puzzle):
+        """Append a puzzle board to the bank."""
+        os.makedirs(self.directory, exist_ok=True)
+        with self.lock:
+            with open(self.path(difficulty), "ab") as f:
+                # Drop any record left half written by a killed refill, so
+                # this one starts on a record boundary
+                size = f.seek(0, os.SEEK_END)
+                if size % RECORD_SIZE:
+                    f.truncate(size - size % RECORD_SIZE)
+                f.write((pack(puzzle) + "\n").encode("ascii"))
+
+    def pop(self, difficulty):
+        """Take the most recently added puzzle for a difficulty.
+
+        Returns a 9x9 board, or None if the bank has no usable puzzle.
+        """
+        with self.lock:
+            try:
+                f = open(self.path(difficulty), "r+b")
+            except OSError:
+                return None
+
+            with f:
+                size = f.seek(0, os.SEEK_END)
+                # Drop any partially written record at the end of the file
+                size -= size % RECORD_SIZE
+
+                while size > 0:
+                    size -= RECORD_SIZE
+                    f.seek(size)
+                    record = f.read(RECORD_SIZE).decode("ascii", "replace").strip()
+                    f.truncate(size)
+
+                    if is_valid_record(record):
+                        return unpack(record)
+
+                f.truncate(0)
+
+        return None
+
+    def needs_refill(self):
+        """Check if any difficulty is below the watermark."""
+        return any(self.count(difficulty) < self.watermark for difficulty in grader.DIFFICULTIES)
+
+    def start_refill(self):
+        """Start a background process that tops up every difficulty.
+
+        Does nothing if a refill is already running or the bank is full.
+        """
+        if self.worker is not None and self.worker.is_alive():
+            return
+        if not self.needs_refill():
+            return
+
+        context = multiprocessing.get_context("spawn")
+        self.worker = context.Process(
+            target=refill,
+            args=(self.directory, self.watermark, self.lock),
+            daemon=True
+        )
+        self.worker.start()
+
+
+def refill(directory=BANK_DIR, watermark=DEFAULT_WATERMARK, lock=None):
+    """Generate puzzles until every difficulty holds watermark puzzles."""
+    bank = PuzzleBank(directory, watermark)
+    if lock is not None:
+        bank.lock = lock
+
+    # Top up whichever difficulty has the fewest puzzles, one at a time, so a
+    # game waiting on an empty bank gets something back as soon as possible
+    while True:
+        counts = {difficulty: bank.count(difficulty) for difficulty in grader.DIFFICULTIES}
+        difficulty = min(counts, key=counts.get)
+        if counts[difficulty] >= watermark:
+            return
+
+        puzzle, _ = grader.generate_puzzle(difficulty)
+        bank.push(difficulty, puzzle)
+
+
+if __name__ == "__main__":
+    refill()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Bitmask Sudoku solver shared by the terminal and GUI versions of the game.
+
+The solver keeps one 9-bit mask of used digits per row, column and box, so the
+candidates for a cell are a couple of bit operations away. Searches always
+branch on the most constrained empty cell and work on the solver's own grid
+in place, undoing each placement on the way back up instead of copying.
+"""
+
+import random
+
+# Bit mask with all nine digits set
+ALL_DIGITS = 0x1FF
+
+# Precomputed lookup tables for the 81 cells of the board
+ROW_OF = [i // 9 for i in range(81)]
+COL_OF = [i % 9 for i in range(81)]
+BOX_OF = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+
+# Number of candidates in a mask and digit for a single bit
+POPCOUNT = [bin(mask).count("1") for mask in range(ALL_DIGITS + 1)]
+DIGIT_OF_BIT = {1 << (digit - 1): digit for digit in range(1, 10)}
+
+
+class SudokuSolver:
+    """Solve and count solutions of a 9x9 Sudoku using candidate bitmasks."""
+
+    def __init__(self, board=None):
+        """Initialize the solver from a 9x9 board (0 means empty)."""
+        self.grid = [0] * 81
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+
+        if board is not None:
+            self.load(board)
+
+    def load(self, board):
+        """Load a 9x9 board into the solver, replacing its current state."""
+        self.grid = [0] * 81
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+
+        for i in range(9):
+            for j in range(9):
+                if board[i][j]:
+                    self.place(i * 9 + j, board[i][j])
+
+    def to_board(self):
+        """Return the solver's grid as a 9x9 list of lists."""
+        return [self.grid[i * 9:(i + 1) * 9] for i in range(9)]
+
+    def candidates(self, idx):
+        """Return the bit mask of digits that can go in cell idx."""
+        return ALL_DIGITS & ~(self.rows[ROW_OF[idx]] | self.cols[COL_OF[idx]] | self.boxes[BOX_OF[idx]])
+
+    def can_place(self, idx, num):
+        """Check if a digit can be placed in cell idx."""
+        return bool(self.candidates(idx) & (1 << (num - 1)))
+
+    def place(self, idx, num):
+        """Place a digit in cell idx and mark it used in its units."""
+        bit = 1 << (num - 1)
+        self.grid[idx] = num
+        self.rows[ROW_OF[idx]] |= bit
+        self.cols[COL_OF[idx]] |= bit
+        self.boxes[BOX_OF[idx]] |= bit
+
+    def remove(self, idx):
+        """Clear cell idx and return the digit that was there."""
+        num = self.grid[idx]
+        if num:
+            bit = ~(1 << (num - 1))
+            self.grid[idx] = 0
+            self.rows[ROW_OF[idx]] &= bit
+            self.cols[COL_OF[idx]] &= bit
+            self.boxes[BOX_OF[idx]] &= bit
+        return num
+
+    def _most_constrained(self):
+        """Find the empty cell with the fewest candidates.
+
+        Returns (idx, mask), (-1, 0) when the grid is full, or (idx, 0) when
+        some empty cell has no candidates left.
+        """
+        grid = self.grid
+        rows, cols, boxes = self.rows, self.cols, self.boxes
+        best_idx = -1
+        best_mask = 0
+        best_count = 10
+
+        for idx in range(81):
+            if grid[idx]:
+                continue
+
+            mask = ALL_DIGITS & ~(rows[ROW_OF[idx]] | cols[COL_OF[idx]] | boxes[BOX_OF[idx]])
+            count = POPCOUNT[mask]
+            if count < best_count:
+                best_idx, best_mask, best_count = idx, mask, count
+                if count <= 1:
+                    break  # Can't do better than a forced (or dead) cell
+
+        return best_idx, best_mask
+
+    def count_solutions(self, limit=2):
+        """Count the solutions of the current grid, stopping at limit.
+
+        The grid is left exactly as it was found.
+        """
+        idx, mask = self._most_constrained()
+        if idx < 0:
+            return 1  # Grid is full, found a solution
+
+        count = 0
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+
+            self.place(idx, DIGIT_OF_BIT[bit])
+            count += self.count_solutions(limit - count)
+            self.remove(idx)
+
+            if count >= limit:
+                break
+
+        return count
+
+    def solve(self, rng=None):
+        """Fill the grid with a solution, trying digits in random order if rng is given.
+
+        Returns True if a solution was found, otherwise the grid is unchanged.
+        """
+        idx, mask = self._most_constrained()
+        if idx < 0:
+            return True  # Grid is full
+
+        digits = [DIGIT_OF_BIT[1 << k] for k in range(9) if mask & (1 << k)]
+        if rng is not None:
+            rng.shuffle(digits)
+
+        for num in digits:
+            self.place(idx, num)
+            if self.solve(rng):
+                return True
+            self.remove(idx)
+
+        return False
+
+
+def count_solutions(board, limit=2):
+    """Count the solutions of a 9x9 board, up to a limit."""
+    return SudokuSolver(board).count_solutions(limit)
+
+
+def solve(board):
+    """Return a solved copy of a 9x9 board, or None if it has no solution."""
+    solver = SudokuSolver(board)
+    if solver.solve():
+        return solver.to_board()
+    return None
+
+
+def generate_solved_board(rng=random):
+    """Generate a random, fully solved 9x9 board."""
+    solver = SudokuSolver()
+
+    # Fill the diagonal 3x3 boxes first (these can be filled independently)
+    for box in range(0, 9, 3):
+        numbers = list(range(1, 10))
+        rng.shuffle(numbers)
+        for i in range(3):
+            for j in range(3):
+                solver.place((box + i) * 9 + box + j, numbers.pop())
+
+    # Fill the rest of the board in random order
+    solver.solve(rng)
+    return solver.to_board()
+
@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
-import os
 import sys
 import time
 import random
 import colorama
 from colorama import Fore, Back, Style
+from games import terminal
 import copy
 
+from games.sudoku import solver, grader
+from games.sudoku.conflicts import ConflictTracker
+from games.sudoku.puzzle_bank import PuzzleBank
+
 # Initialize colorama
 colorama.init(autoreset=True)
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -22,219 +26,78 @@ def print_header():
     print()
 
 class Sudoku:
-    def __init__(self, difficulty="medium"):
-        """Initialize the Sudoku game."""
+    def __init__(self, difficulty="medium", puzzle=None):
+        """Initialize the Sudoku game, generating a puzzle unless one is given."""
         self.difficulty = difficulty
         self.board = [[0 for _ in range(9)] for _ in range(9)]
         self.original_board = None
         self.solution = None
-        self.generate_puzzle()
+        if puzzle is not None:
+            self.load_puzzle(puzzle)
+        else:
+            self.generate_puzzle()
+    
+    def load_puzzle(self, puzzle):
+        """Load an existing puzzle and work out its solution."""
+        self.board = copy.deepcopy(puzzle)
+        self.solution = solver.solve(self.board)
+        self.original_board = copy.deepcopy(self.board)
+        self.tracker = ConflictTracker(self.board)
     
     def generate_puzzle(self):
         """Generate a new Sudoku puzzle."""
-        # Start with a solved board
-        self.generate_solved_board()
-        
-        # Make a copy of the solved board as the solution
-        self.solution = copy.deepcopy(self.board)
-        
-        # Remove numbers to create the puzzle
-        self.remove_numbers()
+        # Start with a solved board and remove numbers, keeping the solution
+        # unique, until the puzzle needs the techniques of the chosen difficulty
+        self.board, self.solution = grader.generate_puzzle(self.difficulty)
         
         # Make a copy of the puzzle as the original board
         self.original_board = copy.deepcopy(self.board)
-    
-    def generate_solved_board(self):
-        """Generate a solved Sudoku board."""
-        # Start with an empty board
-        self.board = [[0 for _ in range(9)] for _ in range(9)]
         
-        # Fill the diagonal 3x3 boxes first (these can be filled independently)
-        for i in range(0, 9, 3):
-            self.fill_box(i, i)
-        
-        # Fill the rest of the board using backtracking
-        self.solve_board()
-    
-    def fill_box(self, row, col):
-        """Fill a 3x3 box with random numbers."""
-        numbers = list(range(1, 10))
-        random.shuffle(numbers)
-        
-        for i in range(3):
-            for j in range(3):
-                self.board[row + i][col + j] = numbers.pop()
-    
-    def solve_board(self):
-        """Solve the Sudoku board using backtracking."""
-        empty_cell = self.find_empty()
-        if not empty_cell:
-            return True  # Board is solved
-        
-        row, col = empty_cell
-        
-        for num in range(1, 10):
-            if self.is_valid(row, col, num):
-                self.board[row][col] = num
-                
-                if self.solve_board():
-                    return True
-                
-                self.board[row][col] = 0  # Backtrack
-        
-        return False
-    
-    def find_empty(self):
-        """Find an empty cell in the board."""
-        for i in range(9):
-            for j in range(9):
-                if self.board[i][j] == 0:
-                    return (i, j)
-        return None
+        # Track digit counts and conflicts as cells change
+        self.tracker = ConflictTracker(self.board)
     
     def is_valid(self, row, col, num):
         """Check if a number can be placed in a cell."""
-        # Check row
-        for j in range(9):
-            if self.board[row][j] == num:
-                return False
-        
-        # Check column
-        for i in range(9):
-            if self.board[i][col] == num:
-                return False
-        
-        # Check 3x3 box
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if self.board[i][j] == num:
-                    return False
-        
-        return True
-    
-    def remove_numbers(self):
-        """Remove numbers from the solved board to create a puzzle."""
-        # Number of cells to remove based on difficulty
-        if self.difficulty == "easy":
-            cells_to_remove = 40
-        elif self.difficulty == "medium":
-            cells_to_remove = 50
-        else:  # hard
-            cells_to_remove = 60
-        
-        # Create a list of all cell positions
-        positions = [(i, j) for i in range(9) for j in range(9)]
-        random.shuffle(positions)
-        
-        # Remove numbers one by one, ensuring the puzzle still has a unique solution
-        for i, j in positions:
-            if cells_to_remove <= 0:
-                break
-            
-            temp = self.board[i][j]
-            self.board[i][j] = 0
-            
-            # Check if the puzzle still has a unique solution
-            # For simplicity, we'll just check if it's solvable
-            # A more thorough check would ensure uniqueness
-            board_copy = copy.deepcopy(self.board)
-            if self.count_solutions(board_copy) == 1:
-                cells_to_remove -= 1
-            else:
-                self.board[i][j] = temp  # Restore the number
+        return self.tracker.can_place(row, col, num)
     
     def count_solutions(self, board, limit=2):
         """Count the number of solutions to the puzzle, up to a limit."""
-        empty_cell = self.find_empty_in_board(board)
-        if not empty_cell:
-            return 1  # Found a solution
-        
-        row, col = empty_cell
-        count = 0
-        
-        for num in range(1, 10):
-            if self.is_valid_in_board(board, row, col, num):
-                board[row][col] = num
-                
-                count += self.count_solutions(board, limit - count)
-                
-                if count >= limit:
-                    break
-                
-                board[row][col] = 0  # Backtrack
-        
-        return count
-    
-    def find_empty_in_board(self, board):
-        """Find an empty cell in a given board."""
-        for i in range(9):
-            for j in range(9):
-                if board[i][j] == 0:
-                    return (i, j)
-        return None
-    
-    def is_valid_in_board(self, board, row, col, num):
-        """Check if a number can be placed in a cell of a given board."""
-        # Check row
-        for j in range(9):
-            if board[row][j] == num:
-                return False
-        
-        # Check column
-        for i in range(9):
-            if board[i][col] == num:
-                return False
-        
-        # Check 3x3 box
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if board[i][j] == num:
-                    return False
-        
-        return True
+        return solver.count_solutions(board, limit)
     
     def is_complete(self):
         """Check if the board is complete and correct."""
-        # Check if there are any empty cells
-        for i in range(9):
-            for j in range(9):
-                if self.board[i][j] == 0:
-                    return False
-        
-        # Check if the board is valid
-        for i in range(9):
-            for j in range(9):
-                num = self.board[i][j]
-                self.board[i][j] = 0
-                if not self.is_valid(i, j, num):
-                    self.board[i][j] = num
-                    return False
-                self.board[i][j] = num
-        
-        return True
+        return self.tracker.is_complete()
     
     def is_original(self, row, col):
         """Check if a cell is part of the original puzzle."""
         return self.original_board[row][col] != 0
     
-    def place_number(self, row, col, num):
-        """Place a number in a cell if it's valid."""
+    def place_number(self, row, col, num, allow_conflicts=False):
+        """Place a number in a cell if it's valid, or regardless when conflicts are allowed."""
         if self.is_original(row, col):
             return False, "Cannot modify original numbers."
         
         if num == 0:
             # Erasing a cell is always allowed
-            self.board[row][col] = 0
+            self.tracker.set(row, col, 0)
             return True, "Cell cleared."
         
         if not self.is_valid(row, col, num):
-            return False, "Invalid move. Number conflicts with row, column, or box."
+            if not allow_conflicts:
+                return False, "Invalid move. Number conflicts with row, column, or box."
+            
+            self.tracker.set(row, col, num)
+            return True, "Number conflicts with row, column, or box."
         
-        self.board[row][col] = num
+        self.tracker.set(row, col, num)
         return True, "Number placed successfully."
     
+    def show_solution(self):
+        """Fill every cell with the solution."""
+        for i in range(9):
+            for j in range(9):
+                self.tracker.set(i, j, self.solution[i][j])
+    
     def get_hint(self):
         """Get a hint by revealing a random cell."""
         # Find all empty cells
@@ -251,7 +114,7 @@ class Sudoku:
         row, col = random.choice(empty_cells)
         
         # Reveal the correct number
-        self.board[row][col] = self.solution[row][col]
+        self.tracker.set(row, col, self.solution[row][col])
         
         return True, f"Hint: Placed {self.solution[row][col]} at position ({row+1}, {col+1})."
     
@@ -310,6 +173,9 @@ def main():
     print_header()
     show_instructions()
     
+    # Bank of pre-generated puzzles, topped up in the background
+    puzzle_bank = PuzzleBank()
+    
     while True:
         clear_screen()
         print_header()
@@ -339,9 +205,12 @@ def main():
         else:
             difficulty = "hard"
         
-        # Create a new Sudoku game
-        print(f"{Fore.CYAN}Generating puzzle...{Style.RESET_ALL}")
-        game = Sudoku(difficulty)
+        # Create a new Sudoku game, using a banked puzzle when one is available
+        puzzle = puzzle_bank.pop(difficulty)
+        if puzzle is None:
+            print(f"{Fore.CYAN}Generating puzzle...{Style.RESET_ALL}")
+        game = Sudoku(difficulty, puzzle)
+        puzzle_bank.start_refill()
         
         # Main game loop
         while True:
@@ -381,7 +250,7 @@ def main():
                 # Confirm before solving
                 confirm = input(f"{Fore.YELLOW}Are you sure you want to see the solution? (y/n): {Style.RESET_ALL}").strip().lower()
                 if confirm == 'y':
-                    game.board = copy.deepcopy(game.solution)
+                    game.show_solution()
                     clear_screen()
                     print_header()
                     print(f"{Fore.CYAN}Difficulty: {difficulty.capitalize()}{Style.RESET_ALL}")
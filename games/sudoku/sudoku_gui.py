@@ -6,225 +6,88 @@ import copy
 import sys
 import os
 
+from games.sudoku import solver, grader
+from games.sudoku.conflicts import ConflictTracker
+from games.sudoku.puzzle_bank import PuzzleBank
+
 # Try to import Sudoku class from terminal version
 try:
     from games.sudoku import Sudoku
 except ImportError:
     # Define Sudoku class if import fails
     class Sudoku:
-        def __init__(self, difficulty="medium"):
-            """Initialize the Sudoku game."""
+        def __init__(self, difficulty="medium", puzzle=None):
+            """Initialize the Sudoku game, generating a puzzle unless one is given."""
             self.difficulty = difficulty
             self.board = [[0 for _ in range(9)] for _ in range(9)]
             self.original_board = None
             self.solution = None
-            self.generate_puzzle()
+            if puzzle is not None:
+                self.load_puzzle(puzzle)
+            else:
+                self.generate_puzzle()
+        
+        def load_puzzle(self, puzzle):
+            """Load an existing puzzle and work out its solution."""
+            self.board = copy.deepcopy(puzzle)
+            self.solution = solver.solve(self.board)
+            self.original_board = copy.deepcopy(self.board)
+            self.tracker = ConflictTracker(self.board)
         
         def generate_puzzle(self):
             """Generate a new Sudoku puzzle."""
-            # Start with a solved board
-            self.generate_solved_board()
-            
-            # Make a copy of the solved board as the solution
-            self.solution = copy.deepcopy(self.board)
-            
-            # Remove numbers to create the puzzle
-            self.remove_numbers()
+            # Start with a solved board and remove numbers, keeping the solution
+            # unique, until the puzzle needs the techniques of the chosen difficulty
+            self.board, self.solution = grader.generate_puzzle(self.difficulty)
             
             # Make a copy of the puzzle as the original board
             self.original_board = copy.deepcopy(self.board)
-        
-        def generate_solved_board(self):
-            """Generate a solved Sudoku board."""
-            # Start with an empty board
-            self.board = [[0 for _ in range(9)] for _ in range(9)]
             
-            # Fill the diagonal 3x3 boxes first (these can be filled independently)
-            for i in range(0, 9, 3):
-                self.fill_box(i, i)
-            
-            # Fill the rest of the board using backtracking
-            self.solve_board()
-        
-        def fill_box(self, row, col):
-            """Fill a 3x3 box with random numbers."""
-            numbers = list(range(1, 10))
-            random.shuffle(numbers)
-            
-            for i in range(3):
-                for j in range(3):
-                    self.board[row + i][col + j] = numbers.pop()
-        
-        def solve_board(self):
-            """Solve the Sudoku board using backtracking."""
-            empty_cell = self.find_empty()
-            if not empty_cell:
-                return True  # Board is solved
-            
-            row, col = empty_cell
-            
-            for num in range(1, 10):
-                if self.is_valid(row, col, num):
-                    self.board[row][col] = num
-                    
-                    if self.solve_board():
-                        return True
-                    
-                    self.board[row][col] = 0  # Backtrack
-            
-            return False
-        
-        def find_empty(self):
-            """Find an empty cell in the board."""
-            for i in range(9):
-                for j in range(9):
-                    if self.board[i][j] == 0:
-                        return (i, j)
-            return None
+            # Track digit counts and conflicts as cells change
+            self.tracker = ConflictTracker(self.board)
         
         def is_valid(self, row, col, num):
             """Check if a number can be placed in a cell."""
-            # Check row
-            for j in range(9):
-                if self.board[row][j] == num:
-                    return False
-            
-            # Check column
-            for i in range(9):
-                if self.board[i][col] == num:
-                    return False
-            
-            # Check 3x3 box
-            box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-            for i in range(box_row, box_row + 3):
-                for j in range(box_col, box_col + 3):
-                    if self.board[i][j] == num:
-                        return False
-            
-            return True
-        
-        def remove_numbers(self):
-            """Remove numbers from the solved board to create a puzzle."""
-            # Number of cells to remove based on difficulty
-            if self.difficulty == "easy":
-                cells_to_remove = 40
-            elif self.difficulty == "medium":
-                cells_to_remove = 50
-            else:  # hard
-                cells_to_remove = 60
-            
-            # Create a list of all cell positions
-            positions = [(i, j) for i in range(9) for j in range(9)]
-            random.shuffle(positions)
-            
-            # Remove numbers one by one, ensuring the puzzle still has a unique solution
-            for i, j in positions:
-                if cells_to_remove <= 0:
-                    break
-                
-                temp = self.board[i][j]
-                self.board[i][j] = 0
-                
-                # Check if the puzzle still has a unique solution
-                # For simplicity, we'll just check if it's solvable
-                # A more thorough check would ensure uniqueness
-                board_copy = copy.deepcopy(self.board)
-                if self.count_solutions(board_copy) == 1:
-                    cells_to_remove -= 1
-                else:
-                    self.board[i][j] = temp  # Restore the number
+            return self.tracker.can_place(row, col, num)
         
         def count_solutions(self, board, limit=2):
             """Count the number of solutions to the puzzle, up to a limit."""
-            empty_cell = self.find_empty_in_board(board)
-            if not empty_cell:
-                return 1  # Found a solution
-            
-            row, col = empty_cell
-            count = 0
-            
-            for num in range(1, 10):
-                if self.is_valid_in_board(board, row, col, num):
-                    board[row][col] = num
-                    
-                    count += self.count_solutions(board, limit - count)
-                    
-                    if count >= limit:
-                        break
-                    
-                    board[row][col] = 0  # Backtrack
-            
-            return count
-        
-        def find_empty_in_board(self, board):
-            """Find an empty cell in a given board."""
-            for i in range(9):
-                for j in range(9):
-                    if board[i][j] == 0:
-                        return (i, j)
-            return None
-        
-        def is_valid_in_board(self, board, row, col, num):
-            """Check if a number can be placed in a cell of a given board."""
-            # Check row
-            for j in range(9):
-                if board[row][j] == num:
-                    return False
-            
-            # Check column
-            for i in range(9):
-                if board[i][col] == num:
-                    return False
-            
-            # Check 3x3 box
-            box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-            for i in range(box_row, box_row + 3):
-                for j in range(box_col, box_col + 3):
-                    if board[i][j] == num:
-                        return False
-            
-            return True
+            return solver.count_solutions(board, limit)
         
         def is_complete(self):
             """Check if the board is complete and correct."""
-            # Check if there are any empty cells
-            for i in range(9):
-                for j in range(9):
-                    if self.board[i][j] == 0:
-                        return False
-            
-            # Check if the board is valid
-            for i in range(9):
-                for j in range(9):
-                    num = self.board[i][j]
-                    self.board[i][j] = 0
-                    if not self.is_valid(i, j, num):
-                        self.board[i][j] = num
-                        return False
-                    self.board[i][j] = num
-            
-            return True
+            return self.tracker.is_complete()
         
         def is_original(self, row, col):
             """Check if a cell is part of the original puzzle."""
             return self.original_board[row][col] != 0
         
-        def place_number(self, row, col, num):
-            """Place a number in a cell if it's valid."""
+        def place_number(self, row, col, num, allow_conflicts=False):
+            """Place a number in a cell if it's valid, or regardless when conflicts are allowed."""
             if self.is_original(row, col):
                 return False, "Cannot modify original numbers."
             
             if num == 0:
                 # Erasing a cell is always allowed
-                self.board[row][col] = 0
+                self.tracker.set(row, col, 0)
                 return True, "Cell cleared."
             
             if not self.is_valid(row, col, num):
-                return False, "Invalid move. Number conflicts with row, column, or box."
+                if not allow_conflicts:
+                    return False, "Invalid move. Number conflicts with row, column, or box."
+                
+                self.tracker.set(row, col, num)
+                return True, "Number conflicts with row, column, or box."
             
-            self.board[row][col] = num
+            self.tracker.set(row, col, num)
             return True, "Number placed successfully."
         
+        def show_solution(self):
+            """Fill every cell with the solution."""
+            for i in range(9):
+                for j in range(9):
+                    self.tracker.set(i, j, self.solution[i][j])
+        
         def get_hint(self):
             """Get a hint by revealing a random cell."""
             # Find all empty cells
@@ -241,7 +104,7 @@ except ImportError:
             row, col = random.choice(empty_cells)
             
             # Reveal the correct number
-            self.board[row][col] = self.solution[row][col]
+            self.tracker.set(row, col, self.solution[row][col])
             
             return True, (row, col, self.solution[row][col])
 
@@ -254,6 +117,9 @@ class SudokuCell(tk.Frame):
         self.col = col
         self.value = value
         self.is_original = is_original
+        self.conflict = False
+        self.highlighted = False
+        self.look = None
         
         # Create the cell button
         self.button = tk.Button(
@@ -280,17 +146,49 @@ class SudokuCell(tk.Frame):
         if not self.is_original:
             self.master.master.select_cell(self.row, self.col)
     
+    def render(self):
+        """Apply the cell's state to its button, skipping the call if nothing changed."""
+        if self.highlighted:
+            bg = "#FFFF99"
+        elif self.conflict:
+            bg = "#FFCDD2"
+        else:
+            bg = "#F0F0F0" if not self.is_original else "#E0E0E0"
+        
+        if self.is_original:
+            fg = "blue"
+        else:
+            fg = "red" if self.conflict else "black"
+        
+        look = ("" if self.value == 0 else str(self.value), self.is_original, bg, fg)
+        if look == self.look:
+            return
+        self.look = look
+        
+        self.button.config(
+            text=look[0],
+            font=("Helvetica", 14, "bold" if self.is_original else "normal"),
+            bg=bg,
+            fg=fg,
+            relief=tk.RAISED if not self.is_original else tk.SUNKEN
+        )
+    
+    def set_state(self, value, is_original, conflict):
+        """Update the cell's value, original flag and conflict flag."""
+        self.value = value
+        self.is_original = is_original
+        self.conflict = conflict
+        self.render()
+    
     def update_value(self, value):
         """Update the cell's value."""
         self.value = value
-        self.button.config(text="" if value == 0 else str(value))
+        self.render()
     
     def highlight(self, highlight=True):
         """Highlight or unhighlight the cell."""
-        if highlight:
-            self.button.config(bg="#FFFF99")
-        else:
-            self.button.config(bg="#F0F0F0" if not self.is_original else "#E0E0E0")
+        self.highlighted = highlight
+        self.render()
 
 class SudokuGUI:
     def __init__(self, root):
@@ -306,6 +204,9 @@ class SudokuGUI:
         self.selected_cell = None
         self.cells = []
         
+        # Bank of pre-generated puzzles, topped up in the background
+        self.puzzle_bank = PuzzleBank()
+        
         # Create widgets
         self.create_widgets()
         
@@ -541,6 +442,7 @@ class SudokuGUI:
             "2. Click a number button (1-9) to place that number",
             "3. Click 'X' to erase a number",
             "4. Original numbers (in blue) cannot be modified",
+            "5. Numbers that clash with their row, column or box turn red",
             "",
             "Features:",
             "• Hint: Reveals a random cell with the correct number",
@@ -548,7 +450,7 @@ class SudokuGUI:
             "• Solve Puzzle: Shows the complete solution",
             "• New Game: Starts a new game with selected difficulty",
             "",
-            "Difficulty levels affect how many numbers are initially revealed."
+            "Difficulty levels depend on the solving techniques the puzzle needs."
         ]
         
         for line in instructions:
@@ -582,41 +484,52 @@ class SudokuGUI:
     
     def new_game(self):
         """Start a new game."""
-        # Show loading message
-        self.status_var.set("Generating puzzle...")
-        self.root.update()
+        # Take a puzzle from the bank, generating one only if the bank is empty
+        puzzle = self.puzzle_bank.pop(self.difficulty)
+        if puzzle is None:
+            # Show loading message
+            self.status_var.set("Generating puzzle...")
+            self.root.update()
         
         # Create a new Sudoku game
-        self.game = Sudoku(self.difficulty)
+        self.game = Sudoku(self.difficulty, puzzle)
         
-        # Update the board display
-        self.update_board()
+        # Top the bank back up without blocking the game
+        self.puzzle_bank.start_refill()
         
         # Clear selection
+        if self.selected_cell:
+            prev_row, prev_col = self.selected_cell
+            self.cells[prev_row][prev_col].highlight(False)
         self.selected_cell = None
         
+        # Update the board display
+        self.update_board()
+        
         # Update status
         self.status_var.set("Select a cell to begin")
     
     def update_board(self):
-        """Update the board display from the game state."""
+        """Update the whole board display from the game state."""
         for i in range(9):
             for j in range(9):
-                value = self.game.board[i][j]
-                is_original = self.game.is_original(i, j)
-                
-                # Update cell properties
-                self.cells[i][j].value = value
-                self.cells[i][j].is_original = is_original
-                
-                # Update button appearance
-                self.cells[i][j].button.config(
-                    text="" if value == 0 else str(value),
-                    font=("Helvetica", 14, "bold" if is_original else "normal"),
-                    bg="#F0F0F0" if not is_original else "#E0E0E0",
-                    fg="black" if not is_original else "blue",
-                    relief=tk.RAISED if not is_original else tk.SUNKEN
+                self.cells[i][j].set_state(
+                    self.game.board[i][j],
+                    self.game.is_original(i, j),
+                    self.game.tracker.in_conflict(i, j)
                 )
+        
+        # Every cell is up to date now
+        self.game.tracker.pop_dirty()
+    
+    def refresh_cells(self):
+        """Repaint only the cells whose value or conflict state changed."""
+        for row, col in self.game.tracker.pop_dirty():
+            self.cells[row][col].set_state(
+                self.game.board[row][col],
+                self.game.is_original(row, col),
+                self.game.tracker.in_conflict(row, col)
+            )
     
     def select_cell(self, row, col):
         """Select a cell in the grid."""
@@ -642,12 +555,12 @@ class SudokuGUI:
         
         row, col = self.selected_cell
         
-        # Try to place the number
-        success, message = self.game.place_number(row, col, num)
+        # Try to place the number, letting conflicts through so they can be highlighted
+        success, message = self.game.place_number(row, col, num, allow_conflicts=True)
         
         if success:
-            # Update the cell display
-            self.cells[row][col].update_value(num)
+            # Update the changed cells
+            self.refresh_cells()
             
             # Check if the puzzle is complete
             if self.game.is_complete():
@@ -665,8 +578,8 @@ class SudokuGUI:
         if success:
             row, col, value = result
             
-            # Update the cell display
-            self.cells[row][col].update_value(value)
+            # Update the changed cells
+            self.refresh_cells()
             
             # Flash the cell to highlight it
             self.flash_cell(row, col)
@@ -704,10 +617,10 @@ class SudokuGUI:
         """Show the solution to the puzzle."""
         if messagebox.askyesno("Solve Puzzle", "Are you sure you want to see the solution?"):
             # Update the board with the solution
-            self.game.board = copy.deepcopy(self.game.solution)
+            self.game.show_solution()
             
             # Update the display
-            self.update_board()
+            self.refresh_cells()
             
             # Update status
             self.status_var.set("Puzzle solved")
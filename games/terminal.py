@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Shared terminal rendering helpers for the console and the terminal games.
+
+Screens are cleared with ANSI escape sequences instead of spawning a shell to
+run cls/clear, and a whole screen can be collected and drawn in one buffered
+write. The real-time games draw into a Screen, which keeps the last frame and
+only rewrites the cells that changed. colorama translates the sequences on
+Windows consoles.
+"""
+
+import io
+import sys
+import time
+import contextlib
+from collections import deque
+
+# Move the cursor home, then clear the screen and the scrollback
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+RESET = "\033[0m"
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+
+
+def clear_screen():
+    """Clear the terminal without forking a shell."""
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+
+@contextlib.contextmanager
+def frame():
+    """Collect everything printed inside the block and draw it as one screen.
+
+    The clear and the new contents go out in a single write, so the old
+    screen is never seen half-erased.
+    """
+    real_stdout = sys.stdout
+    buffer = io.StringIO()
+    sys.stdout = buffer
+    try:
+        yield buffer
+    finally:
+        sys.stdout = real_stdout
+        real_stdout.write(CLEAR_SCREEN + buffer.getvalue())
+        real_stdout.flush()
+
+
+def move_to(x, y):
+    """Return the sequence that puts the cursor on column x, row y (0-based)."""
+    return f"\033[{y + 1};{x + 1}H"
+
+
+class FPSCounter:
+    """Frames per second over a sliding window of recent frames."""
+
+    def __init__(self, window=1.0):
+        self.window = window
+        self.times = deque()
+        self.fps = 0.0
+
+    def tick(self):
+        """Record that a frame was shown and return the current rate."""
+        now = time.perf_counter()
+        self.times.append(now)
+        while now - self.times[0] > self.window:
+            self.times.popleft()
+
+        span = now - self.times[0]
+        if span > 0:
+            self.fps = (len(self.times) - 1) / span
+        return self.fps
+
+
+class Screen:
+    """Double-buffered character grid that only redraws what changed.
+
+    Each frame is drawn into the back buffer with put() and text(), as a
+    character and an attribute (colour escape codes) per cell. present()
+    compares it with the frame already on the terminal and writes only the
+    runs of changed cells, each behind a cursor move, in a single write.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.chars = [[" "] * width for _ in range(height)]
+        self.attrs = [[""] * width for _ in range(height)]
+        self.shown_chars = None  # What the terminal shows, None to redraw everything
+        self.shown_attrs = None
+        self.fps = FPSCounter()
+
+    def clear(self):
+        """Blank the back buffer."""
+        for y in range(self.height):
+            self.chars[y] = [" "] * self.width
+            self.attrs[y] = [""] * self.width
+
+    def put(self, x, y, char, attr=""):
+        """Set one cell of the back buffer; cells off the grid are ignored."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.chars[y][x] = char
+            self.attrs[y][x] = attr
+
+    def text(self, x, y, string, attr=""):
+        """Write a string into the back buffer, clipped to the grid."""
+        start = max(x, 0)
+        end = min(x + len(string), self.width)
+        if 0 <= y < self.height and start < end:
+            self.chars[y][start:end] = string[start - x:end - x]
+            self.attrs[y][start:end] = [attr] * (end - start)
+
+    def invalidate(self):
+        """Redraw the whole screen on the next present(), e.g. after other output."""
+        self.shown_chars = None
+        self.shown_attrs = None
+
+    def render(self):
+        """Return the output that brings the terminal up to date with the back buffer."""
+        out = []
+        if self.shown_chars is None:
+            out.append(HIDE_CURSOR + CLEAR_SCREEN)
+            self.shown_chars = [[None] * self.width for _ in range(self.height)]
+            self.shown_attrs = [[None] * self.width for _ in range(self.height)]
+
+        current = None
+        for y in range(self.height):
+            chars, attrs = self.chars[y], self.attrs[y]
+            shown_chars, shown_attrs = self.shown_chars[y], self.shown_attrs[y]
+            if chars == shown_chars and attrs == shown_attrs:
+                continue
+
+            x = 0
+            while x < self.width:
+                if chars[x] == shown_chars[x] and attrs[x] == shown_attrs[x]:
+                    x += 1
+                    continue
+
+                # Write the run of changed cells starting here
+                out.append(move_to(x, y))
+                while x < self.width and (chars[x] != shown_chars[x] or attrs[x] != shown_attrs[x]):
+                    if attrs[x] != current:
+                        current = attrs[x]
+                        out.append(RESET + current)
+                    out.append(chars[x])
+                    x += 1
+
+            self.shown_chars[y] = chars[:]
+            self.shown_attrs[y] = attrs[:]
+
+        if current:
+            out.append(RESET)
+        return "".join(out)
+
+    def present(self):
+        """Show the back buffer on the terminal and count the frame."""
+        output = self.render()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        self.fps.tick()
+
+    def close(self):
+        """Put the cursor back below the frame so normal printing can continue."""
+        sys.stdout.write(RESET + move_to(0, self.height) + SHOW_CURSOR)
+        sys.stdout.flush()
+        self.invalidate()
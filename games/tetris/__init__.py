@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+tetris game package.
+This package contains the tetris game.
+"""
+
+import importlib
+
+# Modules holding the main functions, imported only when first used so that
+# loading one version of the game does not pull in the other
+_MAIN_MODULES = {
+    "terminal_main": "games.tetris.tetris",
+    "gui_main": "games.tetris.tetris_gui",
+}
+
+
+def __getattr__(name):
+    """Import the terminal or GUI main function on first access."""
+    if name in _MAIN_MODULES:
+        return importlib.import_module(_MAIN_MODULES[name]).main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Placement-search Tetris bot for hints and autoplay.
+
+For the falling piece the bot tries every rotation in every column it can
+reach, drops it, and scores the resulting board with a weighted sum of
+features (lines cleared, aggregate height, holes, bumpiness). Placements are
+then refined by also trying every placement of the next piece, best first,
+until the per-move time budget runs out. Features and weights are plain
+dicts, so new heuristics can be plugged in without touching the search.
+"""
+
+import time
+
+from games.tetris.engine import ROTATIONS
+
+
+class BoardStats:
+    """Column heights and holes of a board after a placement, shared by the features."""
+
+    def __init__(self, rows, width, lines):
+        self.lines = lines
+        self.heights = [0] * width
+        self.holes = 0
+
+        height = len(rows)
+        covered = 0  # Columns with a filled cell somewhere above the current row
+        for y, row in enumerate(rows):
+            if not row and not covered:
+                continue
+            # Empty cells under a filled one are holes
+            self.holes += bin(covered & ~row).count("1")
+            new = row & ~covered
+            while new:
+                low = new & -new
+                self.heights[low.bit_length() - 1] = height - y
+                new ^= low
+            covered |= row
+
+
+def bumpiness(stats):
+    """Sum of height differences between neighbouring columns."""
+    heights = stats.heights
+    return sum(abs(heights[i] - heights[i + 1]) for i in range(len(heights) - 1))
+
+
+# Feature name -> function of BoardStats
+FEATURES = {
+    "lines": lambda stats: stats.lines,
+    "height": lambda stats: sum(stats.heights),
+    "holes": lambda stats: stats.holes,
+    "bumpiness": bumpiness,
+}
+
+# Weights for the features above, tuned for line clearing on a 10x20 board
+DEFAULT_WEIGHTS = {
+    "lines": 0.76,
+    "height": -0.51,
+    "holes": -0.36,
+    "bumpiness": -0.18,
+}
+
+# Per-move thinking time; the fastest gravity in the GUI is 100 ms a row
+DEFAULT_TIME_BUDGET = 0.05
+
+
+class Placement:
+    """Where a piece ends up: orientation, column, landing row and board score."""
+
+    def __init__(self, shape, rotation, x, y, score, rows):
+        self.shape = shape
+        self.rotation = rotation
+        self.x = x
+        self.y = y
+        self.score = score
+        self.rows = rows  # Board after the piece locked and lines cleared
+
+    def cells(self):
+        """Return the (x, y) cells the piece covers when placed."""
+        _, _, masks = ROTATIONS[self.shape][self.rotation]
+        return [(self.x + x, self.y + i)
+                for i, mask in enumerate(masks)
+                for x in range(mask.bit_length()) if mask >> x & 1]
+
+
+class TetrisBot:
+    """Picks placements for a TetrisEngine's falling piece."""
+
+    def __init__(self, weights=None, features=None, time_budget=DEFAULT_TIME_BUDGET, lookahead=True):
+        self.weights = dict(DEFAULT_WEIGHTS if weights is None else weights)
+        self.features = dict(FEATURES if features is None else features)
+        self.time_budget = time_budget
+        self.lookahead = lookahead
+        self.evaluated = 0  # Placements scored so far, for benchmarking
+
+    def evaluate(self, rows, width, lines):
+        """Score a board with the weighted features."""
+        self.evaluated += 1
+        stats = BoardStats(rows, width, lines)
+        return sum(weight * self.features[name](stats) for name, weight in self.weights.items())
+
+    def placements(self, rows, width, shape, start_x, start_y, start_rotation=0):
+        """Yield every placement of a shape reachable from its start position.
+
+        A placement is reachable the way moves() gets there: the piece is
+        rotated clockwise at the start position, one quarter turn at a time,
+        then slid along the start row to its column before dropping.
+        """
+        height = len(rows)
+        full_row = (1 << width) - 1
+
+        def fits(masks, piece_width, x):
+            if x < 0 or x + piece_width > width or start_y + len(masks) > height:
+                return False
+            return not any(rows[start_y + i] & (mask << x) for i, mask in enumerate(masks))
+
+        seen = set()
+        for turns in range(4):
+            rotation = (start_rotation + turns) % 4
+            _, piece_width, masks = ROTATIONS[shape][rotation]
+            if not fits(masks, piece_width, start_x):
+                break  # The engine can't turn the piece any further here
+            if masks in seen:
+                continue
+            seen.add(masks)
+
+            # Slide outwards from the start column until something blocks the way
+            columns = [start_x]
+            for step in (-1, 1):
+                x = start_x + step
+                while fits(masks, piece_width, x):
+                    columns.append(x)
+                    x += step
+
+            for x in columns:
+                shifted = [mask << x for mask in masks]
+
+                # Drop the piece
+                y = start_y
+                while y + len(shifted) < height and not any(
+                        rows[y + 1 + i] & mask for i, mask in enumerate(shifted)):
+                    y += 1
+
+                after = rows[:]
+                for i, mask in enumerate(shifted):
+                    after[y + i] |= mask
+
+                # Clear full lines
+                kept = [row for row in after if row != full_row]
+                lines = height - len(kept)
+                if lines:
+                    after = [0] * lines + kept
+
+                yield Placement(shape, rotation, x, y, self.evaluate(after, width, lines), after)
+
+    def best_placement(self, engine):
+        """Return the best Placement for the engine's falling piece, or None if there is none."""
+        deadline = time.perf_counter() + self.time_budget
+        width = engine.width
+
+        first = sorted(self.placements(engine.rows, width, engine.shape, engine.x, engine.y, engine.rotation),
+                       key=lambda placement: placement.score, reverse=True)
+        if not first:
+            return None
+        if not self.lookahead:
+            return first[0]
+
+        # Look one piece ahead, most promising placements first, while time allows
+        spawn_x = width // 2 - ROTATIONS[engine.next_shape][0][1] // 2
+        best = None
+        best_score = None
+        for placement in first:
+            if best is not None and time.perf_counter() > deadline:
+                break
+            follow = [p.score for p in self.placements(placement.rows, width, engine.next_shape, spawn_x, 0)]
+            # No room for the next piece means the game would end
+            score = max(follow) if follow else float("-inf")
+            if best_score is None or score > best_score:
+                best = placement
+                best_score = score
+        return best
+
+    def moves(self, engine, placement):
+        """Return the actions that take the falling piece to a placement, ending with "drop"."""
+        actions = ["rotate"] * ((placement.rotation - engine.rotation) % 4)
+        dx = placement.x - engine.x
+        actions += ["right" if dx > 0 else "left"] * abs(dx)
+        actions.append("drop")
+        return actions
+
+    def play(self, engine):
+        """Place the falling piece where the bot likes it best; returns the lines cleared."""
+        placement = self.best_placement(engine)
+        if placement is None:
+            return engine.step("drop")
+
+        lines = 0
+        for action in self.moves(engine, placement):
+            lines += engine.step(action)
+        return lines
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the headless Tetris engine.
+
+Run from the repository root:
+    python -m games.tetris.benchmark [--moves N] [--seed S]
+    python -m games.tetris.benchmark --bot [--pieces N] [--budget MS] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from games.tetris.ai import TetrisBot
+from games.tetris.engine import ACTIONS, TetrisEngine
+
+# Random play that soft-drops more than it hard-drops, so pieces travel the board
+ACTION_WEIGHTS = [3, 3, 2, 6, 1]
+
+
+def benchmark_steps(moves, seed):
+    """Play random moves, restarting after each game over.
+
+    Returns the elapsed time, games played, pieces locked and lines cleared.
+    """
+    rng = random.Random(seed)
+    actions = rng.choices(ACTIONS, weights=ACTION_WEIGHTS, k=moves)
+    engine = TetrisEngine(seed=seed)
+    engine.new_piece()
+    games = 1
+    pieces = 0
+    lines = 0
+
+    start = time.perf_counter()
+    for action in actions:
+        engine.step(action)
+        if engine.game_over:
+            pieces += engine.pieces
+            lines += engine.lines_cleared
+            engine.reset()
+            engine.new_piece()
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    return elapsed, games, pieces + engine.pieces, lines + engine.lines_cleared
+
+
+def benchmark_bot(pieces, budget, seed):
+    """Let the bot play until it has placed a number of pieces, restarting after each game over.
+
+    Returns the bot, elapsed time, slowest move, games played and lines cleared.
+    """
+    bot = TetrisBot(time_budget=budget)
+    engine = TetrisEngine(seed=seed)
+    engine.new_piece()
+    games = 1
+    placed = 0
+    lines = 0
+    slowest = 0.0
+
+    start = time.perf_counter()
+    while placed < pieces:
+        move_start = time.perf_counter()
+        lines += bot.play(engine)
+        slowest = max(slowest, time.perf_counter() - move_start)
+        placed += 1
+        if engine.game_over:
+            engine.reset()
+            engine.new_piece()
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    return bot, elapsed, slowest, games, lines
+
+
+def main():
+    """Run the benchmark and print the move or placement rate."""
+    parser = argparse.ArgumentParser(description="Benchmark the headless Tetris engine")
+    parser.add_argument("--moves", "-n", type=int, default=1000000, help="Random moves to play")
+    parser.add_argument("--bot", action="store_true", help="Benchmark the placement-search bot instead")
+    parser.add_argument("--pieces", type=int, default=500, help="Pieces for the bot to place")
+    parser.add_argument("--budget", type=float, default=50, help="Bot thinking time per move in milliseconds")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs")
+    args = parser.parse_args()
+
+    if args.bot:
+        bot, elapsed, slowest, games, lines = benchmark_bot(args.pieces, args.budget / 1000, args.seed)
+        print(f"{args.pieces} pieces in {elapsed:.2f}s: {bot.evaluated / elapsed:,.0f} placements evaluated/s")
+        print(f"{elapsed / args.pieces * 1000:.1f} ms per move on average, slowest {slowest * 1000:.1f} ms")
+        print(f"{games} games, {lines} lines cleared")
+        return
+
+    elapsed, games, pieces, lines = benchmark_steps(args.moves, args.seed)
+    print(f"{args.moves} moves in {elapsed:.2f}s: {args.moves / elapsed:,.0f} moves/s, "
+          f"{args.moves / elapsed * 60 / 1e6:.1f} million moves/minute")
+    print(f"{games} games, {pieces} pieces locked, {lines} lines cleared")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Headless Tetris engine shared by the terminal and GUI games.
+
+The board is a bitboard: one int per row, with bit x set when column x is
+filled. Collision checks and full-line tests are then a few bit operations
+per piece row. The engine has no display code. The games draw its state, and
+the AI and the benchmark drive it directly through step(). Seeding the engine
+makes the piece sequence, and so a whole game, reproducible.
+"""
+
+import random
+
+# Tetromino shapes in their spawn orientation
+SHAPES = {
+    'I': [
+        [1, 1, 1, 1]
+    ],
+    'J': [
+        [1, 0, 0],
+        [1, 1, 1]
+    ],
+    'L': [
+        [0, 0, 1],
+        [1, 1, 1]
+    ],
+    'O': [
+        [1, 1],
+        [1, 1]
+    ],
+    'S': [
+        [0, 1, 1],
+        [1, 1, 0]
+    ],
+    'T': [
+        [0, 1, 0],
+        [1, 1, 1]
+    ],
+    'Z': [
+        [1, 1, 0],
+        [0, 1, 1]
+    ]
+}
+
+SHAPE_NAMES = sorted(SHAPES)
+
+# Points per number of lines cleared at once, multiplied by the level
+LINE_SCORES = {1: 100, 2: 300, 3: 500, 4: 800}
+LINES_PER_LEVEL = 10
+
+ACTIONS = ("left", "right", "rotate", "down", "drop")
+
+
+def rotate_clockwise(matrix):
+    """Return a piece matrix rotated a quarter turn clockwise."""
+    rows = len(matrix)
+    cols = len(matrix[0])
+    return [[matrix[rows - 1 - r][c] for r in range(rows)] for c in range(cols)]
+
+
+def build_rotations(matrix):
+    """Return the four clockwise orientations of a piece.
+
+    Each orientation is (matrix, width, row masks), where row mask i has bit x
+    set for every filled cell in row i of the matrix.
+    """
+    rotations = []
+    for _ in range(4):
+        masks = tuple(sum(1 << x for x, cell in enumerate(row) if cell) for row in matrix)
+        rotations.append((matrix, len(matrix[0]), masks))
+        matrix = rotate_clockwise(matrix)
+    return rotations
+
+
+ROTATIONS = {shape: build_rotations(matrix) for shape, matrix in SHAPES.items()}
+
+
+class TetrisEngine:
+    """Board, falling piece, scoring and piece sequence of one Tetris game."""
+
+    def __init__(self, width=10, height=20, seed=None, level=1):
+        """Create an empty game; new_piece() brings in the first piece."""
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.rng = random.Random(seed)
+        self.reset(level)
+
+    def reset(self, level=1):
+        """Empty the board and start scoring again from a level."""
+        self.rows = [0] * self.height
+        # Which shape filled each locked cell, for drawing
+        self.cells = [[0] * self.width for _ in range(self.height)]
+        self.score = 0
+        self.level = level
+        self.lines_cleared = 0
+        self.pieces = 0
+        self.game_over = False
+
+        self.shape = None
+        self.rotation = 0
+        self.x = 0
+        self.y = 0
+        self.next_shape = self.random_shape()
+
+        # Rows whose cells changed since the view last drew them
+        self.dirty_rows = set(range(self.height))
+
+    def random_shape(self):
+        """Draw the next shape from the engine's own random generator."""
+        return self.rng.choice(SHAPE_NAMES)
+
+    @property
+    def piece(self):
+        """The falling piece's matrix in its current orientation, or None."""
+        if self.shape is None:
+            return None
+        return ROTATIONS[self.shape][self.rotation][0]
+
+    def fits(self, rotation, x, y):
+        """Check if the falling piece fits on the board in an orientation and position."""
+        _, width, masks = ROTATIONS[self.shape][rotation]
+        if x < 0 or x + width > self.width or y < 0 or y + len(masks) > self.height:
+            return False
+
+        rows = self.rows
+        for i, mask in enumerate(masks):
+            if rows[y + i] & (mask << x):
+                return False
+        return True
+
+    def new_piece(self):
+        """Bring in the next piece at the top; returns False and ends the game if it doesn't fit."""
+        self.shape = self.next_shape
+        self.next_shape = self.random_shape()
+        self.rotation = 0
+
+        # Start position (centered at top)
+        self.x = self.width // 2 - ROTATIONS[self.shape][0][1] // 2
+        self.y = 0
+
+        if not self.fits(self.rotation, self.x, self.y):
+            self.game_over = True
+            return False
+        return True
+
+    def move_left(self):
+        """Move the falling piece one column left if it fits."""
+        if self.fits(self.rotation, self.x - 1, self.y):
+            self.x -= 1
+            return True
+        return False
+
+    def move_right(self):
+        """Move the falling piece one column right if it fits."""
+        if self.fits(self.rotation, self.x + 1, self.y):
+            self.x += 1
+            return True
+        return False
+
+    def rotate(self):
+        """Rotate the falling piece clockwise if it fits."""
+        rotation = (self.rotation + 1) % 4
+        if self.fits(rotation, self.x, self.y):
+            self.rotation = rotation
+            return True
+        return False
+
+    def move_down(self):
+        """Move the falling piece down a row, or lock it if it has landed.
+
+        Returns True if the piece moved.
+        """
+        if self.fits(self.rotation, self.x, self.y + 1):
+            self.y += 1
+            return True
+        self.lock_piece()
+        return False
+
+    def drop_position(self):
+        """Return the row the falling piece would land on."""
+        y = self.y
+        while self.fits(self.rotation, self.x, y + 1):
+            y += 1
+        return y
+
+    def drop(self):
+        """Drop the falling piece straight down and lock it."""
+        self.y = self.drop_position()
+        self.lock_piece()
+
+    def piece_cells(self, top=None):
+        """Return the (x, y) cells covered by the falling piece, with its top row at top."""
+        if self.shape is None:
+            return []
+        if top is None:
+            top = self.y
+        _, _, masks = ROTATIONS[self.shape][self.rotation]
+        return [(self.x + x, top + i)
+                for i, mask in enumerate(masks)
+                for x in range(mask.bit_length()) if mask >> x & 1]
+
+    def lock_piece(self):
+        """Fix the falling piece to the board, clear lines and bring in the next piece.
+
+        Returns the number of lines cleared.
+        """
+        _, _, masks = ROTATIONS[self.shape][self.rotation]
+        for i, mask in enumerate(masks):
+            row = self.y + i
+            self.rows[row] |= mask << self.x
+            cells = self.cells[row]
+            for x in range(mask.bit_length()):
+                if mask >> x & 1:
+                    cells[self.x + x] = self.shape
+            self.dirty_rows.add(row)
+        self.pieces += 1
+
+        lines = self.clear_lines(self.y, self.y + len(masks))
+        self.new_piece()
+        return lines
+
+    def clear_lines(self, start, end):
+        """Remove full rows between start and end (exclusive) and score them."""
+        full = [row for row in range(start, end) if self.rows[row] == self.full_row]
+        if not full:
+            return 0
+
+        # Going top to bottom, removing a row and adding one on top leaves the rows below in place
+        for row in full:
+            del self.rows[row]
+            self.rows.insert(0, 0)
+            del self.cells[row]
+            self.cells.insert(0, [0] * self.width)
+
+        # Every row above the lowest cleared line has shifted down
+        self.dirty_rows.update(range(full[-1] + 1))
+
+        self.lines_cleared += len(full)
+        self.score += LINE_SCORES.get(len(full), 100) * self.level
+        self.level = max(self.level, self.lines_cleared // LINES_PER_LEVEL + 1)
+        return len(full)
+
+    def step(self, action):
+        """Apply one of ACTIONS to the falling piece and return the lines it cleared."""
+        if self.game_over:
+            return 0
+
+        lines_before = self.lines_cleared
+        if action == "left":
+            self.move_left()
+        elif action == "right":
+            self.move_right()
+        elif action == "rotate":
+            self.rotate()
+        elif action == "down":
+            self.move_down()
+        elif action == "drop":
+            self.drop()
+        else:
+            raise ValueError(f"Unknown action: {action}")
+        return self.lines_cleared - lines_before
+
+    def pop_dirty_rows(self):
+        """Return the rows changed since the last call and forget them."""
+        dirty = self.dirty_rows
+        self.dirty_rows = set()
+        return dirty
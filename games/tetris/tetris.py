@@ -2,10 +2,10 @@
 import os
 import sys
 import time
-import random
 import colorama
 from colorama import Fore, Back, Style
-import threading
+from games import terminal
+from games.tetris.engine import SHAPES, TetrisEngine
 
 # Platform-specific imports
 if os.name == 'nt':
@@ -20,7 +20,7 @@ colorama.init(autoreset=True)
 
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    terminal.clear_screen()
 
 def print_header():
     """Print the game header."""
@@ -50,37 +50,7 @@ def get_key():
         finally:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
 
-# Define tetromino shapes and colors
-SHAPES = {
-    'I': [
-        [1, 1, 1, 1]
-    ],
-    'J': [
-        [1, 0, 0],
-        [1, 1, 1]
-    ],
-    'L': [
-        [0, 0, 1],
-        [1, 1, 1]
-    ],
-    'O': [
-        [1, 1],
-        [1, 1]
-    ],
-    'S': [
-        [0, 1, 1],
-        [1, 1, 0]
-    ],
-    'T': [
-        [0, 1, 0],
-        [1, 1, 1]
-    ],
-    'Z': [
-        [1, 1, 0],
-        [0, 1, 1]
-    ]
-}
-
+# Define tetromino colors
 COLORS = {
     'I': Fore.CYAN,
     'J': Fore.BLUE,
@@ -91,182 +61,33 @@ COLORS = {
     'Z': Fore.RED
 }
 
-class Tetris:
+class Tetris(TetrisEngine):
+    """Terminal Tetris: the shared engine plus a text renderer."""
     def __init__(self, width=10, height=20):
         """Initialize the Tetris game."""
-        self.width = width
-        self.height = height
-        self.board = [[0 for _ in range(width)] for _ in range(height)]
-        self.current_piece = None
-        self.current_shape = None
-        self.current_x = 0
-        self.current_y = 0
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.game_over = False
+        super().__init__(width, height)
         self.paused = False
-        self.next_piece = self.get_random_shape()
-    
-    def get_random_shape(self):
-        """Get a random tetromino shape."""
-        return random.choice(list(SHAPES.keys()))
-    
-    def new_piece(self):
-        """Create a new tetromino piece."""
-        self.current_shape = self.next_piece
-        self.next_piece = self.get_random_shape()
-        self.current_piece = SHAPES[self.current_shape]
-        
-        # Start position (centered at top)
-        self.current_x = self.width // 2 - len(self.current_piece[0]) // 2
-        self.current_y = 0
-        
-        # Check if the new piece can be placed
-        if not self.is_valid_position():
-            self.game_over = True
-    
-    def rotate_piece(self):
-        """Rotate the current piece clockwise."""
-        # Save the original piece to restore if rotation is not valid
-        original_piece = self.current_piece
-        
-        # Get dimensions
-        rows = len(self.current_piece)
-        cols = len(self.current_piece[0])
-        
-        # Create a new rotated piece
-        rotated = [[0 for _ in range(rows)] for _ in range(cols)]
-        
-        # Fill the rotated piece
-        for r in range(rows):
-            for c in range(cols):
-                rotated[c][rows - 1 - r] = self.current_piece[r][c]
-        
-        # Apply rotation if valid
-        self.current_piece = rotated
-        if not self.is_valid_position():
-            self.current_piece = original_piece
-    
-    def is_valid_position(self, x_offset=0, y_offset=0):
-        """Check if the current piece can be at the current position with offsets."""
-        for y, row in enumerate(self.current_piece):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = self.current_x + x + x_offset
-                    board_y = self.current_y + y + y_offset
-                    
-                    # Check if out of bounds
-                    if (board_x < 0 or board_x >= self.width or 
-                        board_y < 0 or board_y >= self.height):
-                        return False
-                    
-                    # Check if collides with locked piece
-                    if board_y >= 0 and self.board[board_y][board_x]:
-                        return False
-        
-        return True
-    
-    def merge_piece(self):
-        """Merge the current piece into the board."""
-        for y, row in enumerate(self.current_piece):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_y = self.current_y + y
-                    board_x = self.current_x + x
-                    if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                        self.board[board_y][board_x] = self.current_shape
-    
-    def clear_lines(self):
-        """Clear completed lines and return the number of lines cleared."""
-        lines_to_clear = []
-        
-        # Find lines to clear
-        for y in range(self.height):
-            if all(self.board[y]):
-                lines_to_clear.append(y)
-        
-        # Clear the lines
-        for y in lines_to_clear:
-            # Remove the line
-            self.board.pop(y)
-            # Add a new empty line at the top
-            self.board.insert(0, [0 for _ in range(self.width)])
-        
-        # Update score and level
-        if lines_to_clear:
-            self.lines_cleared += len(lines_to_clear)
-            # Calculate score: more lines = more points per line
-            line_score = {1: 100, 2: 300, 3: 500, 4: 800}
-            self.score += line_score.get(len(lines_to_clear), 100) * self.level
-            
-            # Update level (every 10 lines)
-            self.level = (self.lines_cleared // 10) + 1
-        
-        return len(lines_to_clear)
-    
-    def move_left(self):
-        """Move the current piece left if possible."""
-        if self.is_valid_position(x_offset=-1):
-            self.current_x -= 1
-    
-    def move_right(self):
-        """Move the current piece right if possible."""
-        if self.is_valid_position(x_offset=1):
-            self.current_x += 1
-    
-    def move_down(self):
-        """Move the current piece down if possible, else lock it."""
-        if self.is_valid_position(y_offset=1):
-            self.current_y += 1
-            return True
-        else:
-            self.merge_piece()
-            self.clear_lines()
-            self.new_piece()
-            return False
-    
-    def drop(self):
-        """Drop the piece to the bottom instantly."""
-        while self.move_down():
-            pass
     
     def draw(self, show_ghost=True):
         """Draw the game board."""
         # Create a copy of the board for drawing
-        board_copy = [row[:] for row in self.board]
+        board_copy = [row[:] for row in self.cells]
         
         # Add ghost piece (preview of where the piece will land)
-        if show_ghost and self.current_piece:
-            ghost_y = self.current_y
-            # Find the lowest valid position
-            while self.is_valid_position(y_offset=ghost_y - self.current_y + 1):
-                ghost_y += 1
-            
-            # Add ghost piece to the board copy
-            for y, row in enumerate(self.current_piece):
-                for x, cell in enumerate(row):
-                    if cell:
-                        board_y = ghost_y + y
-                        board_x = self.current_x + x
-                        if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                            if not board_copy[board_y][board_x]:  # Only if the cell is empty
-                                board_copy[board_y][board_x] = 'ghost'
+        if show_ghost and self.shape and not self.game_over:
+            for x, y in self.piece_cells(self.drop_position()):
+                if not board_copy[y][x]:  # Only if the cell is empty
+                    board_copy[y][x] = 'ghost'
         
         # Add current piece to the board copy
-        if self.current_piece:
-            for y, row in enumerate(self.current_piece):
-                for x, cell in enumerate(row):
-                    if cell:
-                        board_y = self.current_y + y
-                        board_x = self.current_x + x
-                        if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                            board_copy[board_y][board_x] = self.current_shape
+        if self.shape and not self.game_over:
+            for x, y in self.piece_cells():
+                board_copy[y][x] = self.shape
         
         # Draw the next piece preview
         print(f"{Fore.CYAN}Next Piece:{Style.RESET_ALL}")
-        next_shape = SHAPES[self.next_piece]
-        next_color = COLORS[self.next_piece]
+        next_shape = SHAPES[self.next_shape]
+        next_color = COLORS[self.next_shape]
         for row in next_shape:
             print("  ", end="")
             for cell in row:
@@ -377,7 +198,7 @@ def main():
         
         # Initialize game
         game = Tetris()
-        game.level = starting_level
+        game.reset(starting_level)
         game.new_piece()
         
         last_drop_time = time.time()
@@ -404,7 +225,7 @@ def main():
                         elif key == 's' or key == '\x1b[B':  # Down arrow
                             game.move_down()
                         elif key == 'w' or key == '\x1b[A':  # Up arrow
-                            game.rotate_piece()
+                            game.rotate()
                         elif key == ' ':  # Space
                             game.drop()
                             last_drop_time = time.time()  # Reset drop timer after hard drop
@@ -6,37 +6,13 @@ import time
 import sys
 import os
 
-# Define tetromino shapes and colors
-SHAPES = {
-    'I': [
-        [1, 1, 1, 1]
-    ],
-    'J': [
-        [1, 0, 0],
-        [1, 1, 1]
-    ],
-    'L': [
-        [0, 0, 1],
-        [1, 1, 1]
-    ],
-    'O': [
-        [1, 1],
-        [1, 1]
-    ],
-    'S': [
-        [0, 1, 1],
-        [1, 1, 0]
-    ],
-    'T': [
-        [0, 1, 0],
-        [1, 1, 1]
-    ],
-    'Z': [
-        [1, 1, 0],
-        [0, 1, 1]
-    ]
-}
+from games.tetris.engine import SHAPES, TetrisEngine
+from games.tetris.ai import TetrisBot
+
+# Milliseconds between the moves the bot makes while autoplaying
+AUTOPLAY_DELAY = 60
 
+# Define tetromino colors
 COLORS = {
     'I': "#00FFFF",  # Cyan
     'J': "#0000FF",  # Blue
@@ -62,22 +38,20 @@ class TetrisGUI:
         self.canvas_width = self.width * self.cell_size
         self.canvas_height = self.height * self.cell_size
         
-        # Game state
-        self.board = None
-        self.current_piece = None
-        self.current_shape = None
-        self.current_x = 0
-        self.current_y = 0
-        self.next_piece = None
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
+        # Game state; the board, pieces and scoring live in the engine
+        self.engine = TetrisEngine(self.width, self.height)
+        self.level = 1  # Starting level for the selected difficulty
         self.game_active = False
         self.paused = False
         self.game_over = False
         self.fall_speed = 1000  # milliseconds
         self.drop_callback_id = None
         
+        # Hint and autoplay
+        self.bot = TetrisBot()
+        self.autoplay = False
+        self.autoplay_target = None  # Placement the bot is steering the current piece to
+        
         # Create widgets
         self.create_widgets()
         
@@ -215,6 +189,7 @@ class TetrisGUI:
         
         # Draw grid on canvas
         self.draw_grid()
+        self.create_cell_items()
         
         # Difficulty selection frame
         self.difficulty_frame = tk.Frame(self.main_frame, bg="#333333")
@@ -302,6 +277,30 @@ class TetrisGUI:
         )
         self.pause_button.pack(side=tk.LEFT, padx=10)
         
+        # Hint button
+        self.hint_button = tk.Button(
+            self.control_frame,
+            text="Hint",
+            font=("Helvetica", 12),
+            bg="#FF9800",
+            fg="white",
+            command=self.show_hint,
+            state=tk.DISABLED
+        )
+        self.hint_button.pack(side=tk.LEFT, padx=10)
+        
+        # Autoplay button
+        self.autoplay_button = tk.Button(
+            self.control_frame,
+            text="Autoplay",
+            font=("Helvetica", 12),
+            bg="#9C27B0",
+            fg="white",
+            command=self.toggle_autoplay,
+            state=tk.DISABLED
+        )
+        self.autoplay_button.pack(side=tk.LEFT, padx=10)
+        
         # Quit button
         self.quit_button = tk.Button(
             self.control_frame,
@@ -322,6 +321,10 @@ class TetrisGUI:
         self.root.bind("<space>", lambda e: self.drop_piece())
         self.root.bind("<p>", lambda e: self.toggle_pause())
         self.root.bind("<P>", lambda e: self.toggle_pause())
+        self.root.bind("<h>", lambda e: self.show_hint())
+        self.root.bind("<H>", lambda e: self.show_hint())
+        self.root.bind("<a>", lambda e: self.toggle_autoplay())
+        self.root.bind("<A>", lambda e: self.toggle_autoplay())
     
     def draw_grid(self):
         """Draw the grid on the canvas."""
@@ -333,6 +336,48 @@ class TetrisGUI:
             y = i * self.cell_size
             self.canvas.create_line(0, y, self.canvas_width, y, fill="#444444")
     
+    def create_cell_items(self):
+        """Create the canvas items reused for every frame.
+
+        Each board cell gets one rectangle that is recoloured or hidden as its
+        contents change, and the ghost and active pieces get four rectangles
+        each that are moved with coords.
+        """
+        self.cell_items = []
+        for y in range(self.height):
+            row = []
+            for x in range(self.width):
+                row.append(self.canvas.create_rectangle(
+                    x * self.cell_size,
+                    y * self.cell_size,
+                    (x + 1) * self.cell_size,
+                    (y + 1) * self.cell_size,
+                    outline="#FFFFFF",
+                    state=tk.HIDDEN
+                ))
+            self.cell_items.append(row)
+        
+        # What each cell item currently shows
+        self.cell_shapes = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        
+        self.ghost_items = [
+            self.canvas.create_rectangle(0, 0, 0, 0, fill="#AAAAAA", outline="#FFFFFF",
+                                         stipple="gray50", state=tk.HIDDEN)
+            for _ in range(4)
+        ]
+        self.piece_items = [
+            self.canvas.create_rectangle(0, 0, 0, 0, outline="#FFFFFF", state=tk.HIDDEN)
+            for _ in range(4)
+        ]
+        self.hint_items = [
+            self.canvas.create_rectangle(0, 0, 0, 0, outline="#FFD700", width=3, state=tk.HIDDEN)
+            for _ in range(4)
+        ]
+        self.ghost_cells = []
+        self.piece_cells = []
+        self.hint_cells = []
+        self.piece_color = None
+    
     def show_welcome(self):
         """Show welcome screen and instructions."""
         welcome_window = tk.Toplevel(self.root)
@@ -367,6 +412,8 @@ class TetrisGUI:
             "• Up Arrow: Rotate the tetromino clockwise",
             "• Space: Drop the tetromino instantly",
             "• P: Pause/Resume the game",
+            "• H: Show where the bot would place the piece",
+            "• A: Let the bot play",
             "",
             "Scoring:",
             "• 1 line: 100 points × level",
@@ -437,6 +484,8 @@ class TetrisGUI:
         
         # Update UI elements
         self.pause_button.config(state=tk.NORMAL, text="Pause")
+        self.hint_button.config(state=tk.NORMAL)
+        self.autoplay_button.config(state=tk.NORMAL)
         self.start_button.config(text="Restart Game")
         self.easy_radio.config(state=tk.DISABLED)
         self.medium_radio.config(state=tk.DISABLED)
@@ -456,71 +505,64 @@ class TetrisGUI:
             self.root.after_cancel(self.drop_callback_id)
             self.drop_callback_id = None
         
-        # Reset scores
-        self.score = 0
-        self.lines_cleared = 0
+        # Reset board and scores
+        self.engine.reset(self.level)
         self.score_var.set("0")
         self.lines_var.set("0")
         
-        # Reset board
-        self.board = [[0 for _ in range(self.width)] for _ in range(self.height)]
-        self.current_piece = None
-        self.current_shape = None
-        self.next_piece = self.get_random_shape()
-        
         # Reset game state
         self.game_active = False
         self.paused = False
         self.game_over = False
+        self.autoplay = False
+        self.autoplay_target = None
+        self.autoplay_button.config(text="Autoplay")
+        self.hint_cells = self.place_piece_items(self.hint_items, self.hint_cells, [])
         
         # Clear canvas
-        self.canvas.delete("block")
+        self.draw_board()
         self.next_piece_canvas.delete("block")
         
         # Draw next piece
         self.draw_next_piece()
     
-    def get_random_shape(self):
-        """Get a random tetromino shape."""
-        return random.choice(list(SHAPES.keys()))
-    
     def new_piece(self):
-        """Create a new tetromino piece."""
-        self.current_shape = self.next_piece
-        self.next_piece = self.get_random_shape()
-        self.current_piece = SHAPES[self.current_shape]
-        
-        # Start position (centered at top)
-        self.current_x = self.width // 2 - len(self.current_piece[0]) // 2
-        self.current_y = 0
+        """Bring in the next tetromino piece."""
+        placed = self.engine.new_piece()
         
         # Draw next piece
         self.draw_next_piece()
         
-        # Check if the new piece can be placed
-        if not self.is_valid_position():
-            self.game_over = True
-            self.game_active = False
-            self.status_var.set("Game Over!")
-            messagebox.showinfo("Game Over", f"Game Over! Your final score is {self.score}.")
-            
-            # Enable UI elements
-            self.easy_radio.config(state=tk.NORMAL)
-            self.medium_radio.config(state=tk.NORMAL)
-            self.hard_radio.config(state=tk.NORMAL)
-            self.pause_button.config(state=tk.DISABLED)
-            self.start_button.config(text="Start Game")
-            
+        # Check if the new piece could be placed
+        if not placed:
+            self.end_game()
             return False
         
+        self.draw_board()
         return True
     
+    def end_game(self):
+        """Stop the game once a new piece no longer fits."""
+        self.game_over = True
+        self.game_active = False
+        self.status_var.set("Game Over!")
+        messagebox.showinfo("Game Over", f"Game Over! Your final score is {self.engine.score}.")
+        
+        # Enable UI elements
+        self.easy_radio.config(state=tk.NORMAL)
+        self.medium_radio.config(state=tk.NORMAL)
+        self.hard_radio.config(state=tk.NORMAL)
+        self.pause_button.config(state=tk.DISABLED)
+        self.hint_button.config(state=tk.DISABLED)
+        self.autoplay_button.config(state=tk.DISABLED)
+        self.start_button.config(text="Start Game")
+    
     def draw_next_piece(self):
         """Draw the next piece in the preview area."""
         self.next_piece_canvas.delete("block")
         
-        next_shape = SHAPES[self.next_piece]
-        color = COLORS[self.next_piece]
+        next_shape = SHAPES[self.engine.next_shape]
+        color = COLORS[self.engine.next_shape]
         
         # Center the piece in the preview
         offset_x = (4 - len(next_shape[0])) * self.cell_size // 2
@@ -539,62 +581,22 @@ class TetrisGUI:
                         tags="block"
                     )
     
-    def is_valid_position(self, x_offset=0, y_offset=0):
-        """Check if the current piece can be at the current position with offsets."""
-        for y, row in enumerate(self.current_piece):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = self.current_x + x + x_offset
-                    board_y = self.current_y + y + y_offset
-                    
-                    # Check if out of bounds
-                    if (board_x < 0 or board_x >= self.width or 
-                        board_y < 0 or board_y >= self.height):
-                        return False
-                    
-                    # Check if collides with locked piece
-                    if board_y >= 0 and self.board[board_y][board_x]:
-                        return False
-        
-        return True
-    
     def rotate_piece(self):
         """Rotate the current piece clockwise."""
         if not self.game_active or self.paused or self.game_over:
             return
         
-        # Save the original piece to restore if rotation is not valid
-        original_piece = self.current_piece
-        
-        # Get dimensions
-        rows = len(self.current_piece)
-        cols = len(self.current_piece[0])
-        
-        # Create a new rotated piece
-        rotated = [[0 for _ in range(rows)] for _ in range(cols)]
-        
-        # Fill the rotated piece
-        for r in range(rows):
-            for c in range(cols):
-                rotated[c][rows - 1 - r] = self.current_piece[r][c]
-        
-        # Apply rotation if valid
-        self.current_piece = rotated
-        if not self.is_valid_position():
-            self.current_piece = original_piece
-            return False
-        
-        # Redraw the board
-        self.draw_board()
-        return True
+        if self.engine.rotate():
+            self.draw_board()
+            return True
+        return False
     
     def move_left(self):
         """Move the current piece left if possible."""
         if not self.game_active or self.paused or self.game_over:
             return
         
-        if self.is_valid_position(x_offset=-1):
-            self.current_x -= 1
+        if self.engine.move_left():
             self.draw_board()
             return True
         return False
@@ -604,24 +606,22 @@ class TetrisGUI:
         if not self.game_active or self.paused or self.game_over:
             return
         
-        if self.is_valid_position(x_offset=1):
-            self.current_x += 1
+        if self.engine.move_right():
             self.draw_board()
             return True
         return False
     
     def move_down(self):
-        """Move the current piece down if possible."""
+        """Move the current piece down if possible, otherwise lock it."""
         if not self.game_active or self.paused or self.game_over:
             return False
         
-        if self.is_valid_position(y_offset=1):
-            self.current_y += 1
+        if self.engine.move_down():
             self.draw_board()
             return True
         
-        # If can't move down, lock the piece
-        self.lock_piece()
+        # The piece couldn't move down, so the engine locked it
+        self.piece_locked()
         return False
     
     def drop_piece(self):
@@ -629,69 +629,31 @@ class TetrisGUI:
         if not self.game_active or self.paused or self.game_over:
             return
         
-        while self.move_down():
-            pass
+        self.engine.drop()
+        self.piece_locked()
     
-    def lock_piece(self):
-        """Lock the current piece into the board."""
-        for y, row in enumerate(self.current_piece):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_y = self.current_y + y
-                    board_x = self.current_x + x
-                    if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                        self.board[board_y][board_x] = self.current_shape
+    def piece_locked(self):
+        """Update the display after the engine locked a piece and brought in the next one."""
+        self.hint_cells = self.place_piece_items(self.hint_items, self.hint_cells, [])
+        self.autoplay_target = None
+        self.lines_var.set(str(self.engine.lines_cleared))
+        self.score_var.set(str(self.engine.score))
+        
+        # Increase speed with level (every 10 lines)
+        if self.level_var.get() != str(self.engine.level):
+            self.level_var.set(str(self.engine.level))
+            self.fall_speed = max(100, 1000 - (self.engine.level - 1) * 100)
         
-        # Check for completed lines
-        lines_cleared = self.clear_lines()
+        self.draw_next_piece()
+        self.draw_board()
         
-        # Create a new piece
-        if not self.new_piece():
+        if self.engine.game_over:
+            self.end_game()
             return
         
         # Reschedule the drop
         self.schedule_drop()
     
-    def clear_lines(self):
-        """Clear completed lines and return the number of lines cleared."""
-        lines_to_clear = []
-        
-        # Find lines to clear
-        for y in range(self.height):
-            if all(self.board[y]):
-                lines_to_clear.append(y)
-        
-        # Clear the lines
-        for y in lines_to_clear:
-            # Remove the line
-            self.board.pop(y)
-            # Add a new empty line at the top
-            self.board.insert(0, [0 for _ in range(self.width)])
-        
-        # Update score and level
-        if lines_to_clear:
-            self.lines_cleared += len(lines_to_clear)
-            self.lines_var.set(str(self.lines_cleared))
-            
-            # Calculate score: more lines = more points per line
-            line_score = {1: 100, 2: 300, 3: 500, 4: 800}
-            self.score += line_score.get(len(lines_to_clear), 100) * self.level
-            self.score_var.set(str(self.score))
-            
-            # Update level (every 10 lines)
-            new_level = (self.lines_cleared // 10) + 1
-            if new_level > self.level:
-                self.level = new_level
-                self.level_var.set(str(self.level))
-                
-                # Increase speed with level
-                self.fall_speed = max(100, 1000 - (self.level - 1) * 100)
-        
-        # Redraw the board
-        self.draw_board()
-        
-        return len(lines_to_clear)
-    
     def schedule_drop(self):
         """Schedule the next automatic drop."""
         if self.game_active and not self.paused and not self.game_over:
@@ -699,8 +661,63 @@ class TetrisGUI:
             if self.drop_callback_id:
                 self.root.after_cancel(self.drop_callback_id)
             
-            # Schedule the next drop
-            self.drop_callback_id = self.root.after(self.fall_speed, self.move_down)
+            # Schedule the next drop, or the bot's next move
+            delay = min(self.fall_speed, AUTOPLAY_DELAY) if self.autoplay else self.fall_speed
+            self.drop_callback_id = self.root.after(delay, self.gravity_tick)
+    
+    def gravity_tick(self):
+        """Move the piece down a row, or make the bot's next move, and schedule the next tick."""
+        self.drop_callback_id = None
+        if self.autoplay:
+            self.autoplay_step()
+        else:
+            self.move_down()
+        self.schedule_drop()
+    
+    def show_hint(self):
+        """Outline where the bot would place the current piece."""
+        if not self.game_active or self.paused or self.game_over:
+            return
+        
+        placement = self.bot.best_placement(self.engine)
+        cells = placement.cells() if placement else []
+        self.hint_cells = self.place_piece_items(self.hint_items, self.hint_cells, cells)
+        self.status_var.set("Hint: the outlined spot" if placement else "No placement left")
+    
+    def toggle_autoplay(self):
+        """Let the bot play the game, or take over again."""
+        if not self.game_active or self.game_over:
+            return
+        
+        self.autoplay = not self.autoplay
+        self.autoplay_target = None
+        self.autoplay_button.config(text="Stop Autoplay" if self.autoplay else "Autoplay")
+        self.status_var.set("Autoplay on" if self.autoplay else "Autoplay off")
+        self.schedule_drop()
+    
+    def autoplay_step(self):
+        """Make one move towards the bot's chosen placement for the current piece."""
+        if self.autoplay_target is None:
+            self.autoplay_target = self.bot.best_placement(self.engine)
+        
+        # Work out the next move from where the piece is now, in case the player moved it
+        action = "drop"
+        if self.autoplay_target is not None:
+            action = self.bot.moves(self.engine, self.autoplay_target)[0]
+        
+        if action == "left":
+            moved = self.move_left()
+        elif action == "right":
+            moved = self.move_right()
+        elif action == "rotate":
+            moved = self.rotate_piece()
+        else:
+            moved = True
+            self.drop_piece()
+        
+        # Blocked on the way, settle for dropping where the piece is
+        if not moved:
+            self.drop_piece()
     
     def toggle_pause(self):
         """Toggle the game pause state."""
@@ -725,65 +742,66 @@ class TetrisGUI:
             self.schedule_drop()
     
     def draw_board(self):
-        """Draw the game board on the canvas."""
-        self.canvas.delete("block")
-        
-        # Draw ghost piece (preview of where the piece will land)
-        ghost_y = self.current_y
-        while self.is_valid_position(y_offset=ghost_y - self.current_y + 1):
-            ghost_y += 1
-        
-        # Draw the ghost piece
-        if self.current_piece:
-            for y, row in enumerate(self.current_piece):
-                for x, cell in enumerate(row):
-                    if cell:
-                        board_y = ghost_y + y
-                        board_x = self.current_x + x
-                        if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                            self.canvas.create_rectangle(
-                                board_x * self.cell_size,
-                                board_y * self.cell_size,
-                                (board_x + 1) * self.cell_size,
-                                (board_y + 1) * self.cell_size,
-                                fill="#AAAAAA",
-                                outline="#FFFFFF",
-                                stipple="gray50",
-                                tags="block"
-                            )
-        
-        # Draw the current piece
-        if self.current_piece:
-            for y, row in enumerate(self.current_piece):
-                for x, cell in enumerate(row):
-                    if cell:
-                        board_y = self.current_y + y
-                        board_x = self.current_x + x
-                        if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                            self.canvas.create_rectangle(
-                                board_x * self.cell_size,
-                                board_y * self.cell_size,
-                                (board_x + 1) * self.cell_size,
-                                (board_y + 1) * self.cell_size,
-                                fill=COLORS[self.current_shape],
-                                outline="#FFFFFF",
-                                tags="block"
-                            )
-        
-        # Draw the locked pieces on the board
-        for y in range(self.height):
+        """Bring the board canvas up to date.
+        
+        Only the rows the engine changed since the last draw are looked at, and
+        only cells whose contents changed are recoloured. The ghost and active
+        pieces are moved rather than redrawn.
+        """
+        # Locked pieces
+        for y in self.engine.pop_dirty_rows():
+            row = self.engine.cells[y]
+            shown = self.cell_shapes[y]
             for x in range(self.width):
-                if self.board[y][x]:
-                    shape = self.board[y][x]
-                    self.canvas.create_rectangle(
-                        x * self.cell_size,
-                        y * self.cell_size,
-                        (x + 1) * self.cell_size,
-                        (y + 1) * self.cell_size,
-                        fill=COLORS[shape],
-                        outline="#FFFFFF",
-                        tags="block"
-                    )
+                shape = row[x]
+                if shape != shown[x]:
+                    shown[x] = shape
+                    if shape:
+                        self.canvas.itemconfig(self.cell_items[y][x], fill=COLORS[shape], state=tk.NORMAL)
+                    else:
+                        self.canvas.itemconfig(self.cell_items[y][x], state=tk.HIDDEN)
+        
+        if self.engine.shape is None or self.engine.game_over:
+            self.ghost_cells = self.place_piece_items(self.ghost_items, self.ghost_cells, [])
+            self.piece_cells = self.place_piece_items(self.piece_items, self.piece_cells, [])
+            return
+        
+        # Ghost piece (preview of where the piece will land)
+        ghost_cells = self.engine.piece_cells(self.engine.drop_position())
+        self.ghost_cells = self.place_piece_items(self.ghost_items, self.ghost_cells, ghost_cells)
+        
+        # Current piece
+        color = COLORS[self.engine.shape]
+        if color != self.piece_color:
+            self.piece_color = color
+            for item in self.piece_items:
+                self.canvas.itemconfig(item, fill=color)
+        self.piece_cells = self.place_piece_items(self.piece_items, self.piece_cells, self.engine.piece_cells())
+    
+    def place_piece_items(self, items, shown, cells):
+        """Move a piece's pooled items onto cells, hiding any left over.
+        
+        shown is the list of cells the items were last placed on; nothing is
+        touched when it hasn't changed. Returns the new list.
+        """
+        if cells == shown:
+            return shown
+        
+        for i, item in enumerate(items):
+            if i < len(cells):
+                x, y = cells[i]
+                self.canvas.coords(
+                    item,
+                    x * self.cell_size,
+                    y * self.cell_size,
+                    (x + 1) * self.cell_size,
+                    (y + 1) * self.cell_size
+                )
+                if i >= len(shown):
+                    self.canvas.itemconfig(item, state=tk.NORMAL)
+            elif i < len(shown):
+                self.canvas.itemconfig(item, state=tk.HIDDEN)
+        return cells
     
     def quit_game(self):
         """Quit the game."""
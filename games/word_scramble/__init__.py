@@ -4,6 +4,18 @@ word_scramble game package.
 This package contains the word_scramble game.
 """
 
-# Import the main modules to make them available directly from the package
-from games.word_scramble.word_scramble import main as terminal_main
-from games.word_scramble.word_scramble_gui import main as gui_main
+import importlib
+
+# Modules holding the main functions, imported only when first used so that
+# loading one version of the game does not pull in the other
+_MAIN_MODULES = {
+    "terminal_main": "games.word_scramble.word_scramble",
+    "gui_main": "games.word_scramble.word_scramble_gui",
+}
+
+
+def __getattr__(name):
+    """Import the terminal or GUI main function on first access."""
+    if name in _MAIN_MODULES:
+        return importlib.import_module(_MAIN_MODULES[name]).main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
+import startup_profile
 import os
 import sys
-import json
 import importlib
-import importlib.util
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import subprocess
 
+from games import catalog
+from game_host import GameHost
+
+startup_profile.mark("gui console imports")
+
 class GameConsoleGUI:
     def __init__(self, root):
         self.root = root
@@ -18,6 +22,12 @@ class GameConsoleGUI:
         
         self.games = []
         self.load_games()
+        startup_profile.mark("load catalog")
+        
+        # Warm process that runs terminal games without starting a new interpreter
+        self.game_host = GameHost()
+        self.game_host.start()
+        startup_profile.mark("start game host")
         
         # Create UI elements
         self.create_widgets()
@@ -28,8 +38,8 @@ class GameConsoleGUI:
     def load_games(self):
         """Load the list of games from the catalog file."""
         try:
-            with open('games/catalog.json', 'r') as f:
-                self.games = json.load(f)
+            # The cached index already knows each game's modules, so nothing is imported here
+            self.games = catalog.load_games()
         except FileNotFoundError:
             messagebox.showerror("Error", "Game catalog not found!")
             self.games = []
@@ -185,12 +195,8 @@ class GameConsoleGUI:
             game_name = f"{i+1}. {game['name']}"
             self.games_listbox.insert(tk.END, game_name)
             
-            # Check if GUI version exists
-            try:
-                importlib.util.find_spec(f"games.{game['module']}_gui")
-                # GUI version exists - use default color
-            except (ImportError, ModuleNotFoundError):
-                # GUI version doesn't exist - use red color
+            # GUI version doesn't exist - use red color
+            if not game['gui_available']:
                 self.games_listbox.itemconfig(i, {'fg': 'red'})
         
         # Select the first game by default if available
@@ -226,19 +232,7 @@ class GameConsoleGUI:
         info_text += f"Description: {game['description']}\n\n"
         
         # Check for GUI version availability
-        game_module = game['module']
-        if '.' in game_module:
-            # For modules with subdirectories
-            base_module = game_module.rsplit('.', 1)[0]
-            module_name = game_module.rsplit('.', 1)[1]
-            gui_module_path = f"games.{base_module}.{module_name}_gui"
-        else:
-            # For modules directly in the games directory
-            gui_module_path = f"games.{game_module}_gui"
-            
-        gui_available = importlib.util.find_spec(gui_module_path) is not None
-        
-        if gui_available:
+        if game['gui_available']:
             info_text += "GUI Version: Available\n\n"
         else:
             info_text += "GUI Version: Not available (Terminal version only)\n\n"
@@ -255,20 +249,10 @@ class GameConsoleGUI:
         
         index = self.games_listbox.curselection()[0]
         game = self.games[index]
-        game_module = game['module']
-        
-        # Determine the module path based on whether it's in a subdirectory
-        if '.' in game_module:
-            # For modules with subdirectories
-            base_module = game_module.rsplit('.', 1)[0]
-            module_name = game_module.rsplit('.', 1)[1]
-            gui_module_path = f"games.{base_module}.{module_name}_gui"
-        else:
-            # For modules directly in the games directory
-            gui_module_path = f"games.{game_module}_gui"
+        gui_module_path = game['gui_module']
         
         # Check if GUI version is available
-        gui_available = importlib.util.find_spec(gui_module_path) is not None
+        gui_available = game['gui_available']
         
         # Try to import and run the GUI version of the game
         try:
@@ -276,8 +260,11 @@ class GameConsoleGUI:
             self.root.withdraw()
             
             if gui_available:
-                # Import and run the GUI game
+                # Import and run the GUI game; it is only imported now that it's launched
+                startup_profile.reset()
                 game_module_obj = importlib.import_module(gui_module_path)
+                startup_profile.mark(f"import {gui_module_path}")
+                startup_profile.report(f"Launch {game['name']}")
                 game_module_obj.main()
             else:
                 # GUI version is not available, ask about terminal version
@@ -289,8 +276,14 @@ class GameConsoleGUI:
                     # Temporarily close the tkinter window and run the terminal game
                     self.root.withdraw()
                     
-                    # Create a subprocess to run the game in terminal
-                    subprocess.run([sys.executable, "console.py", "terminal", str(index+1)])
+                    # Run the game in the warm game host, or a subprocess if that fails
+                    success, message = self.run_in_terminal(
+                        [sys.executable, "console.py", "terminal", str(index+1)],
+                        game['terminal_module']
+                    )
+                    if not success:
+                        self.root.deiconify()
+                        messagebox.showerror("Error", message)
             
             # Show the console window again after the game is finished
             self.root.deiconify()
@@ -310,12 +303,8 @@ class GameConsoleGUI:
             game_name = f"{i+1}. {game['name']}"
             self.games_listbox.insert(tk.END, game_name)
             
-            # Check if GUI version exists
-            try:
-                importlib.util.find_spec(f"games.{game['module']}_gui")
-                # GUI version exists - use default color
-            except (ImportError, ModuleNotFoundError):
-                # GUI version doesn't exist - use red color
+            # GUI version doesn't exist - use red color
+            if not game['gui_available']:
                 self.games_listbox.itemconfig(i, {'fg': 'red'})
         
         # Select the first game by default if available
@@ -328,17 +317,45 @@ class GameConsoleGUI:
         if messagebox.askyesno("Switch Mode", "Are you sure you want to switch to Terminal mode?"):
             self.root.destroy()
             # Launch the main console in terminal mode
-            os.system("python console.py terminal")
+            success, message = self.run_in_terminal(
+                [sys.executable, "console.py", "terminal"],
+                "console", "main", "terminal"
+            )
+            if not success:
+                print(message)
+            self.game_host.close()
+    
+    def run_in_terminal(self, fallback_command, module, function="main", *args):
+        """Run module.function(*args) in the warm game host.
+        
+        Falls back to running fallback_command in a new process if the host
+        is not available. Returns (success, message).
+        """
+        try:
+            return self.game_host.run(module, function, *args)
+        except (OSError, EOFError):
+            subprocess.run(fallback_command)
+            return True, "Finished"
     
     def quit_console(self):
         """Quit the game console."""
         if messagebox.askyesno("Quit", "Are you sure you want to quit?"):
+            self.game_host.close()
             self.root.destroy()
 
 def main():
     """Main function to start the GUI console."""
     root = tk.Tk()
+    startup_profile.mark("create window")
     app = GameConsoleGUI(root)
+    startup_profile.mark("build console")
+    
+    if startup_profile.enabled:
+        # Draw the window once so the first paint is part of the profile
+        root.update()
+        startup_profile.mark("first paint")
+        startup_profile.report(budget_ms=startup_profile.BUDGET_MS)
+    
     root.mainloop()
 
 if __name__ == "__main__":
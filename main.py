@@ -7,11 +7,14 @@ It will first ask the user which interface they prefer (terminal or GUI),
 then launch the appropriate console.
 """
 
+import startup_profile
 import os
 import sys
 import subprocess
 import argparse
 
+startup_profile.mark("main imports")
+
 def check_gui_availability():
     """Check if the GUI mode is available (tkinter is installed)."""
     try:
@@ -59,14 +62,19 @@ def main():
     parser = argparse.ArgumentParser(description="Python Game Console")
     parser.add_argument("--mode", "-m", choices=["ask", "terminal", "gui"], 
                         default="ask", help="Interface mode: ask, terminal, or gui")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print how long each startup phase takes")
     args = parser.parse_args()
     
     # Determine which mode to use
     mode = args.mode
     
+    startup_profile.mark("parse arguments")
+    
     if mode == "ask":
         # Ask the user which mode they want to use
         mode = ask_user_for_mode()
+        startup_profile.skip()
     
     # Launch the appropriate console
     if mode == "gui":
@@ -82,9 +90,10 @@ def main():
         else:
             print("GUI mode requires tkinter, which is not available.")
             print("Falling back to terminal mode...")
-            # Fall back to terminal mode
-            subprocess.run([sys.executable, "console.py", "terminal"])
-    else:  # terminal mode
+            # Fall back to terminal mode in this process
+            mode = "terminal"
+    
+    if mode == "terminal":
         try:
             # Import console and run it with the terminal mode already set
             # This prevents it from asking for the interface mode again
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Startup profiling for the game console.
+
+Run main.py, console.py or gui_console.py with --profile-startup to print how
+long each phase of starting up (and of launching a game) took. Times are
+measured from the moment this module is first imported, which the entry
+scripts do before anything else.
+"""
+
+import sys
+import time
+
+# Target for a cold start of the console, in milliseconds
+BUDGET_MS = 150
+
+enabled = "--profile-startup" in sys.argv
+
+_start = time.perf_counter()
+_last = _start
+_phases = []
+
+
+def mark(phase):
+    """Record the time spent since the previous mark under a phase name."""
+    global _last
+    if not enabled:
+        return
+    now = time.perf_counter()
+    _phases.append((phase, (now - _last) * 1000))
+    _last = now
+
+
+def skip():
+    """Leave the time since the previous mark out of the profile, e.g. time spent waiting for input."""
+    global _last
+    _last = time.perf_counter()
+
+
+def report(title="Startup", budget_ms=None):
+    """Print the phases recorded since the last report and start a new set."""
+    global _last, _phases
+    if not enabled or not _phases:
+        return
+
+    total = sum(ms for _, ms in _phases)
+    print(f"{title} profile:", file=sys.stderr)
+    for phase, ms in _phases:
+        print(f"  {phase:<32}{ms:>9.1f} ms", file=sys.stderr)
+    print(f"  {'total':<32}{total:>9.1f} ms", file=sys.stderr)
+
+    if budget_ms is not None:
+        status = "within" if total <= budget_ms else "OVER"
+        print(f"  {status} the {budget_ms} ms budget", file=sys.stderr)
+
+    _phases = []
+    _last = time.perf_counter()
+
+
+def reset():
+    """Start timing the next phase from now, dropping unreported phases."""
+    global _last, _phases
+    _phases = []
+    _last = time.perf_counter()